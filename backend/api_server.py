@@ -0,0 +1,404 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Built-in HTTP API
+© 2026 CyberDudeBivash Pvt Ltd
+
+Serves the engine's in-memory incident set so clients fetch only what they
+need instead of the whole threat-feed.json:
+
+    GET /incidents?category=&severity=&since=&limit=
+    GET /widget
+    GET /stats
+    GET /delta?since=<version>
+    GET /iocs?q=<CVE, IP, domain, hash or malware family>&limit=
+    GET /iocs?kind=&limit=      (most-mentioned IOCs)
+    GET /search?q=&category=&severity=&limit=
+    GET /archive?since=&until=&category=&severity=&limit=   (newest first)
+    GET /archive/days?since=&until=
+    GET /metrics
+
+Every publish builds an immutable snapshot with per-category, per-severity
+and per-IOC indexes. /search ranks with the engine's incremental BM25 index
+(search.SearchIndex), restricted to the incidents of the snapshot. Responses are rendered once per distinct query and
+encoding, carry a strong ETag, and unchanged polls are answered with 304.
+Brotli is used when the optional `brotli` package is installed.
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+from changelog import compute_delta
+from incident_store import incident_epoch
+from ioc import IOCExtractor
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+RESPONSE_CACHE_SIZE = 256
+MAX_AGE = 60
+
+# Most incidents one /archive response returns
+ARCHIVE_LIMIT = 1000
+
+# Normalises /iocs queries the way the engine normalised the indexed values
+_ioc_keys = IOCExtractor()
+
+
+def parse_since(value: str) -> Optional[float]:
+    """`since` as epoch seconds or an ISO 8601 timestamp"""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class FeedSnapshot:
+    """Immutable, indexed view of one published incident set"""
+
+    def __init__(self, incidents: List[Dict], widget: Dict, generated: str,
+                 version: int = 0, generations: Optional[List[Dict]] = None, search=None,
+                 rollups: Optional[Dict] = None):
+        self.incidents = incidents
+        self.widget = widget
+        self.generated = generated
+        self.version = version
+        self.generations = generations or []
+        self.epochs = [incident_epoch(i) for i in incidents]
+        # search.SearchIndex shared with the engine; results are limited to
+        # incidents in this snapshot
+        self.search_index = search
+        # stats.WindowStats.summary() of the same window (hourly counts,
+        # per-source volume, trend, spikes), added to /stats
+        self.rollups = rollups
+        self.positions = {i['id']: pos for pos, i in enumerate(incidents) if 'id' in i}
+
+        # Positions per category / severity, in feed (rank) order
+        self.by_category: Dict[str, List[int]] = {}
+        self.by_severity: Dict[str, List[int]] = {}
+        # Folded IOC value -> positions, and -> (kind, value as published)
+        self.by_ioc: Dict[str, List[int]] = {}
+        self.ioc_values: Dict[str, Tuple[str, str]] = {}
+        for pos, incident in enumerate(incidents):
+            self.by_category.setdefault(incident['category'].lower(), []).append(pos)
+            self.by_severity.setdefault(incident['severity'].lower(), []).append(pos)
+            for kind, values in (incident.get('iocs') or {}).items():
+                for value in values:
+                    key = value.lower()
+                    self.by_ioc.setdefault(key, []).append(pos)
+                    self.ioc_values.setdefault(key, (kind, value))
+
+        self._responses: 'OrderedDict[Tuple, Tuple[bytes, str]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def select(self, category: Optional[str] = None, severity: Optional[str] = None,
+               since: Optional[float] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Incidents matching every given filter, in rank order"""
+        candidates = None
+        for index, key in ((self.by_category, category), (self.by_severity, severity)):
+            if key is None:
+                continue
+            positions = index.get(key.lower(), [])
+            candidates = positions if candidates is None else sorted(set(candidates) & set(positions))
+        if candidates is None:
+            candidates = range(len(self.incidents))
+
+        selected = []
+        for pos in candidates:
+            if limit is not None and len(selected) >= limit:
+                break
+            if since is not None and self.epochs[pos] < since:
+                continue
+            selected.append(self.incidents[pos])
+        return selected
+
+    def ioc_matches(self, query: str, limit: Optional[int] = None) -> Tuple[Optional[Tuple[str, str]], List[Dict]]:
+        """(kind, value) the query names and the incidents mentioning it, in rank order"""
+        key = _ioc_keys.lookup_key(query)
+        positions = self.by_ioc.get(key, [])
+        return self.ioc_values.get(key), [self.incidents[p] for p in positions[:limit]]
+
+    def top_iocs(self, kind: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Most-mentioned IOCs, optionally of one kind"""
+        counts = sorted(((len(p), key) for key, p in self.by_ioc.items()
+                         if kind is None or self.ioc_values[key][0] == kind), key=lambda c: (-c[0], c[1]))
+        return [{'kind': self.ioc_values[key][0], 'value': self.ioc_values[key][1], 'count': count}
+                for count, key in counts[:limit]]
+
+    def search(self, query: str, category: Optional[str] = None, severity: Optional[str] = None,
+               limit: Optional[int] = 20) -> List[Tuple[Dict, float]]:
+        """(incident, score) of the best keyword matches, optionally within a category / severity"""
+        if self.search_index is None:
+            return []
+        if category is not None or severity is not None:
+            ids = {i['id'] for i in self.select(category, severity) if 'id' in i}
+        else:
+            ids = self.positions.keys()
+        hits = self.search_index.search(query, limit, ids=ids)
+        return [(self.incidents[self.positions[incident_id]], score) for incident_id, score in hits]
+
+    def delta(self, since: int) -> Dict:
+        return compute_delta(self.generations, self.version, since,
+                             {i['id']: i for i in self.incidents if 'id' in i})
+
+    def stats(self) -> Dict:
+        stats = {
+            'generated': self.generated,
+            'total_incidents': len(self.incidents),
+            'by_severity': {sev.upper(): len(p) for sev, p in self.by_severity.items()},
+            'by_category': {self.incidents[p[0]]['category']: len(p) for p in self.by_category.values()}
+        }
+        if self.rollups:
+            stats.update({key: self.rollups[key] for key in ('sources', 'hourly', 'trend', 'spikes')})
+        return stats
+
+    def response(self, key: Tuple, build, encoding: str = 'identity') -> Tuple[bytes, str]:
+        """Cached (body, strong ETag) for a normalised request key and encoding"""
+        full_key = key + (encoding,)
+        with self._lock:
+            cached = self._responses.get(full_key)
+            if cached is not None:
+                self._responses.move_to_end(full_key)
+                return cached
+
+        if encoding == 'identity':
+            body = json.dumps(build(), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            rendered = (body, '"' + hashlib.sha1(body).hexdigest()[:20] + '"')
+        else:
+            # Each representation gets its own strong validator
+            body, etag = self.response(key, build)
+            if encoding == 'br':
+                rendered = (brotli.compress(body), etag[:-1] + '-br"')
+            else:
+                rendered = (gzip.compress(body, compresslevel=6, mtime=0), etag[:-1] + '-gz"')
+
+        with self._lock:
+            self._responses[full_key] = rendered
+            if len(self._responses) > RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+        return rendered
+
+
+class ThreatIntelAPI:
+    """Holds the current snapshot and runs the HTTP server"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8080):
+        self.snapshot = FeedSnapshot([], {'incidents': []}, datetime.utcnow().isoformat() + 'Z')
+        handler = type('APIHandler', (_APIHandler,), {'api': self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        # metrics.PipelineMetrics served at /metrics, attached by the engine
+        self.metrics = None
+        # archive.IncidentArchive served at /archive, attached by the engine
+        self.archive = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.httpd.server_address[:2]
+
+    def publish(self, incidents: List[Dict], widget: Dict, generated: Optional[str] = None, changelog=None,
+                search=None, stats: Optional[Dict] = None):
+        """Swap in a new snapshot; in-flight requests keep the old one"""
+        self.snapshot = FeedSnapshot(
+            list(incidents), widget, generated or datetime.utcnow().isoformat() + 'Z',
+            version=changelog.version if changelog else 0,
+            generations=list(changelog.generations) if changelog else None,
+            search=search, rollups=stats
+        )
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='cdb-api', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class _APIHandler(BaseHTTPRequestHandler):
+    api: ThreatIntelAPI = None
+    server_version = 'CYBERDUDEBIVASH-ThreatIntel'
+
+    def _encoding(self) -> str:
+        accepted = {e.split(';')[0].strip().lower() for e in self.headers.get('Accept-Encoding', '').split(',')}
+        if brotli is not None and 'br' in accepted:
+            return 'br'
+        if 'gzip' in accepted:
+            return 'gzip'
+        return 'identity'
+
+    def do_GET(self):
+        snapshot = self.api.snapshot
+        parsed = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+
+        if parsed.path == '/incidents':
+            try:
+                limit = int(query['limit']) if 'limit' in query else None
+            except ValueError:
+                return self._error(400, 'limit must be an integer')
+            if limit is not None and limit < 0:
+                return self._error(400, 'limit must not be negative')
+            since = parse_since(query['since']) if 'since' in query else None
+            if 'since' in query and since is None:
+                return self._error(400, 'since must be epoch seconds or ISO 8601')
+            category, severity = query.get('category'), query.get('severity')
+
+            key = ('incidents', (category or '').lower(), (severity or '').lower(), since, limit)
+
+            def build():
+                incidents = snapshot.select(category, severity, since, limit)
+                return {'generated': snapshot.generated, 'count': len(incidents),
+                        'incidents': [i.to_json() for i in incidents]}
+        elif parsed.path == '/widget':
+            key = ('widget',)
+
+            def build():
+                return snapshot.widget
+        elif parsed.path == '/delta':
+            try:
+                since = int(query.get('since', '0'))
+            except ValueError:
+                return self._error(400, 'since must be a feed version')
+            key = ('delta', since)
+
+            def build():
+                return snapshot.delta(since)
+        elif parsed.path == '/iocs':
+            try:
+                limit = int(query['limit']) if 'limit' in query else None
+            except ValueError:
+                return self._error(400, 'limit must be an integer')
+            if limit is not None and limit < 0:
+                return self._error(400, 'limit must not be negative')
+            ioc_query, kind = query.get('q'), query.get('kind')
+            key = ('iocs', ioc_query, (kind or '').lower(), limit)
+
+            if ioc_query:
+                def build():
+                    named, incidents = snapshot.ioc_matches(ioc_query, limit)
+                    return {'generated': snapshot.generated, 'query': ioc_query,
+                            'kind': named[0] if named else None, 'value': named[1] if named else None,
+                            'count': len(incidents), 'incidents': [i.to_json() for i in incidents]}
+            else:
+                def build():
+                    return {'generated': snapshot.generated,
+                            'iocs': snapshot.top_iocs((kind or '').lower() or None, 100 if limit is None else limit)}
+        elif parsed.path == '/search':
+            try:
+                limit = int(query.get('limit', '20'))
+            except ValueError:
+                return self._error(400, 'limit must be an integer')
+            if limit < 0:
+                return self._error(400, 'limit must not be negative')
+            if not query.get('q', '').strip():
+                return self._error(400, 'q is required')
+            if snapshot.search_index is None:
+                return self._error(404, 'search not enabled')
+            text, category, severity = query['q'], query.get('category'), query.get('severity')
+            key = ('search', ' '.join(text.lower().split()), (category or '').lower(), (severity or '').lower(), limit)
+
+            def build():
+                hits = snapshot.search(text, category, severity, limit)
+                return {'generated': snapshot.generated, 'query': text, 'count': len(hits),
+                        'incidents': [dict(i.to_json(), relevance=round(score, 4)) for i, score in hits]}
+        elif parsed.path in ('/archive', '/archive/days'):
+            archive = self.api.archive
+            if archive is None:
+                return self._error(404, 'archive not enabled')
+            bounds = {}
+            for name in ('since', 'until'):
+                if name in query:
+                    bounds[name] = parse_since(query[name])
+                    if bounds[name] is None:
+                        return self._error(400, f'{name} must be epoch seconds or ISO 8601')
+            since, until = bounds.get('since'), bounds.get('until')
+
+            if parsed.path == '/archive/days':
+                key = ('archive-days', since, until)
+
+                def build():
+                    return {'days': archive.daily_counts(since, until), 'totals': archive.counts(since, until)}
+            else:
+                try:
+                    limit = min(int(query.get('limit', '100')), ARCHIVE_LIMIT)
+                except ValueError:
+                    return self._error(400, 'limit must be an integer')
+                if limit < 0:
+                    return self._error(400, 'limit must not be negative')
+                category, severity = query.get('category'), query.get('severity')
+                key = ('archive', since, until, (category or '').lower(), (severity or '').lower(), limit)
+
+                def build():
+                    incidents = list(archive.query(since, until, category, severity, limit, newest_first=True))
+                    return {'count': len(incidents), 'incidents': [i.to_json() for i in incidents]}
+        elif parsed.path == '/stats':
+            key = ('stats',)
+            build = snapshot.stats
+        elif parsed.path == '/metrics':
+            return self._metrics()
+        else:
+            return self._error(404, 'not found')
+
+        encoding = self._encoding()
+        body, etag = snapshot.response(key, build, encoding)
+
+        if etag in {t.strip() for t in self.headers.get('If-None-Match', '').split(',')}:
+            self.send_response(304)
+            self._common_headers(etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self._common_headers(etag)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        if encoding != 'identity':
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _metrics(self):
+        """Prometheus text exposition; live, so never cached"""
+        if self.api.metrics is None:
+            return self._error(404, 'metrics not enabled')
+        body = self.api.metrics.to_prometheus().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Cache-Control', 'no-store')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _common_headers(self, etag: str):
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', f'public, max-age={MAX_AGE}')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Access-Control-Allow-Origin', '*')
+
+    def _error(self, status: int, message: str):
+        body = json.dumps({'error': message}).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
@@ -0,0 +1,263 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Historical archive
+© 2026 CyberDudeBivash Pvt Ltd
+
+The feeds only ever hold the last 24 hours. Every incident is also appended,
+once, to a daily segment of gzip-compressed NDJSON, partitioned by the
+incident's own UTC date:
+
+    archive/2026-10-18.ndjson.gz    one incident per line (gzip members are
+                                    appended each run; readers see one stream)
+    archive/index.json              per segment: count, min / max epoch,
+                                    category and severity counts, bytes
+
+A range query ("ransomware in the last 30 days") first consults the index
+and opens only the segments whose time span overlaps the range and whose
+counts show a match. It then streams those segments line by line. A line
+is decoded only if its raw text contains the requested category or
+severity, so memory stays bounded by one line (one segment when reading
+newest first). Counts over whole days come straight from the index.
+
+Records are the incident as first published, without the fields that drift
+with time (hours_ago, freshness_score).
+"""
+
+import gzip
+import json
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from changelog import VOLATILE_FIELDS, as_json
+from feed_writer import COMPACT, atomic_open
+from models import Incident
+from timestamps import epoch_to_iso
+
+SEGMENT_SUFFIX = '.ndjson.gz'
+INDEX = 'index.json'
+
+DAY = 86400
+
+
+def day_key(epoch: int) -> str:
+    """Segment key of an epoch, e.g. 2026-10-18"""
+    return epoch_to_iso(epoch)[:10]
+
+
+class IncidentArchive:
+    """Append-only, day-partitioned incident history with a segment index"""
+
+    def __init__(self, root: Path, max_days: Optional[int] = None, compresslevel: int = 6):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_days = max_days
+        self.compresslevel = compresslevel
+        self.segments: Dict[str, Dict] = self._load_index()
+
+    # -- index -----------------------------------------------------------
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.root / INDEX, 'r', encoding='utf-8') as f:
+                return json.load(f)['segments']
+        except (OSError, ValueError, KeyError):
+            return self.reindex() if any(self.root.glob('*' + SEGMENT_SUFFIX)) else {}
+
+    def _write_index(self):
+        with atomic_open(self.root / INDEX) as f:
+            json.dump({'version': 1, 'segments': dict(sorted(self.segments.items()))}, f,
+                      separators=COMPACT, ensure_ascii=False)
+
+    def reindex(self) -> Dict[str, Dict]:
+        """Rebuild the index by scanning every segment (after a crash or a manual edit)"""
+        segments = {}
+        for path in sorted(self.root.glob('*' + SEGMENT_SUFFIX)):
+            entry = _new_entry(path.name)
+            for record in _read_segment(path):
+                _count(entry, record)
+            entry['bytes'] = path.stat().st_size
+            segments[path.name[:-len(SEGMENT_SUFFIX)]] = entry
+        self.segments = segments
+        self._write_index()
+        return segments
+
+    # -- writing ---------------------------------------------------------
+
+    def append(self, incidents: Iterable) -> int:
+        """Append incidents to their day segments; returns how many were written"""
+        by_day: Dict[str, List[Dict]] = {}
+        for incident in incidents:
+            record = {k: v for k, v in as_json(incident).items() if k not in VOLATILE_FIELDS}
+            by_day.setdefault(day_key(record['epoch']), []).append(record)
+        if not by_day:
+            return 0
+
+        dumps = json.JSONEncoder(separators=COMPACT, ensure_ascii=False).encode
+        for day, records in by_day.items():
+            path = self.root / (day + SEGMENT_SUFFIX)
+            with gzip.open(path, 'at', encoding='utf-8', compresslevel=self.compresslevel) as f:
+                f.write(''.join(dumps(record) + '\n' for record in records))
+            entry = self.segments.setdefault(day, _new_entry(path.name))
+            for record in records:
+                _count(entry, record)
+            entry['bytes'] = path.stat().st_size
+
+        if self.max_days is not None:
+            self._prune(time.time() - self.max_days * DAY)
+        self._write_index()
+        return sum(len(records) for records in by_day.values())
+
+    def prune(self, before: float) -> List[str]:
+        """Delete segments entirely older than before (epoch seconds)"""
+        removed = self._prune(before)
+        if removed:
+            self._write_index()
+        return removed
+
+    def _prune(self, before: float) -> List[str]:
+        removed = [day for day, entry in self.segments.items() if entry['max_epoch'] < before]
+        for day in removed:
+            (self.root / self.segments.pop(day)['path']).unlink(missing_ok=True)
+        return removed
+
+    # -- queries ---------------------------------------------------------
+
+    def select_segments(self, since: Optional[float] = None, until: Optional[float] = None,
+                        category: Optional[str] = None, severity: Optional[str] = None) -> List[str]:
+        """Days whose segment can hold a match, oldest first (decided from the index alone)"""
+        days = []
+        for day, entry in sorted(self.segments.items()):
+            if since is not None and entry['max_epoch'] < since:
+                continue
+            if until is not None and entry['min_epoch'] > until:
+                continue
+            if category is not None and not _names(entry['categories'], category):
+                continue
+            if severity is not None and not _names(entry['severities'], severity):
+                continue
+            days.append(day)
+        return days
+
+    def query(self, since: Optional[float] = None, until: Optional[float] = None,
+              category: Optional[str] = None, severity: Optional[str] = None,
+              limit: Optional[int] = None, newest_first: bool = False) -> Iterator[Incident]:
+        """Archived incidents in [since, until] matching category / severity (case-insensitive).
+
+        Oldest first, streamed; newest_first holds one day's matches at a time.
+        """
+        days = self.select_segments(since, until, category, severity)
+        if newest_first:
+            days.reverse()
+
+        yielded = 0
+        for day in days:
+            entry = self.segments[day]
+            categories = _names(entry['categories'], category) if category is not None else None
+            severities = _names(entry['severities'], severity) if severity is not None else None
+            needles = [[_needle('category', c) for c in categories] if categories else None,
+                       [_needle('severity', s) for s in severities] if severities else None]
+            needles = [n for n in needles if n]
+
+            matches = _filter(_read_lines(self.root / entry['path']), needles,
+                              since, until, categories, severities)
+            if newest_first:
+                matches = sorted(matches, key=lambda record: record['epoch'], reverse=True)
+            for record in matches:
+                if limit is not None and yielded >= limit:
+                    return
+                yield Incident.from_json(record)
+                yielded += 1
+
+    def daily_counts(self, since: Optional[float] = None, until: Optional[float] = None) -> List[Dict]:
+        """Per-day totals, category and severity counts, read from the index only"""
+        days = []
+        for day in self.select_segments(since, until):
+            entry = self.segments[day]
+            days.append({'day': day, 'count': entry['count'],
+                         'categories': entry['categories'], 'severities': entry['severities']})
+        return days
+
+    def counts(self, since: Optional[float] = None, until: Optional[float] = None) -> Dict:
+        """Exact totals over [since, until]: whole days from the index, boundary days scanned"""
+        total = _new_entry('')
+        for day in self.select_segments(since, until):
+            entry = self.segments[day]
+            inside = ((since is None or entry['min_epoch'] >= since) and
+                      (until is None or entry['max_epoch'] <= until))
+            if inside:
+                _merge_counts(total, entry)
+                continue
+            for record in _filter(_read_lines(self.root / entry['path']), [], since, until, None, None):
+                _count(total, record)
+        return {'count': total['count'], 'categories': total['categories'], 'severities': total['severities']}
+
+
+def _new_entry(path: str) -> Dict:
+    return {'path': path, 'count': 0, 'min_epoch': None, 'max_epoch': None, 'bytes': 0,
+            'categories': {}, 'severities': {}}
+
+
+def _count(entry: Dict, record: Dict):
+    epoch = record['epoch']
+    entry['count'] += 1
+    entry['min_epoch'] = epoch if entry['min_epoch'] is None else min(entry['min_epoch'], epoch)
+    entry['max_epoch'] = epoch if entry['max_epoch'] is None else max(entry['max_epoch'], epoch)
+    for field, key in (('categories', 'category'), ('severities', 'severity')):
+        value = record.get(key)
+        entry[field][value] = entry[field].get(value, 0) + 1
+
+
+def _merge_counts(total: Dict, entry: Dict):
+    total['count'] += entry['count']
+    for field in ('categories', 'severities'):
+        for name, count in entry[field].items():
+            total[field][name] = total[field].get(name, 0) + count
+
+
+def _names(counts: Dict[str, int], wanted: str) -> List[str]:
+    """Names in a segment's counts equal to wanted, ignoring case"""
+    wanted = wanted.lower()
+    return [name for name, count in counts.items() if count and name and name.lower() == wanted]
+
+
+def _needle(field: str, value: str) -> str:
+    """Raw text a record's line contains when field == value"""
+    return f'"{field}":' + json.dumps(value, ensure_ascii=False)
+
+
+def _read_lines(path: Path) -> Iterator[str]:
+    """Lines of a segment; a torn final gzip member (crash mid-append) ends the stream"""
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            yield from f
+    except (EOFError, zlib.error, gzip.BadGzipFile):
+        return
+
+
+def _read_segment(path: Path) -> Iterator[Dict]:
+    for line in _read_lines(path):
+        try:
+            yield json.loads(line)
+        except ValueError:
+            continue
+
+
+def _filter(lines: Iterable[str], needles: List[List[str]], since: Optional[float], until: Optional[float],
+            categories: Optional[List[str]], severities: Optional[List[str]]) -> Iterator[Dict]:
+    for line in lines:
+        # Cheap substring test before decoding; the decoded record is checked exactly
+        if needles and not all(any(n in line for n in group) for group in needles):
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        epoch = record.get('epoch', 0)
+        if (since is not None and epoch < since) or (until is not None and epoch > until):
+            continue
+        if categories is not None and record.get('category') not in categories:
+            continue
+        if severities is not None and record.get('severity') not in severities:
+            continue
+        yield record
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Archive benchmark
+© 2026 CyberDudeBivash Pvt Ltd
+
+Fills an archive with --days of synthetic history (appended in hourly
+batches, as the engine would) and times range queries that the segment
+index prunes against a scan of every segment. Reports on-disk size and the
+peak traced memory of a streamed query.
+
+    python benchmarks/bench_archive.py --days 30 --per-day 20000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from archive import DAY, IncidentArchive, _read_segment  # noqa: E402
+from fixtures import synthetic_incidents  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--per-day', type=int, default=20000, help='incidents archived per day')
+    parser.add_argument('--seed', type=int, default=2026)
+    args = parser.parse_args()
+
+    now = int(time.time())
+    start = now - args.days * DAY
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = IncidentArchive(Path(tmp) / 'archive')
+
+        append_time = 0.0
+        per_hour = args.per_day // 24
+        for hour in range(args.days * 24):
+            base = start + hour * 3600
+            batch = synthetic_incidents(per_hour, args.seed + hour, now=base + 3599, span=3599,
+                                        offset=hour * per_hour)
+            t0 = time.perf_counter()
+            archive.append(batch)
+            append_time += time.perf_counter() - t0
+        total = sum(entry['count'] for entry in archive.segments.values())
+        size = sum(entry['bytes'] for entry in archive.segments.values())
+
+        print(f"archive: {total:,} incidents in {len(archive.segments)} daily segments, "
+              f"{size / 2 ** 20:.1f} MB ({size / total:.0f} B/incident)")
+        print(f"  append (hourly batches)    : {append_time:7.2f}s  ({total / append_time:,.0f} incidents/s)")
+
+        queries = [
+            ('ransomware, last 7 days', dict(since=now - 7 * DAY, category='ransomware')),
+            ('critical, last 24 hours', dict(since=now - DAY, severity='CRITICAL')),
+            ('phishing, all time', dict(category='Phishing')),
+            ('everything, last 3 days', dict(since=now - 3 * DAY)),
+        ]
+        for label, filters in queries:
+            t0 = time.perf_counter()
+            found = sum(1 for _ in archive.query(**filters))
+            indexed = time.perf_counter() - t0
+            segments = len(archive.select_segments(**filters))
+
+            t0 = time.perf_counter()
+            scanned = 0
+            for entry in archive.segments.values():
+                for record in _read_segment(archive.root / entry['path']):
+                    if ((filters.get('since') is None or record['epoch'] >= filters['since']) and
+                            record['category'].lower() == filters.get('category', record['category']).lower() and
+                            record['severity'] == filters.get('severity', record['severity'])):
+                        scanned += 1
+            scan = time.perf_counter() - t0
+            assert scanned == found, (label, scanned, found)
+            print(f"  {label:27}: {indexed:6.2f}s vs full scan {scan:6.2f}s  "
+                  f"({found:,} found, {segments}/{len(archive.segments)} segments read)")
+
+        t0 = time.perf_counter()
+        counts = archive.counts(since=now - 7 * DAY)
+        print(f"  counts, last 7 days        : {time.perf_counter() - t0:6.2f}s  "
+              f"({counts['count']:,} incidents; boundary days scanned, the rest from the index)")
+
+        tracemalloc.start()
+        sum(1 for _ in archive.query(category='ransomware'))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  peak memory, streamed query: {peak / 2 ** 10:7.0f} KB")
+
+
+if __name__ == '__main__':
+    main()
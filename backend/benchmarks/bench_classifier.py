@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Classifier micro-benchmark
+© 2026 CyberDudeBivash Pvt Ltd
+
+Times the compiled single-pass KeywordClassifier against the original
+per-item keyword scans (relevance filter, _categorize_from_text and
+_assess_severity) on synthetic headlines, and checks both agree.
+
+    python benchmarks/bench_classifier.py --count 100000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from classifier import KeywordClassifier  # noqa: E402
+
+HINTS = {
+    'ransomware': 'Ransomware',
+    'malware': 'Malware',
+    'breach': 'Data Breach',
+    'zero-day': 'Zero-Day',
+    'vulnerability': 'CVE'
+}
+
+WORDS = [
+    'critical', 'zero-day', 'ransomware', 'breach', 'leak', 'malware', 'apt', 'nation-state',
+    'vulnerability', 'cve', 'hackers', 'exploit', 'phishing', 'botnet', 'major', 'widespread',
+    'actively exploited', 'patch', 'update', 'report', 'company', 'users', 'cloud', 'server',
+    'researchers', 'warn', 'new', 'campaign', 'adapt', 'chapter', 'quarterly', 'earnings'
+]
+
+
+def legacy_relevant(title: str) -> bool:
+    keywords = ['breach', 'ransomware', 'malware', 'hack', 'exploit',
+                'vulnerability', 'attack', 'zero-day', 'apt', 'threat',
+                'phishing', 'trojan', 'backdoor', 'botnet']
+    return any(kw in title.lower() for kw in keywords)
+
+
+def legacy_category(text: str, hints: Dict[str, str]) -> str:
+    text_lower = text.lower()
+    for keyword, category in hints.items():
+        if keyword in text_lower:
+            return category
+    if 'breach' in text_lower or 'leak' in text_lower:
+        return 'Data Breach'
+    elif 'ransomware' in text_lower:
+        return 'Ransomware'
+    elif 'malware' in text_lower:
+        return 'Malware'
+    elif 'zero-day' in text_lower or '0day' in text_lower:
+        return 'Zero-Day'
+    elif 'apt' in text_lower or 'nation' in text_lower:
+        return 'APT'
+    elif 'vulnerability' in text_lower or 'cve' in text_lower:
+        return 'CVE'
+    else:
+        return 'Incident'
+
+
+def legacy_severity(text: str) -> str:
+    text_lower = text.lower()
+    critical_kw = ['critical', 'zero-day', 'actively exploited', 'urgent', 'emergency']
+    high_kw = ['major', 'massive', 'widespread', 'severe', 'serious']
+    if any(kw in text_lower for kw in critical_kw):
+        return 'CRITICAL'
+    elif any(kw in text_lower for kw in high_kw):
+        return 'HIGH'
+    else:
+        return 'MEDIUM'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100000, help='synthetic headlines')
+    parser.add_argument('--seed', type=int, default=2026)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    headlines = [
+        ' '.join(rng.choice(WORDS) for _ in range(rng.randint(5, 12))).capitalize()
+        for _ in range(args.count)
+    ]
+
+    t0 = time.perf_counter()
+    legacy = [
+        (legacy_relevant(h), legacy_category(h, HINTS), legacy_severity(h))
+        for h in headlines
+    ]
+    legacy_time = time.perf_counter() - t0
+
+    classifier = KeywordClassifier().with_hints(HINTS)
+    t0 = time.perf_counter()
+    compiled = [tuple(classifier.classify(h)) for h in headlines]
+    compiled_time = time.perf_counter() - t0
+
+    mismatches = sum(1 for a, b in zip(legacy, compiled) if a != b)
+
+    print(f"headlines={args.count}")
+    print(f"  legacy scans : {legacy_time:7.3f}s  ({args.count / legacy_time:,.0f}/s)")
+    print(f"  compiled     : {compiled_time:7.3f}s  ({args.count / compiled_time:,.0f}/s)")
+    print(f"  speed-up     : {legacy_time / compiled_time:5.2f}x")
+    print(f"  mismatches   : {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
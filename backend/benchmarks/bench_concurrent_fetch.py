@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Concurrent fetch benchmark
+© 2026 CyberDudeBivash Pvt Ltd
+
+Compares the old serial fetch order against fetch_all_intelligence's
+concurrent fetch stage, using the local stub server with injected latency.
+
+    python benchmarks/bench_concurrent_fetch.py --feeds 12 --delay 0.5
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from threat_engine import CyberDudeBivashThreatIntel  # noqa: E402
+from sources import FeedSource  # noqa: E402
+from benchmarks.stub_server import StubFeedServer  # noqa: E402
+
+
+def serial_fetch(engine: CyberDudeBivashThreatIntel) -> int:
+    """The pre-concurrency fetch order: every source back to back"""
+    items = []
+    for source in engine.sources:
+        try:
+            items.extend(source.fetch(engine))
+        except Exception:
+            pass
+    return len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--feeds', type=int, default=12, help='number of stub feeds')
+    parser.add_argument('--delay', type=float, default=0.5, help='latency per feed (seconds)')
+    parser.add_argument('--slow-delay', type=float, default=5.0, help='latency of one straggler feed')
+    parser.add_argument('--feed-timeout', type=float, default=2.0, help='per-feed budget')
+    args = parser.parse_args()
+
+    with StubFeedServer() as server, contextlib.redirect_stdout(io.StringIO()):
+        engine = CyberDudeBivashThreatIntel(output_dir='/tmp/cdb-bench', use_cache=False, incremental=False,
+                                            banner=False)
+        fixtures = [s for s in engine.sources if s.kind == 'fixture']
+        engine.sources = [
+            FeedSource(f'Stub {n}', server.feed_url(n, args.delay), timeout=args.feed_timeout)
+            for n in range(args.feeds)
+        ] + [
+            FeedSource('Stub slow', server.feed_url('slow', args.slow_delay), timeout=args.feed_timeout)
+        ] + fixtures
+
+        t0 = time.perf_counter()
+        serial_items = serial_fetch(engine)
+        serial = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        concurrent_items = len(engine.fetch_all_intelligence())
+        concurrent = time.perf_counter() - t0
+
+    print(f"feeds={args.feeds + 1} delay={args.delay}s straggler={args.slow_delay}s "
+          f"feed_timeout={args.feed_timeout}s")
+    print(f"  serial     : {serial:7.3f}s  ({serial_items} raw items)")
+    print(f"  concurrent : {concurrent:7.3f}s  ({concurrent_items} incidents, "
+          f"partial: {', '.join(engine.partial_sources()) or 'none'})")
+    print(f"  speed-up   : {serial / concurrent:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
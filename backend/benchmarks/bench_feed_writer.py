@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Feed writer benchmark
+© 2026 CyberDudeBivash Pvt Ltd
+
+Compares the original full-feed write (build the whole {metadata, incidents}
+dict, json.dump with indent=2) with the streaming compact writer, and times
+the category / severity / hourly shards that reuse the same encoded text.
+Reports wall time, peak traced memory and output size.
+
+    python benchmarks/bench_feed_writer.py --count 100000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from feed_writer import encode_incidents, write_feed, write_shards  # noqa: E402
+from fixtures import peak_memory, synthetic_incidents, timed  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100000, help='incidents in the feed')
+    parser.add_argument('--seed', type=int, default=2026)
+    args = parser.parse_args()
+
+    incidents = synthetic_incidents(args.count, args.seed)
+    metadata = {'generated': '2026-10-18T00:00:00Z', 'total_incidents': len(incidents), 'feed_version': 1}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        def legacy():
+            now = time.time()
+            with open(tmp / 'legacy.json', 'w', encoding='utf-8') as f:
+                json.dump({'metadata': metadata, 'incidents': [i.to_json(now) for i in incidents]},
+                          f, indent=2, ensure_ascii=False)
+            return (tmp / 'legacy.json').stat().st_size
+
+        def streaming():
+            return write_feed(tmp / 'stream.json', metadata, encode_incidents(incidents))
+
+        def sharded():
+            encoded = list(encode_incidents(incidents))
+            write_feed(tmp / 'full.json', metadata, encoded)
+            return write_shards(tmp / 'shards', metadata, incidents, encoded)
+
+        legacy_size, legacy_time = timed(legacy)
+        stream_size, stream_time = timed(streaming)
+        manifest, shard_time = timed(sharded)
+        legacy_peak, stream_peak, shard_peak = (peak_memory(fn) for fn in (legacy, streaming, sharded))
+
+        assert json.load(open(tmp / 'stream.json'))['incidents'][0]['id'] == incidents[0].id
+
+    shard_count = sum(len(manifest[kind]) for kind in ('categories', 'severities', 'hours'))
+    print(f"incidents={args.count}")
+    print(f"  {'':34}{'time':>9}{'peak mem':>11}{'size':>11}")
+    print(f"  {'dict + json.dump(indent=2)':34}{legacy_time:8.2f}s{legacy_peak / 2 ** 20:9.1f}MB"
+          f"{legacy_size / 2 ** 20:9.1f}MB")
+    print(f"  {'streaming, compact':34}{stream_time:8.2f}s{stream_peak / 2 ** 20:9.1f}MB"
+          f"{stream_size / 2 ** 20:9.1f}MB")
+    print(f"  {f'full feed + {shard_count} shards + manifest':34}{shard_time:8.2f}s{shard_peak / 2 ** 20:9.1f}MB")
+    print(f"  speed-up (full feed)            : {legacy_time / stream_time:5.1f}x, "
+          f"{1 - stream_size / legacy_size:.0%} smaller")
+
+
+if __name__ == '__main__':
+    main()
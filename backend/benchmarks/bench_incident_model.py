@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Incident model benchmark
+© 2026 CyberDudeBivash Pvt Ltd
+
+Compares the original per-incident dict (ISO timestamp string, epoch,
+hours_ago / freshness_score materialised on every incident, fresh string
+objects per field as json.loads / feed parsing produce them) with the slotted
+Incident model. Reports resident memory of the whole window (tracemalloc),
+construction throughput, and serialisation throughput of the feed.
+
+    python benchmarks/bench_incident_model.py --count 200000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixtures import synthetic_rows  # noqa: E402
+from models import Incident, SEVERITY_SCORES  # noqa: E402
+from timestamps import epoch_to_iso  # noqa: E402
+
+# Fields whose values repeat across incidents (interned by the model)
+SHARED_FIELDS = ('source', 'category', 'severity', 'region', 'tier')
+
+
+def _fresh(value: str) -> str:
+    """An equal but distinct string object, as json.loads would produce"""
+    return (value + '.')[:-1]
+
+
+def raw_rows(count: int, seed: int):
+    """Source records as they arrive from parsing (unshared strings)"""
+    rows = synthetic_rows(count, seed)
+    for row in rows:
+        for field in SHARED_FIELDS:
+            row[field] = _fresh(row[field])
+    return rows
+
+
+def as_dict(row, now: float):
+    incident = dict(row)
+    incident['timestamp'] = epoch_to_iso(row['epoch'])
+    incident['sources'] = [row['source']]
+    incident['score'] = SEVERITY_SCORES.get(row['severity'], 2)
+    hours_old = (now - row['epoch']) / 3600
+    incident['hours_ago'] = max(0, int(hours_old))
+    incident['freshness_score'] = max(0, 24 - hours_old)
+    return incident
+
+
+def as_model(row, now: float):
+    incident = Incident.from_json(row)
+    incident.score = SEVERITY_SCORES.get(incident.severity, 2)
+    return incident
+
+
+def measure(rows, build):
+    now = time.time()
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    window = [build(row, now) for row in rows]
+    elapsed = time.perf_counter() - t0
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return window, current, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=200000, help='incidents in the window')
+    parser.add_argument('--seed', type=int, default=2026)
+    args = parser.parse_args()
+
+    rows = raw_rows(args.count, args.seed)
+
+    dicts, dict_mem, dict_build = measure(rows, as_dict)
+    t0 = time.perf_counter()
+    json.dumps(dicts, separators=(',', ':'))
+    dict_dump = time.perf_counter() - t0
+    del dicts
+
+    models, model_mem, model_build = measure(rows, as_model)
+    t0 = time.perf_counter()
+    now = time.time()
+    json.dumps([i.to_json(now) for i in models], separators=(',', ':'))
+    model_dump = time.perf_counter() - t0
+
+    print(f"incidents={args.count}")
+    print(f"  {'':18}{'memory':>12}{'per item':>10}{'build/s':>12}{'serialise/s':>14}")
+    for label, mem, build, dump in (('dict', dict_mem, dict_build, dict_dump),
+                                    ('Incident', model_mem, model_build, model_dump)):
+        print(f"  {label:18}{mem / 2 ** 20:10.1f}MB{mem / args.count:9.0f}B"
+              f"{args.count / build:12,.0f}{args.count / dump:14,.0f}")
+    print(f"  memory saved      : {1 - model_mem / dict_mem:6.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - IOC extraction / index benchmark
+© 2026 CyberDudeBivash Pvt Ltd
+
+Extracts IOCs from a synthetic window of incidents, builds the inverted
+index, and compares "which incidents mention X" lookups against the linear
+scan a client does today (substring search over every title and
+description). Also times the per-cycle maintenance: expiring the oldest
+slice of the window and indexing the same number of new incidents.
+
+    python benchmarks/bench_ioc_index.py --count 100000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixtures import synthetic_incidents  # noqa: E402
+from ioc import MALWARE_FAMILIES, IOCExtractor, IOCIndex  # noqa: E402
+
+
+def make_window(count: int, seed: int, pool: int, offset: int = 0):
+    """Shared synthetic incidents, roughly half naming an indicator or two.
+
+    Indicators are drawn from a pool sized by `pool` (the window size), small
+    enough that they recur across incidents.
+    """
+    rng = random.Random(seed)
+    families = [aliases[0] for aliases in MALWARE_FAMILIES.values()]
+    incidents = synthetic_incidents(count, seed, offset=offset)
+    for incident in incidents:
+        words = incident.description.split()
+        if rng.random() < 0.5:
+            words.insert(rng.randrange(len(words)), f"CVE-2026-{rng.randint(1000, 1000 + pool // 20)}")
+        if rng.random() < 0.2:
+            words.insert(rng.randrange(len(words)), f"203.0.{rng.randint(0, 20)}.{rng.randint(1, 254)}")
+        if rng.random() < 0.2:
+            words.insert(rng.randrange(len(words)), f"update-{rng.randint(0, pool // 50)}[.]example")
+        if rng.random() < 0.1:
+            words.insert(rng.randrange(len(words)), f"{rng.getrandbits(256):064x}")
+        if rng.random() < 0.3:
+            words.insert(0, rng.choice(families))
+        incident.description = ' '.join(words)
+    return incidents
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100000, help='incidents in the window')
+    parser.add_argument('--churn', type=float, default=0.05, help='share of the window replaced per cycle')
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=2026)
+    args = parser.parse_args()
+
+    incidents = make_window(args.count, args.seed, args.count)
+    extractor = IOCExtractor()
+
+    t0 = time.perf_counter()
+    for incident in incidents:
+        incident.iocs = extractor.extract(f"{incident.title}\n{incident.description}")
+    extract_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    index = IOCIndex(extractor, incidents)
+    build_time = time.perf_counter() - t0
+
+    rng = random.Random(args.seed)
+    queries = [value for kind, value, _ in index.top(len(index))]
+    queries = rng.sample(queries, min(args.queries, len(queries)))
+
+    t0 = time.perf_counter()
+    for q in queries:
+        index.lookup(q)
+    lookup_time = (time.perf_counter() - t0) / len(queries)
+
+    scan_queries = queries[:20]
+    t0 = time.perf_counter()
+    for q in scan_queries:
+        [i.id for i in incidents if q.lower() in f"{i.title} {i.description}".lower()]
+    scan_time = (time.perf_counter() - t0) / len(scan_queries)
+
+    churn = int(args.count * args.churn)
+    fresh = make_window(churn, args.seed + 1, args.count, offset=args.count)
+    t0 = time.perf_counter()
+    for incident in incidents[-churn:]:
+        index.remove(incident.id)
+    for incident in fresh:
+        incident.iocs = extractor.extract(f"{incident.title}\n{incident.description}")
+        index.add(incident)
+    cycle_time = time.perf_counter() - t0
+
+    print(f"incidents={args.count} distinct iocs={len(index)} churn/cycle={churn}")
+    print(f"  extraction                 : {extract_time:7.2f}s  ({args.count / extract_time:,.0f} incidents/s)")
+    print(f"  index build                : {build_time:7.2f}s")
+    print(f"  lookup, inverted index     : {lookup_time * 1e6:7.1f}µs")
+    print(f"  lookup, linear scan        : {scan_time * 1e3:7.1f}ms")
+    print(f"  cycle maintenance          : {cycle_time * 1e3:7.1f}ms  (-{churn} expired, +{churn} extracted and indexed)")
+
+
+if __name__ == '__main__':
+    main()
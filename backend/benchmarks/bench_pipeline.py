@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Streaming pipeline benchmark
+© 2026 CyberDudeBivash Pvt Ltd
+
+Runs full engine cycles over growing numbers of in-memory feeds, parsing on
+the fetch threads and then in a ParsePool of --workers processes. Reports
+the fetch stage (download, parse, clean, classify), the streamed
+post-processing and the parent process's peak traced memory per run. Worker
+memory is not traced. Parsing only gets faster in the pool if the machine
+has more than one core.
+
+    python benchmarks/bench_pipeline.py --sources 8,32,128 --items 200 --workers 4
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from suite import memory_urlopen, new_engine, synthetic_documents  # noqa: E402
+from pipeline import ParsePool  # noqa: E402
+from sources import FeedSource  # noqa: E402
+from threat_engine import CyberDudeBivashThreatIntel  # noqa: E402
+
+POST_STAGES = ('normalize', 'deduplicate', 'filter', 'extract_iocs', 'score')
+
+
+def run(documents, items: int, pool, workdir: Path, traced: bool):
+    engine = new_engine(workdir)
+    engine.urlopen = memory_urlopen(documents)
+    engine.parse_pool = pool
+    engine.sources = [FeedSource(name, f'memory://bench/{name}', item_limit=items, timeout=600)
+                      for name in documents]
+    if traced:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        incidents = engine.run_cycle()
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1] if traced else None
+    if traced:
+        tracemalloc.stop()
+    stages = engine.metrics.last_run['stages']
+    return {
+        'total': elapsed,
+        'fetch': stages['fetch']['seconds'],
+        'post': sum(stages[name]['seconds'] for name in POST_STAGES),
+        'incidents': len(incidents),
+        'peak': peak
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sources', default='8,32,128', help='comma-separated feed counts')
+    parser.add_argument('--items', type=int, default=200, help='items per feed')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='parse worker processes')
+    args = parser.parse_args()
+
+    pool = ParsePool(args.workers, CyberDudeBivashThreatIntel.CLASSIFIER_RULES)
+    print(f"cores={os.cpu_count()} workers={args.workers} items/feed={args.items}")
+    print(f"  {'feeds':>6} {'mode':>12} {'fetch+parse':>12} {'post':>8} {'total':>8} {'incidents':>10} {'peak':>9}")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            # Start the workers before timing anything
+            run(synthetic_documents(8, 2), 8, pool, Path(tmp) / 'warmup', False)
+            for feeds in (int(n) for n in args.sources.split(',')):
+                documents = synthetic_documents(feeds * args.items, feeds)
+                for mode, mode_pool in (('threads', None), (f'{args.workers} procs', pool)):
+                    workdir = Path(tmp) / f'{feeds}-{mode}'
+                    timed = run(documents, args.items, mode_pool, workdir / 'timed', False)
+                    traced = run(documents, args.items, mode_pool, workdir / 'traced', True)
+                    print(f"  {feeds:>6} {mode:>12} {timed['fetch']:11.2f}s {timed['post']:7.2f}s "
+                          f"{timed['total']:7.2f}s {timed['incidents']:>10,} {traced['peak'] / 2 ** 20:7.1f}MB")
+    finally:
+        pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
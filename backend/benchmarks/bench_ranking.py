@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Ranking benchmark
+© 2026 CyberDudeBivash Pvt Ltd
+
+Simulates a daemon holding a large rolling window: every cycle a batch of new
+incidents arrives, the oldest fall out of the window, and the widget (top 10)
+plus per-category top 10 lists are produced. Compares the original approach
+(re-score and fully sort the window every cycle, then slice / filter) with
+the incremental RankedWindow.
+
+    python benchmarks/bench_ranking.py --window 200000 --batch 500 --cycles 20
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixtures import CATEGORIES, synthetic_incidents  # noqa: E402
+from models import SEVERITY_SCORES  # noqa: E402
+from ranking import RankedWindow  # noqa: E402
+
+TOP_K = 10
+
+
+def full_sort_cycle(window, batch, cutoff):
+    window = [i for i in window if i.epoch >= cutoff] + batch
+    for incident in window:
+        incident.score = SEVERITY_SCORES.get(incident.severity, 2)
+    window.sort(key=lambda x: (x.score, x.epoch), reverse=True)
+    widget = window[:TOP_K]
+    per_category = {c: [i for i in window if i.category == c][:TOP_K] for c in CATEGORIES}
+    return window, widget, per_category
+
+
+def ranked_cycle(ranking, batch, cutoff):
+    ranking.expire(cutoff)
+    for incident in batch:
+        incident.score = SEVERITY_SCORES.get(incident.severity, 2)
+        ranking.add(incident)
+    widget = ranking.top(TOP_K)
+    per_category = {c: ranking.top(TOP_K, category=c) for c in CATEGORIES}
+    return widget, per_category
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--window', type=int, default=200000, help='incidents in the rolling window')
+    parser.add_argument('--batch', type=int, default=500, help='new incidents per cycle')
+    parser.add_argument('--cycles', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=2026)
+    args = parser.parse_args()
+
+    # One incident per second of window; each cycle advances time by one batch
+    start = 1_800_000_000
+    initial = synthetic_incidents(args.window, args.seed, now=start + args.window - 1, spacing=1)
+    batches = []
+    n = args.window
+    for cycle in range(args.cycles):
+        batches.append(synthetic_incidents(args.batch, args.seed + 1 + cycle, now=start + n + args.batch - 1,
+                                           spacing=1, offset=n))
+        n += args.batch
+
+    window = list(initial)
+    t0 = time.perf_counter()
+    for cycle, batch in enumerate(batches, 1):
+        window, legacy_widget, legacy_categories = full_sort_cycle(window, batch, start + cycle * args.batch)
+    legacy_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    ranking = RankedWindow(initial)
+    build_time = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for cycle, batch in enumerate(batches, 1):
+        widget, categories = ranked_cycle(ranking, batch, start + cycle * args.batch)
+    ranked_time = time.perf_counter() - t0
+
+    same = ([i.id for i in widget] == [i.id for i in legacy_widget]
+            and all([i.id for i in categories[c]] == [i.id for i in legacy_categories[c]] for c in CATEGORIES))
+    print(f"window={args.window} batch={args.batch} cycles={args.cycles}")
+    print(f"  full re-sort per cycle : {legacy_time / args.cycles * 1000:8.1f}ms")
+    print(f"  RankedWindow per cycle : {ranked_time / args.cycles * 1000:8.1f}ms  "
+          f"(one-off build {build_time:.2f}s)")
+    print(f"  speed-up               : {legacy_time / ranked_time:6.1f}x")
+    print(f"  same top-{TOP_K} results  : {same}")
+
+
+if __name__ == '__main__':
+    main()
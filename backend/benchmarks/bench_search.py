@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Search index benchmark
+© 2026 CyberDudeBivash Pvt Ltd
+
+Builds the BM25 search index over a synthetic window, then times keyword
+and prefix queries and one cycle of incremental maintenance (expire the
+oldest slice, index as many new incidents) against rebuilding the index.
+
+    python benchmarks/bench_search.py --count 100000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixtures import synthetic_incidents  # noqa: E402
+from search import SearchIndex  # noqa: E402
+
+# Common words, multi-word, prefix (the last word) and long-tail name queries
+# over the stub_server headline vocabulary
+QUERIES = ['ransomware hospital', 'citrix vpn exploit', 'ransom', 'patients records leaks', 'zero-day',
+           'bleeping', 'kakoto', 'kako', 'pipeline operators', 'globex fine']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100000, help='incidents in the window')
+    parser.add_argument('--churn', type=float, default=0.05, help='share of the window replaced per cycle')
+    parser.add_argument('--seed', type=int, default=2026)
+    args = parser.parse_args()
+
+    incidents = synthetic_incidents(args.count, args.seed)
+
+    t0 = time.perf_counter()
+    index = SearchIndex(incidents)
+    build_time = time.perf_counter() - t0
+
+    print(f"incidents={args.count} vocabulary={len(index._vocabulary)}")
+    print(f"  build                      : {build_time:7.2f}s")
+    for query in QUERIES:
+        t0 = time.perf_counter()
+        hits = index.search(query, limit=20)
+        elapsed = time.perf_counter() - t0
+        matched = len(index.search(query, limit=None))
+        print(f"  {query!r:27}: {elapsed * 1e3:7.2f}ms  ({matched:,} matches, top {len(hits)})")
+
+    churn = int(args.count * args.churn)
+    fresh = synthetic_incidents(churn, args.seed + 1, offset=args.count)
+    t0 = time.perf_counter()
+    for incident in incidents[-churn:]:
+        index.remove(incident.id)
+    for incident in fresh:
+        index.add(incident)
+    cycle_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    SearchIndex(incidents[:-churn] + fresh)
+    rebuild_time = time.perf_counter() - t0
+
+    print(f"  incremental cycle          : {cycle_time * 1e3:7.1f}ms  (-{churn} expired, +{churn} indexed)")
+    print(f"  full rebuild               : {rebuild_time * 1e3:7.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Window statistics benchmark
+© 2026 CyberDudeBivash Pvt Ltd
+
+Counts a synthetic window by severity, category and source three ways:
+a loop over the incidents (as print_summary used to), WindowStats'
+maintained rollups, and a filtered count over its columns. It also times
+one run's worth of maintenance (--churn incidents added and expired) and
+the full threat-stats.json summary.
+
+    python benchmarks/bench_stats.py --sizes 1000,10000,100000 --churn 500
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixtures import synthetic_incidents, timed  # noqa: E402
+from stats import WindowStats  # noqa: E402
+
+
+def dict_counts(incidents):
+    counts = {'severity': {}, 'category': {}, 'source': {}}
+    for incident in incidents:
+        for field, field_counts in counts.items():
+            field_counts[incident[field]] = field_counts.get(incident[field], 0) + 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='1000,10000,100000', help='comma-separated window sizes')
+    parser.add_argument('--churn', type=int, default=500, help='incidents added and expired per run')
+    args = parser.parse_args()
+
+    now = int(time.time())
+    print(f"  {'window':>8} {'dict loop':>10} {'rollups':>9} {'col scan':>9} {'build':>8} {'per run':>8} "
+          f"{'summary':>8}")
+    for size in (int(n) for n in args.sizes.split(',')):
+        incidents = synthetic_incidents(size, now=now)
+        stats = WindowStats(incidents)
+        fresh = synthetic_incidents(args.churn, size, now=now, offset=size)
+
+        def churn():
+            for incident in fresh:
+                stats.add(incident)
+            for incident in fresh:
+                stats.remove(incident['id'])
+
+        _, loop = timed(lambda: dict_counts(incidents), repeat=5)
+        _, rollups = timed(lambda: [stats.totals(field) for field in ('severity', 'category', 'source')], repeat=5)
+        _, scan = timed(lambda: stats.count(since=now - 6 * 3600, category='Ransomware', severity='CRITICAL'),
+                        repeat=5)
+        _, build = timed(lambda: WindowStats(incidents))
+        _, per_run = timed(churn, repeat=5)
+        _, summary = timed(lambda: stats.summary(now), repeat=5)
+        print(f"  {size:>8,} {loop * 1000:8.2f}ms {rollups * 1000:7.2f}ms {scan * 1000:7.2f}ms "
+              f"{build * 1000:6.1f}ms {per_run * 1000:6.2f}ms {summary * 1000:6.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Timestamp benchmark
+© 2026 CyberDudeBivash Pvt Ltd
+
+Compares the original timestamp handling (strptime format loop, then two
+fromisoformat re-parses for the time filter and freshness scoring, then a
+sort on freshness) with parse-once epoch integers from TimestampParser.
+Inputs mix RFC 822 and ISO 8601 dates across several sources.
+
+    python benchmarks/bench_timestamps.py --count 100000
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from timestamps import TimestampParser, epoch_to_iso  # noqa: E402
+
+
+def legacy_parse(timestamp_str: str) -> str:
+    """The engine's original _parse_timestamp"""
+    if not timestamp_str:
+        return datetime.utcnow().isoformat() + 'Z'
+    formats = [
+        '%a, %d %b %Y %H:%M:%S %Z',
+        '%a, %d %b %Y %H:%M:%S %z',
+        '%Y-%m-%dT%H:%M:%SZ',
+        '%Y-%m-%dT%H:%M:%S%z',
+        '%Y-%m-%d %H:%M:%S'
+    ]
+    for fmt in formats:
+        try:
+            dt = datetime.strptime(timestamp_str.strip(), fmt)
+            return dt.isoformat() + 'Z'
+        except:
+            continue
+    return datetime.utcnow().isoformat() + 'Z'
+
+
+def legacy_pipeline(rows, cutoff: datetime):
+    incidents = [{'source': src, 'timestamp': legacy_parse(raw)} for src, raw in rows]
+    kept = []
+    for incident in incidents:
+        try:
+            ts = incident['timestamp'].replace('Z', '+00:00')
+            if datetime.fromisoformat(ts).replace(tzinfo=None) >= cutoff:
+                kept.append(incident)
+        except:
+            kept.append(incident)
+    now = datetime.utcnow()
+    for incident in kept:
+        try:
+            ts = incident['timestamp'].replace('Z', '+00:00')
+            hours_old = (now - datetime.fromisoformat(ts).replace(tzinfo=None)).total_seconds() / 3600
+            incident['freshness_score'] = max(0, 24 - hours_old)
+        except:
+            incident['freshness_score'] = 24
+    kept.sort(key=lambda x: x['freshness_score'], reverse=True)
+    return kept
+
+
+def epoch_pipeline(rows, cutoff: int, parser: TimestampParser):
+    now = int(time.time())
+    incidents = []
+    for src, raw in rows:
+        epoch = parser.parse(raw, src)
+        if epoch is None:
+            epoch = now
+        incidents.append({'source': src, 'epoch': epoch, 'timestamp': epoch_to_iso(epoch)})
+    kept = [i for i in incidents if i['epoch'] >= cutoff]
+    for incident in kept:
+        incident['freshness_score'] = max(0, 24 - (now - incident['epoch']) / 3600)
+    kept.sort(key=lambda x: x['epoch'], reverse=True)
+    return kept
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100000, help='timestamps')
+    parser.add_argument('--sources', type=int, default=20, help='distinct sources')
+    parser.add_argument('--seed', type=int, default=2026)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    now = datetime.utcnow()
+    rows = []
+    for n in range(args.count):
+        source = n % args.sources
+        dt = now - timedelta(seconds=rng.randint(0, 36 * 3600))
+        if source % 2:
+            raw = format_datetime(dt).replace('-0000', 'GMT')          # RSS pubDate
+        else:
+            raw = dt.strftime('%Y-%m-%dT%H:%M:%SZ')                     # Atom published
+        rows.append((f'source-{source}', raw))
+
+    t0 = time.perf_counter()
+    legacy = legacy_pipeline(rows, now - timedelta(hours=24))
+    legacy_time = time.perf_counter() - t0
+
+    ts_parser = TimestampParser()
+    t0 = time.perf_counter()
+    fast = epoch_pipeline(rows, int(time.time()) - 24 * 3600, ts_parser)
+    fast_time = time.perf_counter() - t0
+
+    print(f"timestamps={args.count} sources={args.sources} (RFC 822 / ISO 8601 mixed)")
+    print(f"  legacy strptime + re-parse : {legacy_time:7.3f}s  ({len(legacy)} in window)")
+    print(f"  parse-once epochs          : {fast_time:7.3f}s  ({len(fast)} in window)")
+    print(f"  speed-up                   : {legacy_time / fast_time:5.1f}x")
+    print(f"  learned-format hits        : {ts_parser.hits}/{ts_parser.hits + ts_parser.misses}")
+
+
+if __name__ == '__main__':
+    main()
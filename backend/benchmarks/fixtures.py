@@ -0,0 +1,78 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Shared benchmark fixtures
+© 2026 CyberDudeBivash Pvt Ltd
+
+One synthetic incident shape for every component benchmark, so their
+numbers describe the same data. Titles come from stub_server.headline (the
+headlines the suite's synthetic feeds carry), categories follow a
+realistic mix, and epochs are spread across the 24-hour window or spaced
+evenly, newest first, like the stub feeds.
+"""
+
+import random
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models import Incident, SEVERITY_SCORES
+from stub_server import headline
+
+CATEGORIES = ['Ransomware', 'Data Breach', 'CVE', 'Advisory', 'Banking Trojan', 'Phishing', 'Incident']
+CATEGORY_WEIGHTS = [2, 3, 6, 4, 1, 3, 6]
+SEVERITIES = list(SEVERITY_SCORES)
+SOURCES = ['The Hacker News', 'BleepingComputer', 'SecurityWeek', 'CVE Database', 'CISA', 'Malware Intel']
+
+DAY = 86400
+
+
+def synthetic_rows(count: int, seed: int = 2026, now: Optional[int] = None, span: int = DAY,
+                   spacing: Optional[float] = None, offset: int = 0) -> List[Dict]:
+    """Incident records as parsing produces them.
+
+    Epochs fall at random within `span` seconds before now or, with
+    `spacing`, every `spacing` seconds back from now. IDs are offset + n, so
+    batches generated with distinct offsets never collide.
+    """
+    rng = random.Random(seed)
+    now = int(time.time()) if now is None else now
+    rows = []
+    for n in range(count):
+        number = offset + n
+        rows.append({
+            'title': headline('bench', number, rng),
+            'description': f"{headline('bench', number, rng)}. {headline('bench', number, rng)}.",
+            'source': rng.choice(SOURCES),
+            'category': rng.choices(CATEGORIES, CATEGORY_WEIGHTS)[0],
+            'severity': rng.choice(SEVERITIES),
+            'url': f"https://example.test/threat/{number}",
+            'epoch': int(now - n * spacing) if spacing is not None else now - rng.randint(0, span),
+            'region': 'Global',
+            'tier': 'free',
+            'id': f"{number:032x}"
+        })
+    return rows
+
+
+def synthetic_incidents(count: int, seed: int = 2026, **kwargs) -> List[Incident]:
+    """synthetic_rows as Incident models (same keyword arguments)"""
+    return [Incident.from_json(row) for row in synthetic_rows(count, seed, **kwargs)]
+
+
+def timed(fn: Callable, repeat: int = 1) -> Tuple[object, float]:
+    """(result of the last run, best wall time of `repeat` runs)"""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return result, best
+
+
+def peak_memory(fn: Callable) -> int:
+    """Peak traced memory of one run (a separate pass: tracemalloc skews timing)"""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,160 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Local stub feed server for benchmarks
+© 2026 CyberDudeBivash Pvt Ltd
+
+Serves synthetic RSS / Atom documents, or replays recorded ones, on
+127.0.0.1 with injectable latency so the engine can be measured without
+touching the network.
+
+    /feed/<n>?delay=<seconds>&items=<count>&format=rss|atom&spacing=<seconds>
+    /doc/<name>?delay=<seconds>        a document passed to StubFeedServer
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import urlparse, parse_qs
+
+KEYWORDS = [
+    'ransomware', 'breach', 'malware', 'zero-day', 'phishing', 'botnet', 'exploit',
+    'vulnerability', 'backdoor', 'trojan', 'APT', 'attack', 'critical', 'major'
+]
+VOCABULARY = (
+    'acme globex initech umbrella hooli stark wayne cyberdyne soylent tyrell '
+    'router firewall vpn exchange sharepoint outlook chrome firefox android ios '
+    'linux windows kubernetes docker jenkins gitlab confluence jira citrix fortinet '
+    'bank hospital airline university retailer telecom energy pipeline council ministry '
+    'customers employees patients students records passwords tokens invoices emails '
+    'warns patches discloses confirms investigates claims targets abuses leaks exposes '
+    'campaign operators affiliates researchers agency lawsuit fine outage recovery update'
+).split()
+
+
+# Pseudo-names (4096 of them) keep large corpora as varied as real headlines,
+# so near-duplicate detection sees realistic, not pathological, overlap
+SYLLABLES = 'ka to ri ne mo su la vi de po ga zu fe hi ja ko'.split()
+
+
+def headline(feed_id: str, n: int, rng: Optional[random.Random] = None) -> str:
+    """Deterministic synthetic headline: one threat keyword plus varied filler.
+
+    Drawn from rng when given (one generator for a whole corpus), otherwise
+    from a generator seeded by feed_id and n.
+    """
+    rng = rng or random.Random(f'{feed_id}-{n}')
+    words = rng.sample(VOCABULARY, 4) + [''.join(rng.choices(SYLLABLES, k=3)) for _ in range(2)]
+    rng.shuffle(words)
+    words.insert(rng.randint(0, 6), rng.choice(KEYWORDS))
+    return ' '.join(words).capitalize()
+
+
+def build_rss(feed_id: str, count: int, spacing: float = 420) -> bytes:
+    """Build a synthetic RSS 2.0 document with `count` items, `spacing` seconds apart"""
+    now = datetime.utcnow()
+    items = []
+    for n in range(count):
+        title = headline(feed_id, n)
+        pub = format_datetime(now - timedelta(seconds=spacing * n)).replace('-0000', 'GMT')
+        items.append(
+            f"<item><title>{title}</title>"
+            f"<link>https://example.test/{feed_id}/{n}</link>"
+            f"<description>&lt;p&gt;{title}&lt;/p&gt;</description>"
+            f"<pubDate>{pub}</pubDate></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f'<title>Stub feed {feed_id}</title>{"".join(items)}</channel></rss>'
+    ).encode('utf-8')
+
+
+def build_atom(feed_id: str, count: int, spacing: float = 420) -> bytes:
+    """Build a synthetic Atom 1.0 document with `count` items, `spacing` seconds apart"""
+    now = datetime.utcnow()
+    entries = []
+    for n in range(count):
+        title = headline(feed_id, n)
+        published = (now - timedelta(seconds=spacing * n)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        entries.append(
+            f"<entry><title>{title}</title>"
+            f'<link href="https://example.test/{feed_id}/{n}"/>'
+            f'<summary type="html">&lt;p&gt;{title}&lt;/p&gt;</summary>'
+            f"<published>{published}</published></entry>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        f'<title>Stub feed {feed_id}</title>{"".join(entries)}</feed>'
+    ).encode('utf-8')
+
+
+BUILDERS = {'rss': build_rss, 'atom': build_atom}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    documents = {}
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        delay = float(query.get('delay', ['0'])[0])
+        if delay:
+            time.sleep(delay)
+        name = parsed.path.rsplit('/', 1)[-1]
+        if parsed.path.startswith('/doc/'):
+            body = self.documents.get(name)
+            if body is None:
+                self.send_error(404)
+                return
+        else:
+            count = int(query.get('items', ['20'])[0])
+            spacing = float(query.get('spacing', ['420'])[0])
+            body = BUILDERS[query.get('format', ['rss'])[0]](name, count, spacing)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/xml; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The engine stops reading once it has enough items
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    # The default backlog of 5 makes concurrent clients wait on SYN retries
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class StubFeedServer:
+    """Context manager running the stub server on a background thread"""
+
+    def __init__(self, documents: Optional[Dict[str, bytes]] = None):
+        handler = type('StubHandler', (_StubHandler,), {'documents': dict(documents or {})})
+        self.httpd = _StubHTTPServer(('127.0.0.1', 0), handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def feed_url(self, feed_id, delay: float = 0, items: int = 20) -> str:
+        return f'{self.base_url}/feed/{feed_id}?delay={delay}&items={items}'
+
+    def doc_url(self, name: str, delay: float = 0) -> str:
+        return f'{self.base_url}/doc/{name}?delay={delay}'
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Reproducible benchmark suite
+© 2026 CyberDudeBivash Pvt Ltd
+
+Replays RSS / Atom documents through CyberDudeBivashThreatIntel without the
+network and times each stage separately:
+
+    fetch      download every document from the local stub server
+    parse      stream the documents through iter_feed_items
+    classify   timestamp parsing, HTML cleanup and keyword classification
+    dedup      exact-title dedup, window filter and near-duplicate clustering
+    score      scoring, ranking and a cold build of the window indexes
+               (IOCs, search, stats)
+    serialize  generate_feeds (full feed, shards, delta, widget, stats,
+               HTML fragments) and archiving the new incidents
+    e2e        a full run_cycle, feeds fetched through the injectable fetcher
+               (engine.urlopen) or the stub server
+
+Documents are synthetic (half RSS 2.0, half Atom, deterministic headlines
+spread across the 24-hour window) or recorded files replayed from a
+directory. Throughput is items entering the stage per second (best of
+--repeat runs); peak memory is tracemalloc's peak during the stage, from a
+separate pass so tracing does not skew the timings.
+
+Results can be saved as a baseline and later runs are compared against it,
+flagging stages that got slower or hungrier than --tolerance allows.
+
+    python benchmarks/suite.py                                  # 10 .. 100k items
+    python benchmarks/suite.py --sizes 1000,10000 --save-baseline
+    python benchmarks/suite.py --fixtures recorded/ --transport http
+    python benchmarks/suite.py --strict                         # exit 1 on regression
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from stub_server import BUILDERS, StubFeedServer  # noqa: E402
+from feed_parser import iter_feed_items  # noqa: E402
+from models import Incident  # noqa: E402
+from near_dedup import cluster  # noqa: E402
+from sources import FeedSource  # noqa: E402
+from threat_engine import CyberDudeBivashThreatIntel  # noqa: E402
+
+SIZES = (10, 1000, 10000, 100000)
+STAGES = ('fetch', 'parse', 'classify', 'dedup', 'score', 'serialize', 'e2e')
+FEEDS = 4
+BASELINE = Path(__file__).resolve().parent / 'baseline.json'
+
+# Stages faster than this are too noisy to call a regression
+MIN_COMPARABLE_SECONDS = 0.05
+
+
+# -- documents -------------------------------------------------------------
+
+def synthetic_documents(total: int, feeds: int = FEEDS) -> Dict[str, bytes]:
+    """`total` items split over `feeds` documents, alternating RSS and Atom"""
+    counts = [total // feeds + (1 if n < total % feeds else 0) for n in range(feeds)]
+    # Keep every item inside the 24-hour window
+    spacing = min(420.0, 23 * 3600 / max(1, max(counts)))
+    documents = {}
+    for n, count in enumerate(counts):
+        if count:
+            fmt = 'atom' if n % 2 else 'rss'
+            documents[f'bench-{n}.{fmt}.xml'] = BUILDERS[fmt](f'bench-{n}', count, spacing)
+    return documents
+
+
+def recorded_documents(directory: Path) -> Dict[str, bytes]:
+    """Every .xml / .rss / .atom file in a directory, by file name"""
+    return {
+        path.name: path.read_bytes()
+        for path in sorted(Path(directory).iterdir())
+        if path.suffix in ('.xml', '.rss', '.atom')
+    }
+
+
+class MemoryResponse(io.BytesIO):
+    """Stands in for a urlopen() response: a readable body plus headers"""
+
+    def __init__(self, body: bytes):
+        super().__init__(body)
+        self.headers = {}
+
+
+def memory_urlopen(documents: Dict[str, bytes]) -> Callable:
+    """Fetcher for engine.urlopen that serves documents from memory"""
+    def urlopen(request, timeout=None):
+        return MemoryResponse(documents[request.full_url.rsplit('/', 1)[-1]])
+    return urlopen
+
+
+# -- stages ----------------------------------------------------------------
+
+def new_engine(workdir: Path) -> CyberDudeBivashThreatIntel:
+    engine = CyberDudeBivashThreatIntel(output_dir=str(workdir), use_cache=False, incremental=False,
+                                        banner=False)
+    engine.RUN_DEADLINE = 3600
+    return engine
+
+
+def feed_info(name: str, limit: int) -> Dict:
+    return {'url': name, 'name': name, 'category_hints': {}, 'timeout': 600, 'item_limit': limit}
+
+
+def staged_pipeline(documents: Dict[str, bytes], server: StubFeedServer, workdir: Path) -> List:
+    """[(stage, fn)] where each fn takes the previous stage's output"""
+    engine = new_engine(workdir)
+
+    def fetch(_):
+        return {name: urllib.request.urlopen(server.doc_url(name)).read() for name in documents}
+
+    def parse(bodies):
+        return [(name, item) for name, body in bodies.items() for item in iter_feed_items(io.BytesIO(body))]
+
+    def classify(items):
+        infos = {name: feed_info(name, len(items)) for name in documents}
+        incidents = []
+        for name, item in items:
+            epoch = engine.timestamps.parse(item['pub_date'], name)
+            incident = engine._incident_from_item(item, infos[name], epoch)
+            if incident:
+                incidents.append(incident)
+        return incidents
+
+    def dedup(raw):
+        incidents = engine._deduplicate([Incident.from_json(i) for i in raw])
+        return cluster(engine._filter_by_time(incidents))
+
+    def score(incidents):
+        return engine._enrich_and_score(incidents)
+
+    def serialize(incidents):
+        engine.generate_feeds(incidents)
+        return incidents
+
+    return [('fetch', fetch), ('parse', parse), ('classify', classify),
+            ('dedup', dedup), ('score', score), ('serialize', serialize)]
+
+
+def end_to_end(documents: Dict[str, bytes], server: StubFeedServer, workdir: Path, transport: str,
+               limit: int) -> List:
+    engine = new_engine(workdir)
+    if transport == 'memory':
+        engine.urlopen = memory_urlopen(documents)
+        urls = {name: f'memory://bench/{name}' for name in documents}
+    else:
+        urls = {name: server.doc_url(name) for name in documents}
+    engine.sources = [FeedSource(name, url, item_limit=limit, timeout=600) for name, url in urls.items()]
+    return engine.run_cycle()
+
+
+def run_size(documents: Dict[str, bytes], transport: str, repeat: int, memory: bool) -> Dict[str, Dict]:
+    """Per-stage {items, out, seconds, throughput, peak_bytes} for one document set"""
+    results: Dict[str, Dict] = {}
+    with StubFeedServer(documents) as server, tempfile.TemporaryDirectory() as tmp, \
+            contextlib.redirect_stdout(io.StringIO()):
+        limit = 10 ** 9
+        passes = [(n, False) for n in range(repeat)] + ([(repeat, True)] if memory else [])
+        for n, traced in passes:
+            workdir = Path(tmp) / f'pass-{n}'
+            if traced:
+                tracemalloc.start()
+
+            value, total = None, None
+            for stage, fn in staged_pipeline(documents, server, workdir):
+                if traced:
+                    tracemalloc.reset_peak()
+                    base = tracemalloc.get_traced_memory()[0]
+                t0 = time.perf_counter()
+                out = fn(value)
+                elapsed = time.perf_counter() - t0
+                if stage == 'parse':
+                    total = len(out)
+                record = results.setdefault(stage, {'seconds': float('inf')})
+                if traced:
+                    record['peak_bytes'] = tracemalloc.get_traced_memory()[1] - base
+                else:
+                    record['seconds'] = min(record['seconds'], elapsed)
+                    record['items'] = len(value) if value is not None else None
+                    record['out'] = len(out)
+                value = out
+            # Documents in / out of fetch and into parse are counted in items
+            results['fetch']['items'] = results['fetch']['out'] = results['parse']['items'] = total
+
+            if traced:
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+            t0 = time.perf_counter()
+            incidents = end_to_end(documents, server, Path(tmp) / f'e2e-{n}', transport, limit)
+            elapsed = time.perf_counter() - t0
+            record = results.setdefault('e2e', {'seconds': float('inf')})
+            if traced:
+                record['peak_bytes'] = tracemalloc.get_traced_memory()[1] - base
+                tracemalloc.stop()
+            else:
+                record['seconds'] = min(record['seconds'], elapsed)
+                record['items'] = total
+                record['out'] = len(incidents)
+
+    for record in results.values():
+        record['seconds'] = round(record['seconds'], 6)
+        record['throughput'] = round(record['items'] / record['seconds'], 1) if record['seconds'] else None
+    return results
+
+
+# -- reporting -------------------------------------------------------------
+
+def compare(current: Dict, baseline: Optional[Dict], tolerance: float) -> List[str]:
+    """'size/stage: why' for every stage slower or hungrier than the baseline allows"""
+    regressions = []
+    if not baseline:
+        return regressions
+    for size, stages in current.items():
+        for stage, record in stages.items():
+            base = baseline.get(size, {}).get(stage)
+            if not base:
+                continue
+            if (record['seconds'] >= MIN_COMPARABLE_SECONDS and base.get('throughput')
+                    and record['throughput'] < base['throughput'] * (1 - tolerance)):
+                regressions.append(f"{size}/{stage}: throughput {record['throughput']:,.0f}/s "
+                                   f"vs baseline {base['throughput']:,.0f}/s")
+            if (record.get('peak_bytes') and base.get('peak_bytes') and record['peak_bytes'] > 2 ** 20
+                    and record['peak_bytes'] > base['peak_bytes'] * (1 + tolerance)):
+                regressions.append(f"{size}/{stage}: peak {record['peak_bytes'] / 2 ** 20:.1f}MB "
+                                   f"vs baseline {base['peak_bytes'] / 2 ** 20:.1f}MB")
+    return regressions
+
+
+def print_table(size: str, documents: Dict[str, bytes], results: Dict, baseline: Optional[Dict]):
+    total_bytes = sum(len(d) for d in documents.values())
+    print(f"\nsize={size}  ({len(documents)} documents, {total_bytes / 2 ** 20:.1f} MB)")
+    print(f"  {'stage':<10}{'items':>9}{'out':>9}{'time':>10}{'items/s':>13}{'peak':>10}{'vs base':>9}")
+    base = (baseline or {}).get(size, {})
+    for stage in STAGES:
+        record = results.get(stage)
+        if not record:
+            continue
+        peak = f"{record['peak_bytes'] / 2 ** 20:8.1f}MB" if 'peak_bytes' in record else f"{'-':>10}"
+        ratio = '-'
+        if base.get(stage, {}).get('throughput') and record['throughput']:
+            ratio = f"{record['throughput'] / base[stage]['throughput']:.2f}x"
+        print(f"  {stage:<10}{record['items'] or 0:>9,}{record['out']:>9,}{record['seconds']:>9.3f}s"
+              f"{record['throughput'] or 0:>13,.0f}{peak}{ratio:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default=','.join(map(str, SIZES)), help='comma-separated item counts')
+    parser.add_argument('--fixtures', type=Path, help='replay recorded feed documents from this directory')
+    parser.add_argument('--transport', choices=('memory', 'http'), default='memory',
+                        help='how the e2e run fetches: injected in-memory fetcher or the stub server')
+    parser.add_argument('--repeat', type=int, default=3, help='timed passes per size (best is kept)')
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc pass')
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help='store these results as the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown / growth (fraction)')
+    parser.add_argument('--strict', action='store_true', help='exit 1 when a regression is found')
+    parser.add_argument('--json', type=Path, help='also write the results here')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline.exists() and not args.save_baseline:
+        stored = json.loads(args.baseline.read_text(encoding='utf-8'))
+        baseline = stored['results']
+        if stored['meta'].get('transport') != args.transport:
+            # e2e timings are only comparable over the same transport
+            baseline = {size: {k: v for k, v in stages.items() if k != 'e2e'} for size, stages in baseline.items()}
+
+    if args.fixtures:
+        sets = {f'recorded:{args.fixtures.name}': recorded_documents(args.fixtures)}
+    else:
+        sets = {str(size): synthetic_documents(size) for size in map(int, args.sizes.split(','))}
+
+    print(f"python {platform.python_version()} on {platform.machine()} · transport={args.transport} "
+          f"· best of {args.repeat}")
+    results = {}
+    for size, documents in sets.items():
+        results[size] = run_size(documents, args.transport, max(1, args.repeat), not args.no_memory)
+        print_table(size, documents, results[size], baseline)
+
+    document = {
+        'meta': {
+            'created': datetime.utcnow().isoformat() + 'Z',
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'transport': args.transport,
+            'repeat': args.repeat
+        },
+        'results': results
+    }
+    if args.json:
+        args.json.write_text(json.dumps(document, indent=2), encoding='utf-8')
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(document, indent=2) + '\n', encoding='utf-8')
+        print(f"\nbaseline saved to {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    if baseline is None:
+        print("\nno baseline to compare against (run with --save-baseline)")
+    elif regressions:
+        print(f"\n⚠️  {len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        if args.strict:
+            sys.exit(1)
+    else:
+        print(f"\n✅ no regressions beyond {args.tolerance:.0%} against the baseline")
+
+
+if __name__ == '__main__':
+    main()
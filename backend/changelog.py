@@ -0,0 +1,140 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Versioned feed change log
+© 2026 CyberDudeBivash Pvt Ltd
+
+Every feed generation that changes the incident set bumps a monotonically
+increasing version and records which incident IDs were added, updated or
+expired. Clients that remember the version they last saw can then fetch
+only the changes since then instead of the whole feed.
+
+Only content changes count: hours_ago / freshness_score drift every run
+and are recomputed by clients from the timestamp.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from feed_writer import atomic_open
+
+# Generations kept for /delta (24 hours of 5-minute cycles)
+MAX_GENERATIONS = 288
+
+# Generations embedded in the static threat-feed-delta.json; older clients
+# fall back to the full feed
+STATIC_GENERATIONS = 12
+
+VOLATILE_FIELDS = ('hours_ago', 'freshness_score')
+
+
+def as_json(incident) -> Dict:
+    """Feed-schema dict for an Incident (plain dicts pass through)"""
+    return incident.to_json() if hasattr(incident, 'to_json') else incident
+
+
+def fingerprint(incident) -> str:
+    """Content hash of an incident, ignoring fields that drift with time"""
+    stable = {k: v for k, v in as_json(incident).items() if k not in VOLATILE_FIELDS}
+    return hashlib.md5(json.dumps(stable, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def compute_delta(generations: List[Dict], version: int, since: int,
+                  incidents_by_id: Dict[str, Dict]) -> Dict:
+    """Net changes after `since`; reset=True when the client is too far behind"""
+    oldest = generations[0]['version'] if generations else version + 1
+    if since > version or since < oldest - 1:
+        return {'version': version, 'since': since, 'reset': True}
+
+    # Last operation per ID wins: still present -> upsert, gone -> expired
+    touched = {}
+    for generation in generations:
+        if generation['version'] <= since:
+            continue
+        for op in ('added', 'updated', 'expired'):
+            for incident_id in generation[op]:
+                touched[incident_id] = op
+
+    upserts = [as_json(incidents_by_id[i]) for i in touched if i in incidents_by_id]
+    expired = [i for i in touched if i not in incidents_by_id]
+    return {
+        'version': version,
+        'since': since,
+        'reset': False,
+        'upserts': upserts,
+        'expired': expired
+    }
+
+
+class ChangeLog:
+    """Persistent generation log backed by a JSON state file"""
+
+    def __init__(self, path: Path, max_generations: int = MAX_GENERATIONS):
+        self.path = Path(path)
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self.max_generations = max_generations
+
+        state = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            pass
+        self.version: int = state.get('version', 0)
+        self.fingerprints: Dict[str, str] = state.get('fingerprints', {})
+        self.generations: List[Dict] = state.get('generations', [])
+
+    def record(self, incidents: List[Dict]) -> Optional[Dict]:
+        """Diff against the previous generation; returns the new generation or None if unchanged"""
+        current = {i['id']: fingerprint(i) for i in incidents}
+
+        added = [i for i in current if i not in self.fingerprints]
+        updated = [i for i, fp in current.items() if i in self.fingerprints and self.fingerprints[i] != fp]
+        expired = [i for i in self.fingerprints if i not in current]
+        if not (added or updated or expired):
+            return None
+
+        self.version += 1
+        generation = {
+            'version': self.version,
+            'generated': datetime.utcnow().isoformat() + 'Z',
+            'added': added,
+            'updated': updated,
+            'expired': expired
+        }
+        self.generations.append(generation)
+        del self.generations[:-self.max_generations]
+        self.fingerprints = current
+        self._save()
+        return generation
+
+    def delta(self, since: int, incidents: List[Dict]) -> Dict:
+        """Changes since a client's version"""
+        return compute_delta(self.generations, self.version, since, {i['id']: i for i in incidents})
+
+    def static_document(self, incidents: List[Dict], generations: int = STATIC_GENERATIONS) -> Dict:
+        """threat-feed-delta.json: recent generations plus the incidents they touch.
+
+        A client at version v applies every generation newer than v; if v is
+        older than the first listed generation it reloads the full feed.
+        """
+        recent = self.generations[-generations:] if generations else []
+        by_id = {i['id']: i for i in incidents}
+        touched = {i for g in recent for op in ('added', 'updated') for i in g[op]}
+        return {
+            'generated': datetime.utcnow().isoformat() + 'Z',
+            'version': self.version,
+            'oldest_version': recent[0]['version'] - 1 if recent else self.version,
+            'generations': recent,
+            'incidents': {i: as_json(by_id[i]) for i in touched if i in by_id}
+        }
+
+    def _save(self):
+        state = {
+            'version': self.version,
+            'fingerprints': self.fingerprints,
+            'generations': self.generations
+        }
+        with atomic_open(self.path) as f:
+            json.dump(state, f, separators=(',', ':'))
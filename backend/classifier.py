@@ -0,0 +1,208 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Compiled keyword classifier
+© 2026 CyberDudeBivash Pvt Ltd
+
+Relevance, category and severity are decided in one pass per text. Every
+keyword in the rule table is compiled into a single prefix-trie regex inside
+a zero-width lookahead, so each position reports the longest keyword starting
+there; keywords contained in a matched keyword are implied by it. This keeps
+the engine's substring semantics ('apt' still matches 'adapt').
+
+Headlines share a small vocabulary, so the regex runs once per distinct
+whitespace token and the folded verdict is memoised; a text is then one
+split() plus dictionary lookups. Keywords that contain a space can span
+tokens and are checked against the whole text.
+"""
+
+import re
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+
+Classification = namedtuple('Classification', ['relevant', 'category', 'severity'])
+
+# Rule table. Category and severity rules are ordered: the first rule that
+# matches wins, so list more specific / more severe keywords first.
+DEFAULT_RULES = {
+    'relevance': [
+        'breach', 'ransomware', 'malware', 'hack', 'exploit',
+        'vulnerability', 'attack', 'zero-day', 'apt', 'threat',
+        'phishing', 'trojan', 'backdoor', 'botnet'
+    ],
+    'category': [
+        ('breach', 'Data Breach'),
+        ('leak', 'Data Breach'),
+        ('ransomware', 'Ransomware'),
+        ('malware', 'Malware'),
+        ('zero-day', 'Zero-Day'),
+        ('0day', 'Zero-Day'),
+        ('apt', 'APT'),
+        ('nation', 'APT'),
+        ('vulnerability', 'CVE'),
+        ('cve', 'CVE')
+    ],
+    'severity': [
+        ('critical', 'CRITICAL'),
+        ('zero-day', 'CRITICAL'),
+        ('actively exploited', 'CRITICAL'),
+        ('urgent', 'CRITICAL'),
+        ('emergency', 'CRITICAL'),
+        ('major', 'HIGH'),
+        ('massive', 'HIGH'),
+        ('widespread', 'HIGH'),
+        ('severe', 'HIGH'),
+        ('serious', 'HIGH')
+    ],
+    'default_category': 'Incident',
+    'default_severity': 'MEDIUM'
+}
+
+_NO_RANK = 1 << 30
+_NO_MATCH = (False, _NO_RANK, _NO_RANK)
+
+# Distinct tokens remembered per classifier before the memo is reset
+MEMO_LIMIT = 200000
+
+
+def _trie_regex(keywords: List[str]) -> str:
+    """Alternation of keywords factored into a prefix trie (longest match first)"""
+    trie: Dict = {}
+    for kw in keywords:
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def emit(node: Dict) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        if len(branches) == 1 and '' not in node:
+            return branches[0]
+        group = '(?:' + '|'.join(branches) + ')'
+        return group + '?' if '' in node else group
+
+    return emit(trie)
+
+
+class KeywordClassifier:
+    """Single-pass relevance / category / severity classifier"""
+
+    def __init__(self, rules: Optional[Dict] = None, category_hints: Optional[Dict[str, str]] = None):
+        self.rules = rules or DEFAULT_RULES
+        self.category_hints = dict(category_hints or {})
+        self.default_category = self.rules['default_category']
+        self.default_severity = self.rules['default_severity']
+        self._hinted: Dict[Tuple, 'KeywordClassifier'] = {}
+
+        # Feed hints outrank the generic category chain
+        categories = list(self.category_hints.items()) + list(self.rules['category'])
+        severities = list(self.rules['severity'])
+        relevance = set(self.rules['relevance'])
+
+        # keyword -> (relevant, category rank, severity rank)
+        table: Dict[str, List] = {}
+        for kw in relevance:
+            table.setdefault(kw, [False, _NO_RANK, _NO_RANK])[0] = True
+        for rank, (kw, _) in enumerate(categories):
+            entry = table.setdefault(kw, [False, _NO_RANK, _NO_RANK])
+            entry[1] = min(entry[1], rank)
+        for rank, (kw, _) in enumerate(severities):
+            entry = table.setdefault(kw, [False, _NO_RANK, _NO_RANK])
+            entry[2] = min(entry[2], rank)
+
+        self._categories = [category for _, category in categories]
+        self._severities = [severity for _, severity in severities]
+
+        # A matched keyword implies every keyword it contains, folded into
+        # one precomputed verdict per keyword
+        keywords = sorted(table, key=len, reverse=True)
+        self._verdicts: Dict[str, Tuple[bool, int, int]] = {}
+        for kw in keywords:
+            implied = [table[other] for other in keywords if other in kw]
+            self._verdicts[kw] = (
+                any(v[0] for v in implied),
+                min(v[1] for v in implied),
+                min(v[2] for v in implied)
+            )
+
+        self._pattern = re.compile('(?=(' + _trie_regex(keywords) + '))')
+        self._phrases = [kw for kw in keywords if ' ' in kw]
+        self._memo: Dict[str, Tuple[bool, int, int]] = {}
+
+    def with_hints(self, category_hints: Optional[Dict[str, str]]) -> 'KeywordClassifier':
+        """Classifier for a feed's category hints (compiled once per hint set)"""
+        if not category_hints:
+            return self
+        key = tuple(category_hints.items())
+        classifier = self._hinted.get(key)
+        if classifier is None:
+            classifier = KeywordClassifier(self.rules, category_hints)
+            self._hinted[key] = classifier
+        return classifier
+
+    def _fold(self, keywords) -> Tuple[bool, int, int]:
+        """Combine the verdicts of matched keywords"""
+        relevant, cat_rank, sev_rank = False, _NO_RANK, _NO_RANK
+        for kw in keywords:
+            r, c, s = self._verdicts[kw]
+            relevant = relevant or r
+            cat_rank = min(cat_rank, c)
+            sev_rank = min(sev_rank, s)
+        return relevant, cat_rank, sev_rank
+
+    def _token_verdict(self, token: str) -> Tuple[bool, int, int]:
+        if len(self._memo) >= MEMO_LIMIT:
+            self._memo.clear()
+        verdict = self._fold(self._pattern.findall(token))
+        if verdict == _NO_MATCH:
+            verdict = _NO_MATCH
+        self._memo[token] = verdict
+        return verdict
+
+    def _scan(self, text: str) -> Tuple[bool, int, int]:
+        relevant, cat_rank, sev_rank = _NO_MATCH
+        if not text:
+            return _NO_MATCH
+
+        text = text.lower()
+        memo_get = self._memo.get
+        for token in text.split():
+            verdict = memo_get(token)
+            if verdict is None:
+                verdict = self._token_verdict(token)
+            if verdict is _NO_MATCH:
+                continue
+            r, c, s = verdict
+            if r:
+                relevant = True
+            if c < cat_rank:
+                cat_rank = c
+            if s < sev_rank:
+                sev_rank = s
+
+        for phrase in self._phrases:
+            if phrase in text:
+                r, c, s = self._verdicts[phrase]
+                relevant = relevant or r
+                cat_rank = min(cat_rank, c)
+                sev_rank = min(sev_rank, s)
+
+        return relevant, cat_rank, sev_rank
+
+    def classify(self, title: str, description: str = '') -> Classification:
+        """Classify a headline; the description only decides what the title leaves open"""
+        relevant, cat_rank, sev_rank = self._scan(title)
+
+        if description and (not relevant or cat_rank == _NO_RANK or sev_rank == _NO_RANK):
+            d_relevant, d_cat, d_sev = self._scan(description)
+            relevant = relevant or d_relevant
+            if cat_rank == _NO_RANK:
+                cat_rank = d_cat
+            if sev_rank == _NO_RANK:
+                sev_rank = d_sev
+
+        return Classification(
+            relevant,
+            self._categories[cat_rank] if cat_rank != _NO_RANK else self.default_category,
+            self._severities[sev_rank] if sev_rank != _NO_RANK else self.default_severity
+        )
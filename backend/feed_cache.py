@@ -0,0 +1,78 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Conditional HTTP response cache
+© 2026 CyberDudeBivash Pvt Ltd
+
+Persists ETag / Last-Modified validators and the parsed incidents for every
+feed URL, so unchanged feeds cost one 304 round-trip instead of a full
+download and re-parse. Feeds are parsed while streaming, so the raw body is
+never kept.
+"""
+
+import hashlib
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from feed_writer import atomic_open
+
+
+class FeedCache:
+    """On-disk cache of feed responses keyed by URL"""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(exist_ok=True, parents=True)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def _meta_path(self, url: str) -> Path:
+        return self.cache_dir / f"{self._key(url)}.json"
+
+    def _read_meta(self, url: str) -> Dict:
+        try:
+            with open(self._meta_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Validator headers for a conditional GET (empty if nothing usable is cached)"""
+        meta = self._read_meta(url)
+        if meta.get('items') is None:
+            return {}
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def store(self, url: str, items: List[Dict], etag: Optional[str], last_modified: Optional[str]):
+        """Store the validators of a 200 response with the incidents parsed from it"""
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched': datetime.utcnow().isoformat() + 'Z',
+            'items': items
+        }
+        with atomic_open(self._meta_path(url)) as f:
+            json.dump(meta, f, ensure_ascii=False)
+        with self._lock:
+            self.misses += 1
+
+    def load_items(self, url: str) -> Optional[List[Dict]]:
+        """Parsed incidents for an unchanged (304) feed, or None if nothing is cached"""
+        items = self._read_meta(url).get('items')
+        if items is None:
+            return None
+        with self._lock:
+            self.hits += 1
+        return [dict(i) for i in items]
@@ -0,0 +1,86 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Streaming RSS/Atom parser
+© 2026 CyberDudeBivash Pvt Ltd
+
+Feeds response bytes into an XMLPullParser as they arrive from the socket
+and yields each <item> / <entry> as soon as it closes. Completed elements
+are detached from the tree, so memory stays flat however long the feed is,
+and the caller can stop reading the moment it has enough items.
+"""
+
+import xml.etree.ElementTree as ET
+from typing import BinaryIO, Dict, Iterator
+
+CHUNK_SIZE = 16384
+
+ITEM_TAGS = {'item', 'entry'}
+TITLE_TAGS = {'title'}
+LINK_TAGS = {'link'}
+DESCRIPTION_TAGS = {'description', 'summary', 'content'}
+DATE_TAGS = {'pubDate', 'published', 'updated', 'date'}
+
+
+def _local(tag: str) -> str:
+    """Strip the {namespace} prefix from a tag"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _item_fields(elem: ET.Element) -> Dict[str, str]:
+    """Extract title/link/description/pub_date from an RSS item or Atom entry"""
+    fields = {'title': None, 'link': '', 'description': '', 'pub_date': ''}
+
+    for child in elem:
+        name = _local(child.tag)
+        text = child.text or ''
+        if name in TITLE_TAGS and fields['title'] is None:
+            fields['title'] = text
+        elif name in LINK_TAGS:
+            # Atom: prefer the rel="alternate" (or rel-less) href
+            href = child.get('href')
+            if href is not None:
+                if not fields['link'] or child.get('rel', 'alternate') == 'alternate':
+                    fields['link'] = href
+            elif not fields['link']:
+                fields['link'] = text
+        elif name in DESCRIPTION_TAGS and not fields['description']:
+            fields['description'] = text
+        elif name in DATE_TAGS and not fields['pub_date']:
+            fields['pub_date'] = text
+
+    return fields
+
+
+def iter_feed_items(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Dict[str, str]]:
+    """Yield feed items from a byte stream as they complete.
+
+    Items without a <title> are yielded with title None so callers can count
+    them against their limits. Closing the generator stops reading.
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    stack = []
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if chunk:
+            parser.feed(chunk)
+        else:
+            parser.close()
+
+        for event, elem in parser.read_events():
+            if event == 'start':
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            if _local(elem.tag) not in ITEM_TAGS:
+                continue
+
+            fields = _item_fields(elem)
+            # Detach the finished item so the tree never grows
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+            yield fields
+
+        if not chunk:
+            return
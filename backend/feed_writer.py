@@ -0,0 +1,216 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Feed writers
+© 2026 CyberDudeBivash Pvt Ltd
+
+The published feeds are written without building the whole document in
+memory. Each incident is encoded once, with compact separators, and then
+streamed into every artifact that carries it:
+
+    threat-feed.json            full feed, one incident per line
+    threat-feed.ndjson          optional, one incident per line, no envelope
+    threat-feed/<category>.json category shards   (e.g. ransomware.json)
+    threat-feed/severity-<s>.json severity shards (e.g. severity-critical.json)
+    threat-feed/<hour>.json     hourly shards     (e.g. 2026-10-18T14.json)
+    threat-feed/index.json      manifest of the shards above
+
+With compression on, every file also gets .gz and .br siblings
+(threat-feed.json.gz, ...). Static hosts that serve precompressed files
+(nginx gzip_static / brotli_static, most CDNs) can then send them without
+compressing per request. Brotli needs the optional `brotli` package.
+
+Shards keep the full feed's {metadata, incidents} shape, so a client that
+only shows one category (the dashboard's filter buttons) can fetch that
+shard instead of the whole window. Every file is written to a temp file and
+renamed into place, and the manifest is replaced only after the shards it
+lists exist.
+"""
+
+import gzip
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, IO, Iterable, Iterator, List, Optional, Set
+
+from timestamps import epoch_to_iso
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPACT = (',', ':')
+
+SHARD_DIR = 'threat-feed'
+MANIFEST = 'index.json'
+
+# Static files are compressed once per run and served many times, so the
+# slowest, smallest settings pay off
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+
+CHUNK_SIZE = 1 << 16
+
+
+@contextmanager
+def atomic_open(path: Path, mode: str = 'w') -> Iterator[IO]:
+    """Open a temp file beside path for writing and rename it over path on success.
+
+    Readers (the dashboard's periodic fetch, a static file server) see either
+    the previous file or the new one, never a partial write.
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, mode, encoding=None if 'b' in mode else 'utf-8') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _chunks(path: Path) -> Iterator[bytes]:
+    with open(path, 'rb') as f:
+        yield from iter(lambda: f.read(CHUNK_SIZE), b'')
+
+
+def sync_compressed(path: Path, compress: bool = True) -> Dict[str, int]:
+    """Rewrite path's .gz / .br siblings from path, or remove them when compress is off.
+
+    A sibling that cannot be written (.br without the brotli package) is
+    removed rather than left stale. Returns the size of each sibling written.
+    """
+    path = Path(path)
+    gz_path, br_path = (path.with_name(path.name + suffix) for suffix in COMPRESSED_SUFFIXES)
+    sizes = {}
+    if compress:
+        # No name or mtime in the header: unchanged input, identical bytes
+        with atomic_open(gz_path, 'wb') as f:
+            with gzip.GzipFile(filename='', mode='wb', fileobj=f, compresslevel=GZIP_LEVEL, mtime=0) as gz:
+                for chunk in _chunks(path):
+                    gz.write(chunk)
+        sizes['gzip'] = gz_path.stat().st_size
+    else:
+        gz_path.unlink(missing_ok=True)
+
+    if compress and brotli is not None:
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        with atomic_open(br_path, 'wb') as f:
+            for chunk in _chunks(path):
+                f.write(compressor.process(chunk))
+            f.write(compressor.finish())
+        sizes['br'] = br_path.stat().st_size
+    else:
+        br_path.unlink(missing_ok=True)
+    return sizes
+
+
+def remove_stale(directory: Path, keep: Set[str], pattern: str = '*'):
+    """Delete files matching pattern, and their compressed siblings, unless named in keep"""
+    for path in Path(directory).glob(pattern):
+        name = path.name
+        for suffix in COMPRESSED_SUFFIXES:
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+        if name not in keep and not name.startswith('.'):
+            path.unlink(missing_ok=True)
+
+
+def encode_incidents(incidents: Iterable, now: Optional[float] = None) -> Iterator[str]:
+    """Compact JSON text of each incident, in order"""
+    dumps = json.JSONEncoder(separators=COMPACT, ensure_ascii=False).encode
+    for incident in incidents:
+        yield dumps(incident.to_json(now) if hasattr(incident, 'to_json') else incident)
+
+
+def write_feed(path: Path, metadata: Dict, encoded: Iterable[str], compress: bool = False) -> int:
+    """Stream a {metadata, incidents} document; returns its size in bytes"""
+    with atomic_open(path) as f:
+        f.write('{"metadata":' + json.dumps(metadata, separators=COMPACT, ensure_ascii=False) + ',"incidents":[')
+        separator = '\n'
+        for line in encoded:
+            f.write(separator)
+            f.write(line)
+            separator = ',\n'
+        f.write('\n]}\n')
+    sync_compressed(path, compress)
+    return Path(path).stat().st_size
+
+
+def write_ndjson(path: Path, encoded: Iterable[str], compress: bool = False) -> int:
+    """One incident per line, no envelope; returns its size in bytes"""
+    with atomic_open(path) as f:
+        for line in encoded:
+            f.write(line)
+            f.write('\n')
+    sync_compressed(path, compress)
+    return Path(path).stat().st_size
+
+
+def slug(value: str) -> str:
+    """Shard file stem for a category or severity name"""
+    return re.sub(r'[^a-z0-9]+', '-', value.lower()).strip('-') or 'other'
+
+
+def hour_key(epoch: int) -> str:
+    """Hourly shard key, e.g. 2026-10-18T14"""
+    return epoch_to_iso(epoch)[:13]
+
+
+def write_shards(shard_dir: Path, metadata: Dict, incidents: List, encoded: List[str],
+                 compress: bool = False) -> Dict:
+    """Write category / severity / hourly shards plus their manifest.
+
+    incidents and encoded are parallel lists in feed (rank) order; every
+    shard keeps that order. Shards left over from earlier runs (hours that
+    have rolled out of the window, categories that emptied) are removed
+    once the new manifest is in place. Returns the manifest.
+    """
+    shard_dir = Path(shard_dir)
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    groups: Dict[str, Dict[str, List[int]]] = {'categories': {}, 'severities': {}, 'hours': {}}
+    for pos, incident in enumerate(incidents):
+        groups['categories'].setdefault(incident['category'], []).append(pos)
+        groups['severities'].setdefault(incident['severity'], []).append(pos)
+        groups['hours'].setdefault(hour_key(incident['epoch']), []).append(pos)
+
+    file_names = {
+        'categories': lambda name: f"{slug(name)}.json",
+        'severities': lambda name: f"severity-{slug(name)}.json",
+        'hours': lambda name: f"{name}.json"
+    }
+
+    manifest = {
+        'generated': metadata.get('generated'),
+        'feed_version': metadata.get('feed_version'),
+        'total_incidents': len(incidents),
+        'categories': {},
+        'severities': {},
+        'hours': {}
+    }
+    written = set()
+    for kind, shards in groups.items():
+        for name, positions in shards.items():
+            file_name = file_names[kind](name)
+            if file_name in written:
+                # Two names slugging to the same file: keep the first
+                continue
+            shard_meta = dict(metadata, shard=name, total_incidents=len(positions))
+            size = write_feed(shard_dir / file_name, shard_meta, (encoded[p] for p in positions), compress)
+            manifest[kind][name] = {'path': file_name, 'count': len(positions), 'bytes': size}
+            written.add(file_name)
+
+    with atomic_open(shard_dir / MANIFEST) as f:
+        json.dump(manifest, f, separators=COMPACT, ensure_ascii=False)
+    sync_compressed(shard_dir / MANIFEST, compress)
+
+    remove_stale(shard_dir, written | {MANIFEST}, '*.json*')
+
+    return manifest
@@ -0,0 +1,175 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Pre-rendered HTML fragments
+© 2026 CyberDudeBivash Pvt Ltd
+
+The dashboard and the sidebar widget can show their first incidents
+without downloading a feed and templating it in the browser. Each run
+renders their markup once, in pages that are ready to insert with
+innerHTML:
+
+    fragments/all-1.html             dashboard cards, PAGE_SIZE per page, feed order
+    fragments/<category>-1.html      one category filter (e.g. ransomware-1.html)
+    fragments/severity-<s>-1.html    one severity filter (e.g. severity-critical-1.html)
+    fragments/widget-1.html          sidebar items, WIDGET_PAGE_SIZE per page
+    fragments/index.json             pages and counts per filter
+
+Filters with more than MAX_PAGES pages stop there. Clients load the JSON
+shard for the rest. Relative times ("3 hours ago") are rendered for the
+moment of generation and carry data-epoch, so a client can refresh them
+without re-rendering. A page whose markup did not change is not rewritten,
+and neither are its compressed siblings.
+"""
+
+import json
+import time
+from html import escape
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from feed_writer import COMPACT, atomic_open, remove_stale, slug, sync_compressed
+
+FRAGMENT_DIR = 'fragments'
+INDEX = 'index.json'
+
+PAGE_SIZE = 24
+WIDGET_PAGE_SIZE = 10
+MAX_PAGES = 20
+WIDGET_PAGES = 5
+
+
+def _hours_ago(epoch: int, now: float) -> int:
+    return max(0, int((now - epoch) / 3600))
+
+
+def _dashboard_time(hours: int) -> str:
+    if hours < 1:
+        return 'Just now'
+    if hours == 1:
+        return '1 hour ago'
+    return f"{hours} hours ago"
+
+
+def _widget_time(hours: int) -> str:
+    if hours < 1:
+        return 'Just now'
+    if hours == 1:
+        return '1 hour ago'
+    return f"{hours}h ago"
+
+
+def render_card(incident, now: float) -> str:
+    """One dashboard card, as dashboard.js renders it"""
+    severity = escape(incident['severity'])
+    url = incident.get('url')
+    link = (f'<a href="{escape(url)}" class="threat-link" target="_blank" rel="noopener">View Source →</a>'
+            if url else '')
+    return (
+        f'<div class="threat-card severity-{severity}">'
+        f'<div class="threat-header">'
+        f'<span class="severity-badge severity-{severity}">{severity}</span>'
+        f'<span class="category-badge">{escape(incident["category"])}</span>'
+        f'</div>'
+        f'<h3 class="threat-title">{escape(incident["title"])}</h3>'
+        f'<p class="threat-description">{escape(incident.get("description") or "No description available.")}</p>'
+        f'<div class="threat-meta">'
+        f'<span class="threat-source">📡 {escape(incident["source"])}</span>'
+        f'<span class="threat-time" data-epoch="{incident["epoch"]}">'
+        f'🕐 {_dashboard_time(_hours_ago(incident["epoch"], now))}</span>'
+        f'</div>'
+        f'{link}'
+        f'</div>\n'
+    )
+
+
+def render_widget_item(incident, now: float) -> str:
+    """One sidebar item, as widget.js renders it (the click target is data-url)"""
+    return (
+        f'<div class="cdb-threat-item" data-url="{escape(incident.get("url") or "")}">'
+        f'<div class="cdb-threat-header-row">'
+        f'<span><span class="cdb-severity-dot {escape(incident["severity"].lower())}"></span></span>'
+        f'<span class="cdb-category-mini">{escape(incident["category"])}</span>'
+        f'</div>'
+        f'<div class="cdb-threat-title-mini">{escape(incident["title"][:80])}</div>'
+        f'<div class="cdb-threat-time-mini" data-epoch="{incident["epoch"]}">'
+        f'🕐 {_widget_time(_hours_ago(incident["epoch"], now))}</div>'
+        f'</div>\n'
+    )
+
+
+def _write_if_changed(path: Path, html: str, compress: bool) -> bool:
+    try:
+        if path.read_text(encoding='utf-8') == html:
+            # Siblings only need work when compression was switched on or off
+            if compress != path.with_name(path.name + '.gz').exists():
+                sync_compressed(path, compress)
+            return False
+    except OSError:
+        pass
+    with atomic_open(path) as f:
+        f.write(html)
+    sync_compressed(path, compress)
+    return True
+
+
+def _write_pages(fragment_dir: Path, stem: str, incidents: List, render: Callable, page_size: int,
+                 max_pages: int, now: float, compress: bool, written: Dict[str, bool]) -> Dict:
+    """Write stem-1.html ... for incidents; returns the index entry"""
+    pages = []
+    for start in range(0, min(len(incidents), page_size * max_pages), page_size):
+        name = f"{stem}-{len(pages) + 1}.html"
+        html = ''.join(render(incident, now) for incident in incidents[start:start + page_size])
+        written[name] = _write_if_changed(fragment_dir / name, html, compress)
+        pages.append(name)
+    return {'pages': pages, 'count': len(incidents)}
+
+
+def write_fragments(fragment_dir: Path, metadata: Dict, incidents: List, now: Optional[float] = None,
+                    compress: bool = False) -> Dict:
+    """Render every filter's pages and the widget's pages, then the index.
+
+    incidents is in feed (rank) order, which the widget shares. Pages
+    left over from earlier runs are removed once the new index is in place.
+    Returns the index; its 'rewritten' count (pages whose markup changed)
+    is not saved.
+    """
+    now = time.time() if now is None else now
+    fragment_dir = Path(fragment_dir)
+    fragment_dir.mkdir(parents=True, exist_ok=True)
+
+    by_category: Dict[str, List] = {}
+    by_severity: Dict[str, List] = {}
+    for incident in incidents:
+        by_category.setdefault(incident['category'], []).append(incident)
+        by_severity.setdefault(incident['severity'], []).append(incident)
+
+    written: Dict[str, bool] = {}
+
+    def pages(stem, members, render=render_card, page_size=PAGE_SIZE, max_pages=MAX_PAGES):
+        return _write_pages(fragment_dir, stem, members, render, page_size, max_pages, now, compress, written)
+
+    index = {
+        'generated': metadata.get('generated'),
+        'feed_version': metadata.get('feed_version'),
+        'total_incidents': len(incidents),
+        'page_size': PAGE_SIZE,
+        'widget_page_size': WIDGET_PAGE_SIZE,
+        'all': pages('all', incidents),
+        'widget': pages('widget', incidents, render_widget_item, WIDGET_PAGE_SIZE, WIDGET_PAGES),
+        'categories': {},
+        'severities': {}
+    }
+    stems = {'categories': slug, 'severities': lambda name: 'severity-' + slug(name)}
+    for kind, groups in (('categories', by_category), ('severities', by_severity)):
+        for name, members in groups.items():
+            stem = stems[kind](name)
+            if f"{stem}-1.html" in written:
+                # Two names slugging to the same stem (or to 'all'): keep the first
+                continue
+            index[kind][name] = pages(stem, members)
+
+    with atomic_open(fragment_dir / INDEX) as f:
+        json.dump(index, f, separators=COMPACT, ensure_ascii=False)
+    sync_compressed(fragment_dir / INDEX, compress)
+
+    remove_stale(fragment_dir, set(written) | {INDEX})
+    return dict(index, rewritten=sum(written.values()))
@@ -0,0 +1,121 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Incremental incident state store
+© 2026 CyberDudeBivash Pvt Ltd
+
+SQLite-backed rolling window that survives between runs. Incidents are keyed
+on the engine's MD5 title hash, so each run only has to score and persist
+the items it has never seen before and evict the ones that aged out.
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Set
+
+from models import Incident
+
+
+def incident_epoch(incident: Dict) -> float:
+    """Epoch seconds of an incident (parsed from its ISO timestamp for older records)"""
+    if 'epoch' in incident:
+        return incident['epoch']
+    try:
+        ts = incident['timestamp'].replace('Z', '+00:00')
+        dt = datetime.fromisoformat(ts)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+    except (KeyError, AttributeError, ValueError):
+        return datetime.now(timezone.utc).timestamp()
+
+
+def _record(incident: Incident) -> str:
+    """Stored JSON of an incident; unlike the feeds, keeps iocs = {} so a
+    reloaded incident with no IOCs is not extracted again"""
+    data = incident.to_json()
+    if incident.iocs is not None:
+        data['iocs'] = incident.iocs
+    return json.dumps(data, ensure_ascii=False)
+
+
+class IncidentStore:
+    """Persistent rolling window of processed incidents"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS incidents (
+            id         TEXT PRIMARY KEY,
+            ts         REAL NOT NULL,
+            first_seen REAL NOT NULL,
+            data       TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS incidents_ts ON incidents (ts);
+        CREATE TABLE IF NOT EXISTS aliases (
+            id           TEXT PRIMARY KEY,
+            canonical_id TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS aliases_canonical ON aliases (canonical_id);
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(self.SCHEMA)
+
+    def ids(self) -> Set[str]:
+        """IDs of every incident currently in the window, including merged aliases"""
+        ids = {row[0] for row in self.conn.execute('SELECT id FROM incidents')}
+        ids.update(row[0] for row in self.conn.execute('SELECT id FROM aliases'))
+        return ids
+
+    def add(self, incidents: List[Incident]) -> int:
+        """Insert unseen incidents; already-stored IDs are left untouched"""
+        now = datetime.now(timezone.utc).timestamp()
+        with self.conn:
+            cur = self.conn.executemany(
+                'INSERT OR IGNORE INTO incidents (id, ts, first_seen, data) VALUES (?, ?, ?, ?)',
+                [(i['id'], incident_epoch(i), now, _record(i)) for i in incidents]
+            )
+        return cur.rowcount
+
+    def update(self, incidents: List[Incident]):
+        """Rewrite stored incidents that changed after insertion"""
+        with self.conn:
+            self.conn.executemany(
+                'UPDATE incidents SET data = ? WHERE id = ?',
+                [(_record(i), i['id']) for i in incidents]
+            )
+
+    def alias(self, aliases: Dict[str, str]):
+        """Record near-duplicate IDs folded into a canonical incident"""
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO aliases (id, canonical_id) VALUES (?, ?)',
+                list(aliases.items())
+            )
+
+    def evict_before(self, cutoff: float) -> List[str]:
+        """Drop incidents older than the cutoff epoch; returns their IDs"""
+        expired = [row[0] for row in
+                   self.conn.execute('SELECT id FROM incidents WHERE ts < ?', (cutoff,))]
+        with self.conn:
+            self.conn.executemany('DELETE FROM incidents WHERE id = ?', [(i,) for i in expired])
+            self.conn.executemany('DELETE FROM aliases WHERE canonical_id = ?', [(i,) for i in expired])
+        return expired
+
+    def window(self) -> List[Incident]:
+        """All incidents in the rolling window"""
+        window = []
+        for ts, data in self.conn.execute('SELECT ts, data FROM incidents'):
+            incident = json.loads(data)
+            incident.setdefault('epoch', int(ts))
+            window.append(Incident.from_json(incident))
+        return window
+
+    def __len__(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM incidents').fetchone()[0]
+
+    def close(self):
+        self.conn.close()
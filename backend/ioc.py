@@ -0,0 +1,294 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - IOC extraction and index
+© 2026 CyberDudeBivash Pvt Ltd
+
+Indicators of compromise are pulled out of each incident's title and
+description once, when the incident first enters the window:
+
+    cve      CVE-2026-12345
+    ipv4     203.0.113.7            (ipv6 is validated with ipaddress)
+    domain   evil-updates.example   (defanged forms such as evil[.]example
+                                    and hxxp:// are refanged first)
+    md5 / sha1 / sha256             hex digests, by length
+    malware  canonical family name  (LockBit for "LockBit 3.0", "lockbit")
+
+Most words of a headline cannot be an indicator, so the text is split on
+whitespace and only tokens that could hold one (a dot, hyphen or colon, or
+32+ characters) are handed to a single precompiled alternation for CVEs,
+IPv4 addresses, hashes and domains. Malware aliases are looked up word by
+word in a table keyed on their first word. The result is kept on the
+incident (Incident.iocs) and published with it.
+
+IOCIndex is the inverted index over the rolling window (IOC -> incident
+IDs). The engine maintains it alongside the ranking: incidents are added
+as they arrive, re-indexed when a near-duplicate report adds indicators,
+and removed as they expire, so "which incidents mention this CVE / hash"
+is one dictionary lookup instead of a scan of the feed.
+"""
+
+import ipaddress
+import re
+import sys
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Report order of the kinds in an incident's iocs
+KINDS = ('cve', 'ipv4', 'ipv6', 'domain', 'md5', 'sha1', 'sha256', 'malware')
+
+# Canonical family -> aliases (matched case-insensitively as whole words;
+# "cobalt strike" also matches "Cobalt-Strike"). Names that are ordinary
+# words on their own ("Play", "Royal") are only matched with a qualifier.
+MALWARE_FAMILIES = {
+    'LockBit': ['lockbit'],
+    'BlackCat': ['blackcat', 'alphv'],
+    'Cl0p': ['cl0p', 'clop'],
+    'Conti': ['conti ransomware', 'conti group'],
+    'REvil': ['revil', 'sodinokibi'],
+    'Ryuk': ['ryuk'],
+    'Black Basta': ['black basta', 'blackbasta'],
+    'Akira': ['akira ransomware', 'akira group'],
+    'Play': ['play ransomware'],
+    'Royal': ['royal ransomware'],
+    'Rhysida': ['rhysida'],
+    'Medusa': ['medusa ransomware', 'medusalocker'],
+    'BianLian': ['bianlian'],
+    '8Base': ['8base'],
+    'Hive': ['hive ransomware'],
+    'WannaCry': ['wannacry', 'wannacrypt'],
+    'NotPetya': ['notpetya'],
+    'Emotet': ['emotet'],
+    'TrickBot': ['trickbot'],
+    'QakBot': ['qakbot', 'qbot', 'quakbot'],
+    'IcedID': ['icedid', 'bokbot'],
+    'Dridex': ['dridex'],
+    'Ursnif': ['ursnif', 'gozi'],
+    'ZeuS': ['zeus trojan', 'zeus panda'],
+    'Pikabot': ['pikabot'],
+    'DarkGate': ['darkgate'],
+    'Latrodectus': ['latrodectus'],
+    'Bumblebee': ['bumblebee loader', 'bumblebee malware'],
+    'GootLoader': ['gootloader'],
+    'SocGholish': ['socgholish'],
+    'Agent Tesla': ['agent tesla', 'agenttesla'],
+    'FormBook': ['formbook', 'xloader'],
+    'RedLine': ['redline stealer', 'redline infostealer'],
+    'Lumma': ['lumma stealer', 'lummac2'],
+    'Raccoon': ['raccoon stealer'],
+    'Vidar': ['vidar stealer'],
+    'AsyncRAT': ['asyncrat'],
+    'njRAT': ['njrat'],
+    'Remcos': ['remcos'],
+    'PlugX': ['plugx'],
+    'ShadowPad': ['shadowpad'],
+    'Cobalt Strike': ['cobalt strike', 'cobaltstrike'],
+    'Sliver': ['sliver c2', 'sliver implant'],
+    'Brute Ratel': ['brute ratel'],
+    'Mimikatz': ['mimikatz'],
+    'Mirai': ['mirai'],
+}
+
+# Dotted names that are file names or code, not domains
+NOT_TLDS = frozenset("""
+    bat bin cfg css dat dll dmg doc docx exe gif go gz htm html img ini iso jar jpg js json
+    jsp lnk log md msi php pdf png ps py rar rb scr sh so sys tar tgz tmp ts txt vbs xls xlsx
+    xml zip
+    """.split())
+
+_OCTET = r'(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)'
+
+# Everything that is not a malware name; alternatives are tried in order at
+# each position, so a CVE or an address is never read as a domain
+_IOC_RE = re.compile(r"""
+      (?P<cve>\bCVE-\d{4}-\d{4,7}\b)
+    | (?P<hash>\b[0-9a-f]{32}(?:[0-9a-f]{8}(?:[0-9a-f]{24})?)?\b)
+    | (?P<ipv4>(?<![\w.])(?:""" + _OCTET + r"""\.){3}""" + _OCTET + r"""(?![\w-]|\.\d))
+    | (?P<domain>(?<![\w@.-])(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,24}(?![\w-]|\.\w))
+    """, re.IGNORECASE | re.VERBOSE)
+
+_IPV6_RE = re.compile(r'(?<![\w:])(?:[0-9a-f]{0,4}:){2,7}[0-9a-f]{0,4}(?![\w:])', re.IGNORECASE)
+
+_REFANG = (('[.]', '.'), ('(.)', '.'), ('{.}', '.'), ('[dot]', '.'), ('(dot)', '.'),
+           ('hxxp', 'http'), ('[:]', ':'))
+
+_HASH_KINDS = {32: 'md5', 40: 'sha1', 64: 'sha256'}
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+_intern = sys.intern
+
+
+def refang(text: str) -> str:
+    """Undo the usual defanging (evil[.]com, hxxp://) so indicators match"""
+    if '[' in text or '(' in text or '{' in text or 'hxxp' in text:
+        for defanged, plain in _REFANG:
+            text = text.replace(defanged, plain)
+    return text
+
+
+def _may_hold_ioc(token: str) -> bool:
+    return '.' in token or '-' in token or ':' in token or len(token) >= 32
+
+
+class IOCExtractor:
+    """Precompiled IOC patterns plus a malware family table"""
+
+    def __init__(self, families: Optional[Dict[str, List[str]]] = None):
+        families = MALWARE_FAMILIES if families is None else families
+        # First word -> [(alias words, family)]
+        self._aliases: Dict[str, List[Tuple[Tuple[str, ...], str]]] = {}
+        for family, aliases in families.items():
+            for alias in aliases:
+                words = tuple(_WORD_RE.findall(alias.lower()))
+                if words:
+                    self._aliases.setdefault(words[0], []).append((words, _intern(family)))
+
+    def extract(self, text: str) -> Dict[str, List[str]]:
+        """IOCs in text by kind (only kinds that occur), first-seen order, normalised"""
+        text = refang(text)
+        found: Dict[str, List[str]] = {}
+        seen: Set[str] = set()
+
+        def keep(kind: str, value: str):
+            if value not in seen:
+                seen.add(value)
+                found.setdefault(kind, []).append(_intern(value))
+
+        candidates = ' '.join(token for token in text.split() if _may_hold_ioc(token))
+        for match in _IOC_RE.finditer(candidates):
+            kind = match.lastgroup
+            value = match.group()
+            if kind == 'cve':
+                keep('cve', value.upper())
+            elif kind == 'hash':
+                keep(_HASH_KINDS[len(value)], value.lower())
+            elif kind == 'domain':
+                value = value.lower()
+                if value.rsplit('.', 1)[1] not in NOT_TLDS:
+                    keep('domain', value)
+            else:
+                keep(kind, value)
+
+        if '::' in candidates or candidates.count(':') > 2:
+            for match in _IPV6_RE.finditer(candidates):
+                try:
+                    address = ipaddress.IPv6Address(match.group())
+                except ValueError:
+                    continue
+                if not address.is_unspecified:
+                    keep('ipv6', address.compressed)
+
+        if self._aliases:
+            aliases = self._aliases
+            words = _WORD_RE.findall(text.lower())
+            if aliases.keys().isdisjoint(words):
+                words = ()
+            for pos, word in enumerate(words):
+                for alias, family in aliases.get(word, ()):
+                    if len(alias) == 1 or tuple(words[pos:pos + len(alias)]) == alias:
+                        keep('malware', family)
+
+        return {kind: found[kind] for kind in KINDS if kind in found}
+
+    def lookup_key(self, query: str) -> str:
+        """Index key of a query: the normalised IOC it names, else the folded text"""
+        found = [value for values in self.extract(query).values() for value in values]
+        return (found[0] if len(found) == 1 else refang(query.strip())).lower()
+
+
+def merge_iocs(primary: Optional[Dict[str, List[str]]],
+               other: Optional[Dict[str, List[str]]]) -> Optional[Dict[str, List[str]]]:
+    """Union of two incidents' iocs (None if the union is unchanged from primary)"""
+    if not other:
+        return None
+    merged = {kind: list(values) for kind, values in (primary or {}).items()}
+    changed = False
+    for kind, values in other.items():
+        present = merged.setdefault(kind, [])
+        for value in values:
+            if value not in present:
+                present.append(value)
+                changed = True
+    if not changed:
+        return None
+    return {kind: merged[kind] for kind in KINDS if merged.get(kind)}
+
+
+class IOCIndex:
+    """Inverted index IOC -> incident IDs over the rolling window"""
+
+    def __init__(self, extractor: Optional[IOCExtractor] = None, incidents: Iterable = ()):
+        self.extractor = extractor or IOCExtractor()
+        # folded value -> ids; folded value -> (kind, value as published)
+        self._postings: Dict[str, Set[str]] = {}
+        self._values: Dict[str, Tuple[str, str]] = {}
+        # id -> folded values it was indexed under, for removal
+        self._by_incident: Dict[str, Tuple[str, ...]] = {}
+        for incident in incidents:
+            self.add(incident)
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    def __contains__(self, query: str) -> bool:
+        return self.extractor.lookup_key(query) in self._postings
+
+    def add(self, incident):
+        """Index an incident's iocs (extracted here for records that predate them)
+
+        {} means extracted with nothing found; only a missing (None) value is
+        extracted again.
+        """
+        incident_id = incident['id']
+        if incident_id in self._by_incident:
+            return
+        iocs = incident.get('iocs')
+        if iocs is None:
+            iocs = self.extractor.extract(f"{incident.get('title', '')}\n{incident.get('description', '')}")
+            incident['iocs'] = iocs
+
+        keys = []
+        for kind, values in iocs.items():
+            for value in values:
+                key = value.lower()
+                self._postings.setdefault(key, set()).add(incident_id)
+                self._values.setdefault(key, (kind, value))
+                keys.append(key)
+        self._by_incident[incident_id] = tuple(keys)
+
+    def remove(self, incident_id: str):
+        for key in self._by_incident.pop(incident_id, ()):
+            ids = self._postings.get(key)
+            if ids is None:
+                continue
+            ids.discard(incident_id)
+            if not ids:
+                del self._postings[key]
+                del self._values[key]
+
+    def update(self, incident):
+        """Re-index an incident whose iocs changed"""
+        self.remove(incident['id'])
+        self.add(incident)
+
+    def lookup(self, query: str) -> Set[str]:
+        """IDs of incidents mentioning the IOC named by query (CVE, IP, domain, hash, family)"""
+        return set(self._postings.get(self.extractor.lookup_key(query), ()))
+
+    def iocs(self, incident_id: str) -> List[Tuple[str, str]]:
+        """(kind, value) of every IOC an incident was indexed under"""
+        return [self._values[key] for key in self._by_incident.get(incident_id, ())]
+
+    def related(self, incident_id: str) -> Dict[str, List[str]]:
+        """Other incidents sharing an IOC with this one -> the shared values"""
+        shared: Dict[str, List[str]] = {}
+        for key in self._by_incident.get(incident_id, ()):
+            for other in self._postings[key]:
+                if other != incident_id:
+                    shared.setdefault(other, []).append(self._values[key][1])
+        return shared
+
+    def top(self, n: int = 20, kind: Optional[str] = None) -> List[Tuple[str, str, int]]:
+        """(kind, value, incident count) of the most-mentioned IOCs"""
+        counts = [(len(ids), key) for key, ids in self._postings.items()
+                  if kind is None or self._values[key][0] == kind]
+        counts.sort(key=lambda c: (-c[0], c[1]))
+        return [self._values[key] + (count,) for count, key in counts[:n]]
@@ -0,0 +1,302 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Pipeline metrics
+© 2026 CyberDudeBivash Pvt Ltd
+
+Structured instrumentation for each engine run:
+
+    stages   wall time and items in / out of fetch, normalize, deduplicate,
+             filter, merge (or score), generate_feeds and publish
+    sources  status, items returned and dropped, bytes on the wire, cache
+             hits and fetch time per source
+    gauges   run-level values such as the rolling window size
+
+Every finished run is appended to runs.ndjson and folded into cumulative
+counters that are written as a Prometheus text file (threat-intel.prom, for
+node_exporter's textfile collector) and served at /metrics by the HTTP API.
+
+An optional profile mode wraps each run in cProfile (stats dumped beside the
+run records) or tracemalloc (peak and top allocation sites kept in the run
+record). It costs nothing when off.
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from feed_writer import atomic_open
+
+PREFIX = 'threatintel'
+
+PROFILE_MODES = ('cprofile', 'tracemalloc')
+
+# Per-source fields summed into *_total counters
+SOURCE_COUNTERS = ('items', 'dropped', 'bytes', 'cache_hits')
+
+
+class CountingReader:
+    """File-like wrapper that counts the bytes read through it"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.count = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.raw.read(size)
+        self.count += len(data)
+        return data
+
+
+class Stage:
+    """One timed stage of a run; set items_out before the block exits"""
+
+    __slots__ = ('name', 'items_in', 'items_out', 'seconds')
+
+    def __init__(self, name: str, items_in: Optional[int] = None):
+        self.name = name
+        self.items_in = items_in
+        self.items_out: Optional[int] = None
+        self.seconds = 0.0
+
+
+class PipelineMetrics:
+    """Run records plus cumulative counters for the engine"""
+
+    # Run records kept in runs.ndjson (one week of 5-minute cycles)
+    MAX_RUN_RECORDS = 2016
+
+    def __init__(self, metrics_dir: Optional[Path] = None, profile: Optional[str] = None):
+        if profile is not None and profile not in PROFILE_MODES:
+            raise ValueError(f"profile must be one of {PROFILE_MODES}")
+        self.metrics_dir = Path(metrics_dir) if metrics_dir else None
+        self.profile = profile
+        self._lock = threading.Lock()
+
+        self.run: Optional[Dict] = None
+        self.last_run: Optional[Dict] = None
+        self.runs_total = 0
+        self.run_failures_total = 0
+        self.stage_seconds_total: Dict[str, float] = {}
+        self.source_totals: Dict[str, Dict[str, int]] = {}
+        self.source_status_totals: Dict[str, Dict[str, int]] = {}
+        self._run_records: Optional[int] = None
+
+    # -- recording -------------------------------------------------------
+
+    def start_run(self):
+        self.run = {
+            'run': self.runs_total + 1,
+            'started': datetime.utcnow().isoformat() + 'Z',
+            'stages': {},
+            'sources': {},
+            'gauges': {},
+            '_t0': time.perf_counter()
+        }
+
+    def _current(self) -> Dict:
+        if self.run is None:
+            self.start_run()
+        return self.run
+
+    @contextmanager
+    def stage(self, name: str, items_in: Optional[int] = None) -> Iterator[Stage]:
+        """Time a block as one pipeline stage"""
+        run = self._current()
+        stage = Stage(name, items_in)
+        t0 = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.seconds = time.perf_counter() - t0
+            self.record_stage(stage.name, stage.seconds, stage.items_in, stage.items_out, run)
+
+    def record_stage(self, name: str, seconds: float, items_in: Optional[int] = None,
+                     items_out: Optional[int] = None, run: Optional[Dict] = None):
+        """Record a stage timed elsewhere (e.g. one step of a streaming pass)"""
+        run = run if run is not None else self._current()
+        run['stages'][name] = {
+            'seconds': round(seconds, 6),
+            'items_in': items_in,
+            'items_out': items_out
+        }
+
+    def source(self, name: str, **fields):
+        """Merge fields into this run's record for a source (thread-safe)"""
+        run = self.run
+        if run is None:
+            return
+        with self._lock:
+            record = run['sources'].setdefault(name, {})
+            for key, value in fields.items():
+                if key in SOURCE_COUNTERS:
+                    record[key] = record.get(key, 0) + value
+                else:
+                    record[key] = value
+
+    def gauge(self, name: str, value):
+        self._current()['gauges'][name] = value
+
+    def finish_run(self, ok: bool = True) -> Dict:
+        """Close the current run, fold it into the totals and write the exports"""
+        run = self._current()
+        run['duration'] = round(time.perf_counter() - run.pop('_t0'), 6)
+        run['ok'] = ok
+        self.run = None
+
+        with self._lock:
+            self.runs_total += 1
+            if not ok:
+                self.run_failures_total += 1
+            for name, stage in run['stages'].items():
+                self.stage_seconds_total[name] = self.stage_seconds_total.get(name, 0.0) + stage['seconds']
+            for name, record in run['sources'].items():
+                totals = self.source_totals.setdefault(name, {})
+                for key in SOURCE_COUNTERS:
+                    totals[key] = totals.get(key, 0) + record.get(key, 0)
+                if 'status' in record:
+                    statuses = self.source_status_totals.setdefault(name, {})
+                    statuses[record['status']] = statuses.get(record['status'], 0) + 1
+            self.last_run = run
+
+        if self.metrics_dir is not None:
+            self.metrics_dir.mkdir(parents=True, exist_ok=True)
+            self._append_run_record(run)
+            self._write_prometheus()
+        return run
+
+    # -- profiling -------------------------------------------------------
+
+    @contextmanager
+    def profiled(self) -> Iterator[None]:
+        """Wrap a run in the configured profiler (no-op when profile is None)"""
+        if self.profile == 'cprofile':
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                self._record_cprofile(profiler)
+        elif self.profile == 'tracemalloc':
+            tracemalloc.start()
+            try:
+                yield
+            finally:
+                snapshot = tracemalloc.take_snapshot()
+                current, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                self._current()['profile'] = {
+                    'mode': 'tracemalloc',
+                    'current_bytes': current,
+                    'peak_bytes': peak,
+                    'top': [
+                        {'site': str(stat.traceback[0]), 'bytes': stat.size, 'blocks': stat.count}
+                        for stat in snapshot.statistics('lineno')[:10]
+                    ]
+                }
+        else:
+            yield
+
+    def _record_cprofile(self, profiler: cProfile.Profile):
+        run = self._current()
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(15)
+        record = {'mode': 'cprofile', 'top': stream.getvalue()}
+        if self.metrics_dir is not None:
+            self.metrics_dir.mkdir(parents=True, exist_ok=True)
+            path = self.metrics_dir / f"profile-{run['run']}.pstats"
+            profiler.dump_stats(str(path))
+            record['path'] = str(path)
+        run['profile'] = record
+
+    # -- export ----------------------------------------------------------
+
+    def summary(self, run: Optional[Dict] = None) -> str:
+        """One-line stage timing summary of a run"""
+        run = run or self.last_run
+        if not run:
+            return ''
+        stages = ' · '.join(f"{name} {stage['seconds']:.2f}s" for name, stage in run['stages'].items())
+        return f"{stages} (total {run['duration']:.2f}s)"
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition of the cumulative counters and the last run"""
+        with self._lock:
+            run = self.last_run or {'stages': {}, 'sources': {}, 'gauges': {}}
+            lines: List[str] = []
+
+            def metric(name: str, kind: str, help_text: str, samples):
+                samples = list(samples)
+                if not samples:
+                    return
+                lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+                lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+                for labels, value in samples:
+                    label_text = ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                    lines.append(f"{PREFIX}_{name}{{{label_text}}} {value}" if label_text
+                                 else f"{PREFIX}_{name} {value}")
+
+            metric('runs_total', 'counter', 'Engine runs completed', [({}, self.runs_total)])
+            metric('run_failures_total', 'counter', 'Engine runs that raised', [({}, self.run_failures_total)])
+            if 'duration' in run:
+                metric('last_run_duration_seconds', 'gauge', 'Wall time of the last run',
+                       [({}, run['duration'])])
+            metric('stage_seconds', 'gauge', 'Wall time of each stage in the last run',
+                   (({'stage': n}, s['seconds']) for n, s in run['stages'].items()))
+            metric('stage_seconds_total', 'counter', 'Cumulative wall time per stage',
+                   (({'stage': n}, round(v, 6)) for n, v in self.stage_seconds_total.items()))
+            metric('stage_items_in', 'gauge', 'Items entering each stage in the last run',
+                   (({'stage': n}, s['items_in']) for n, s in run['stages'].items() if s['items_in'] is not None))
+            metric('stage_items_out', 'gauge', 'Items leaving each stage in the last run',
+                   (({'stage': n}, s['items_out']) for n, s in run['stages'].items() if s['items_out'] is not None))
+            metric('source_fetch_seconds', 'gauge', 'Fetch time per source in the last run',
+                   (({'source': n}, r['elapsed']) for n, r in run['sources'].items() if 'elapsed' in r))
+            for key, help_text in (('items', 'Items returned per source'),
+                                   ('dropped', 'Items read but dropped (irrelevant or already known) per source'),
+                                   ('bytes', 'Bytes read from the network per source'),
+                                   ('cache_hits', 'Conditional-GET cache hits (304) per source')):
+                metric(f'source_{key}_total', 'counter', help_text,
+                       (({'source': n}, t[key]) for n, t in self.source_totals.items()))
+            metric('source_runs_total', 'counter', 'Source fetches by outcome (ok / timeout / error)',
+                   (({'source': n, 'status': s}, c)
+                    for n, statuses in self.source_status_totals.items() for s, c in statuses.items()))
+            for name, value in run['gauges'].items():
+                metric(name, 'gauge', f'{name.replace("_", " ").capitalize()} after the last run', [({}, value)])
+
+        return '\n'.join(lines) + '\n'
+
+    def _write_prometheus(self):
+        with atomic_open(self.metrics_dir / 'threat-intel.prom') as f:
+            f.write(self.to_prometheus())
+
+    def _append_run_record(self, run: Dict):
+        path = self.metrics_dir / 'runs.ndjson'
+        if self._run_records is None:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._run_records = sum(1 for _ in f)
+            except OSError:
+                self._run_records = 0
+
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(run, separators=(',', ':'), ensure_ascii=False) + '\n')
+        self._run_records += 1
+
+        # Trim to the newest MAX_RUN_RECORDS once the file holds twice that
+        if self._run_records > 2 * self.MAX_RUN_RECORDS:
+            with open(path, 'r', encoding='utf-8') as f:
+                keep = f.readlines()[-self.MAX_RUN_RECORDS:]
+            with atomic_open(path) as f:
+                f.writelines(keep)
+            self._run_records = len(keep)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,192 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Compact incident model
+© 2026 CyberDudeBivash Pvt Ltd
+
+A long-running engine holds the whole rolling window in memory, and at
+hundreds of thousands of incidents the per-incident dict dominates. Incident
+is a __slots__ class: no per-instance __dict__, repeated values (category,
+severity, source, region, tier) are interned so every incident shares one
+string object, and time is a single epoch integer. hours_ago and
+freshness_score are derived from the epoch when read.
+
+Incidents still answer incident['field'] / .get() / .setdefault() so code
+written against the dict representation keeps working, and to_json() /
+from_json() round-trip the published feed schema.
+"""
+
+import sys
+import time
+from typing import Any, Dict, Optional
+
+from timestamps import epoch_to_iso, parse_iso8601
+
+SEVERITY_SCORES = {
+    'CRITICAL': 4,
+    'HIGH': 3,
+    'MEDIUM': 2,
+    'LOW': 1
+}
+
+_intern = sys.intern
+
+
+def _interned(value: Optional[str]) -> Optional[str]:
+    return _intern(value) if isinstance(value, str) else value
+
+
+class Incident:
+    """One threat incident"""
+
+    __slots__ = ('id', 'title', 'description', 'source', 'category', 'severity', 'url',
+                 'epoch', 'region', 'tier', 'cve_id', 'iocs', 'sources', 'score', 'extra')
+
+    # Fields derived on read rather than stored
+    DERIVED = ('timestamp', 'hours_ago', 'freshness_score')
+
+    def __init__(self, title: str, description: str = '', source: str = '', category: str = 'Incident',
+                 severity: str = 'MEDIUM', url: str = '', epoch: Optional[int] = None,
+                 region: str = 'Global', tier: str = 'free', id: Optional[str] = None,
+                 cve_id: Optional[str] = None, iocs: Optional[Dict[str, list]] = None,
+                 sources: Optional[list] = None,
+                 score: Optional[int] = None, extra: Optional[Dict[str, Any]] = None):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.source = _interned(source)
+        self.category = _interned(category)
+        self.severity = _interned(severity)
+        self.url = url
+        self.epoch = int(epoch) if epoch is not None else int(time.time())
+        self.region = _interned(region)
+        self.tier = _interned(tier)
+        self.cve_id = cve_id
+        # kind -> values, see ioc.py ({} once extracted with nothing found, None
+        # until extracted; feeds omit both)
+        self.iocs = {k: [_intern(v) for v in vs] for k, vs in iocs.items()} if iocs is not None else None
+        self.sources = [_interned(s) for s in sources] if sources else None
+        self.score = score
+        self.extra = extra or None
+
+    # -- derived fields -------------------------------------------------
+
+    @property
+    def timestamp(self) -> str:
+        return epoch_to_iso(self.epoch)
+
+    @property
+    def hours_ago(self) -> int:
+        return max(0, int((time.time() - self.epoch) / 3600))
+
+    @property
+    def freshness_score(self) -> float:
+        return max(0, 24 - (time.time() - self.epoch) / 3600)
+
+    # -- dict compatibility ----------------------------------------------
+
+    def __getitem__(self, key: str):
+        if key in Incident.__slots__ or key in Incident.DERIVED:
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        if key in Incident.DERIVED:
+            if key == 'timestamp':
+                self.epoch = parse_iso8601(value)
+            return
+        if key in Incident.__slots__:
+            setattr(self, key, _interned(value) if key in ('source', 'category', 'severity') else value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            return self[key] is not None
+        except KeyError:
+            return False
+
+    def get(self, key: str, default=None):
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        return default if value is None else value
+
+    def setdefault(self, key: str, default=None):
+        value = self.get(key)
+        if value is None:
+            self[key] = default
+            return default
+        return value
+
+    # -- serialisation ---------------------------------------------------
+
+    def to_json(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Feed-schema dict; hours_ago / freshness_score are relative to `now`"""
+        now = time.time() if now is None else now
+        hours_old = (now - self.epoch) / 3600
+        data = {
+            'title': self.title,
+            'description': self.description,
+            'source': self.source,
+            'category': self.category,
+            'severity': self.severity,
+            'url': self.url,
+            'timestamp': epoch_to_iso(self.epoch),
+            'region': self.region,
+            'tier': self.tier
+        }
+        if self.cve_id is not None:
+            data['cve_id'] = self.cve_id
+        if self.iocs:
+            data['iocs'] = self.iocs
+        if self.extra:
+            data.update(self.extra)
+        data['epoch'] = self.epoch
+        if self.id is not None:
+            data['id'] = self.id
+        data['sources'] = self.sources or [self.source]
+        data['score'] = self.score if self.score is not None else SEVERITY_SCORES.get(self.severity, 2)
+        data['hours_ago'] = max(0, int(hours_old))
+        data['freshness_score'] = max(0, 24 - hours_old)
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Incident':
+        """Build from a feed-schema (or raw source) dict"""
+        extra = {k: v for k, v in data.items() if k not in _KNOWN_KEYS}
+        epoch = data.get('epoch')
+        if epoch is None and data.get('timestamp'):
+            try:
+                epoch = parse_iso8601(data['timestamp'])
+            except ValueError:
+                epoch = None
+        return cls(
+            title=data['title'],
+            description=data.get('description', ''),
+            source=data.get('source', ''),
+            category=data.get('category', 'Incident'),
+            severity=data.get('severity', 'MEDIUM'),
+            url=data.get('url', ''),
+            epoch=epoch,
+            region=data.get('region', 'Global'),
+            tier=data.get('tier', 'free'),
+            id=data.get('id'),
+            cve_id=data.get('cve_id'),
+            iocs=data.get('iocs'),
+            sources=data.get('sources'),
+            score=data.get('score'),
+            extra=extra
+        )
+
+    def __repr__(self):
+        return f"<Incident {self.severity} {self.title[:40]!r}>"
+
+
+_KNOWN_KEYS = frozenset(Incident.__slots__) | frozenset(Incident.DERIVED)
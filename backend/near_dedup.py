@@ -0,0 +1,155 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Near-duplicate incident clustering
+© 2026 CyberDudeBivash Pvt Ltd
+
+The same story reported by several outlets under different headlines is
+folded into one incident. Each incident gets a MinHash signature over the
+content words of its title and description; LSH banding puts signatures
+that agree on any band into a shared bucket, so only bucket-mates are ever
+compared and clustering stays roughly linear in the number of incidents.
+"""
+
+import hashlib
+import re
+import struct
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ioc import merge_iocs
+from models import SEVERITY_SCORES
+
+NUM_PERM = 64          # 16-bit MinHash values from two 64-byte blake2b digests
+BANDS = 16             # 16 bands x 4 rows: candidate threshold ~0.5 Jaccard
+THRESHOLD = 0.5        # estimated Jaccard needed to merge
+
+STOPWORDS = frozenset("""
+    a an and are as at be by for from has have in into is it its new of on or
+    over says the their this to under with after amid via against more than
+    """.split())
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_UNPACK = struct.Struct(f'<{NUM_PERM // 2}H').unpack
+_SALTS = (b'cdb-minhash-0', b'cdb-minhash-1')
+
+Signature = Tuple[int, ...]
+
+
+def shingles(incident: Dict) -> Set[str]:
+    """Content words of title and description"""
+    text = f"{incident.get('title', '')} {incident.get('description', '')}".lower()
+    return {tok for tok in _TOKEN_RE.findall(text) if len(tok) > 2 and tok not in STOPWORDS}
+
+
+def signature(incident: Dict) -> Optional[Signature]:
+    """MinHash signature (None if the incident has no content words)"""
+    vectors = []
+    for sh in shingles(incident):
+        data = sh.encode('utf-8')
+        vectors.append(sum((_UNPACK(hashlib.blake2b(data, digest_size=64, person=salt).digest())
+                            for salt in _SALTS), ()))
+    if not vectors:
+        return None
+    return tuple(map(min, zip(*vectors)))
+
+
+def similarity(a: Signature, b: Signature) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_PERM
+
+
+class NearDuplicateIndex:
+    """LSH index of incident signatures supporting insert, query and removal"""
+
+    def __init__(self, threshold: float = THRESHOLD, bands: int = BANDS):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = NUM_PERM // bands
+        self._signatures: Dict[str, Signature] = {}
+        self._buckets: Dict[Tuple, Set[str]] = {}
+
+    def _band_keys(self, sig: Signature) -> Iterable[Tuple]:
+        rows = self.rows
+        for band in range(self.bands):
+            yield (band,) + sig[band * rows:(band + 1) * rows]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, incident_id: str) -> bool:
+        return incident_id in self._signatures
+
+    def add(self, incident_id: str, sig: Optional[Signature]):
+        if sig is None or incident_id in self._signatures:
+            return
+        self._signatures[incident_id] = sig
+        for key in self._band_keys(sig):
+            self._buckets.setdefault(key, set()).add(incident_id)
+
+    def remove(self, incident_id: str):
+        sig = self._signatures.pop(incident_id, None)
+        if sig is None:
+            return
+        for key in self._band_keys(sig):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(incident_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def query(self, sig: Optional[Signature]) -> Optional[str]:
+        """Most similar indexed incident at or above the threshold"""
+        if sig is None:
+            return None
+
+        candidates = set()
+        for key in self._band_keys(sig):
+            candidates.update(self._buckets.get(key, ()))
+
+        best, best_score = None, self.threshold
+        for incident_id in candidates:
+            score = similarity(sig, self._signatures[incident_id])
+            if score >= best_score:
+                best, best_score = incident_id, score
+        return best
+
+
+def merge_into(primary: Dict, duplicate: Dict) -> bool:
+    """Fold a duplicate report into the primary incident; True if it changed"""
+    sources = primary.setdefault('sources', [primary['source']])
+    changed = False
+
+    for source in duplicate.get('sources', [duplicate['source']]):
+        if source not in sources:
+            sources.append(source)
+            changed = True
+
+    if SEVERITY_SCORES.get(duplicate['severity'], 0) > SEVERITY_SCORES.get(primary['severity'], 0):
+        primary['severity'] = duplicate['severity']
+        changed = True
+
+    # Another outlet's write-up may name indicators the first one did not
+    iocs = merge_iocs(primary.get('iocs'), duplicate.get('iocs'))
+    if iocs is not None:
+        primary['iocs'] = iocs
+        changed = True
+
+    return changed
+
+
+def cluster(incidents: List[Dict], index: Optional[NearDuplicateIndex] = None) -> List[Dict]:
+    """Collapse near-duplicates within a batch; the first report of a story is kept"""
+    index = index if index is not None else NearDuplicateIndex()
+    by_id: Dict[str, Dict] = {}
+    unique = []
+
+    for incident in incidents:
+        incident.setdefault('sources', [incident['source']])
+        sig = signature(incident)
+        match = index.query(sig)
+        if match is not None:
+            merge_into(by_id[match], incident)
+            continue
+        index.add(incident['id'], sig)
+        by_id[incident['id']] = incident
+        unique.append(incident)
+
+    return unique
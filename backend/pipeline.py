@@ -0,0 +1,195 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Streaming pipeline
+© 2026 CyberDudeBivash Pvt Ltd
+
+Each feed is read and parsed while it streams in, and its items are cleaned
+and classified as they complete. By default this happens on the fetch
+thread. With a ParsePool, each fetch thread reads its document and hands it
+to a worker process, which parses, cleans and classifies it. Feeds are then
+processed on every core instead of taking turns on the GIL. A pool slot
+bounds how many documents wait in memory. Once the slots are taken, fetch
+threads block before reading further responses, so memory stays bounded
+however many sources are polled at once.
+
+After the fetch, incidents flow through normalize → deduplicate → filter →
+extract_iocs → merge (or score) as chained generators, one incident at a
+time, in a single pass. Duplicates and expired items are dropped as soon as
+they are seen rather than carried in intermediate lists. stream_stages still
+reports each step as its own metrics stage.
+"""
+
+import gzip
+import io
+import multiprocessing
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from classifier import KeywordClassifier
+from feed_parser import iter_feed_items
+from timestamps import TimestampParser, epoch_to_iso, now_epoch
+
+TAG_RE = re.compile(r'<[^<]+?>')
+
+# Characters of (tag-stripped) description kept per incident
+DESCRIPTION_LIMIT = 250
+
+
+def build_incident(item: Dict, feed_info: Dict, epoch: Optional[int],
+                   classifier: KeywordClassifier) -> Optional[Dict]:
+    """Clean and classify one parsed feed item (None if untitled or irrelevant)"""
+    if item['title'] is None:
+        return None
+
+    title = item['title'].strip()
+    description = TAG_RE.sub('', item['description'])[:DESCRIPTION_LIMIT].strip()
+
+    # Relevance, category and severity in one pass over title + description
+    verdict = classifier.with_hints(feed_info['category_hints']).classify(title, description)
+    if not verdict.relevant:
+        return None
+
+    if epoch is None:
+        epoch = now_epoch()
+
+    return {
+        'title': title,
+        'description': description,
+        'source': feed_info['name'],
+        'category': verdict.category,
+        'severity': verdict.severity,
+        'url': item['link'].strip(),
+        'timestamp': epoch_to_iso(epoch),
+        'epoch': epoch,
+        'region': 'Global',
+        'tier': 'free'
+    }
+
+
+def read_feed(items: Iterator[Dict], feed_info: Dict, cutoff_epoch: int, timestamps: TimestampParser,
+              build: Callable[[Dict, Optional[int]], Optional[Dict]]) -> Tuple[List[Dict], int]:
+    """(incidents, items read) from a feed's items.
+
+    Stops at feed_info['item_limit'] or at the first item older than the
+    cutoff, and closes items so the rest of the document is never read.
+    """
+    incidents = []
+    read = 0
+    try:
+        for n, item in enumerate(items):
+            if n >= feed_info['item_limit']:
+                break
+
+            epoch = timestamps.parse(item['pub_date'], feed_info['name'])
+            if epoch is not None and epoch < cutoff_epoch:
+                break
+
+            read += 1
+            incident = build(item, epoch)
+            if incident:
+                incidents.append(incident)
+    finally:
+        items.close()
+    return incidents, read
+
+
+# -- worker processes --------------------------------------------------------
+
+_classifier: Optional[KeywordClassifier] = None
+_timestamps: Optional[TimestampParser] = None
+
+
+def _init_worker(rules: Dict):
+    global _classifier, _timestamps
+    _classifier = KeywordClassifier(rules)
+    _timestamps = TimestampParser()
+
+
+def parse_document(body: bytes, gzipped: bool, feed_info: Dict, cutoff_epoch: int) -> Tuple[List[Dict], int]:
+    """Worker side: parse, clean and classify one fetched document"""
+    stream = io.BytesIO(body)
+    if gzipped:
+        stream = gzip.GzipFile(fileobj=stream)
+    return read_feed(iter_feed_items(stream), feed_info, cutoff_epoch, _timestamps,
+                     lambda item, epoch: build_incident(item, feed_info, epoch, _classifier))
+
+
+class ParsePool:
+    """Worker processes that parse and classify whole feed documents.
+
+    At most max_pending documents are held (read but not yet parsed) at
+    once. Fetch threads wait for a slot before reading a response body,
+    which holds back the senders instead of buffering their documents.
+    """
+
+    def __init__(self, workers: int, rules: Dict, max_pending: Optional[int] = None):
+        # Spawned rather than forked: fetch threads may hold locks when a
+        # worker starts
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'),
+                                             initializer=_init_worker, initargs=(rules,))
+        self._slots = threading.BoundedSemaphore(max_pending or 2 * workers)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one pending-document slot (blocks while all are taken)"""
+        with self._slots:
+            yield
+
+    def parse(self, body: bytes, gzipped: bool, feed_info: Dict, cutoff_epoch: int) -> Tuple[List[Dict], int]:
+        """(incidents, items read) of one document, parsed in a worker"""
+        return self._executor.submit(parse_document, body, gzipped, feed_info, cutoff_epoch).result()
+
+    def shutdown(self):
+        self._executor.shutdown(cancel_futures=True)
+
+
+# -- streaming stages --------------------------------------------------------
+
+class _Tap:
+    """Iterator wrapper counting the items pulled through it and the time spent pulling"""
+
+    __slots__ = ('source', 'count', 'seconds')
+
+    def __init__(self, source: Iterable):
+        self.source = iter(source)
+        self.count = 0
+        self.seconds = 0.0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        t0 = time.perf_counter()
+        try:
+            item = next(self.source)
+        finally:
+            self.seconds += time.perf_counter() - t0
+        self.count += 1
+        return item
+
+
+def stream_stages(metrics, items: Iterable, stages: List[Tuple[str, Callable[[Iterator], Iterator]]],
+                  sink: Tuple[str, Callable[[Iterator], List]]) -> List:
+    """Run items through generator stages into sink in one pass; returns the sink's result.
+
+    Each stage is recorded in metrics with the items that entered and left
+    it and the time spent in the stage itself, excluding the stages
+    upstream of it, as if it had run on its own.
+    """
+    taps = [_Tap(items)]
+    for _, stage in stages:
+        taps.append(_Tap(stage(taps[-1])))
+
+    sink_name, consume = sink
+    t0 = time.perf_counter()
+    result = consume(taps[-1])
+    elapsed = time.perf_counter() - t0
+
+    for (name, _), upstream, tap in zip(stages, taps, taps[1:]):
+        metrics.record_stage(name, tap.seconds - upstream.seconds, upstream.count, tap.count)
+    metrics.record_stage(sink_name, elapsed - taps[-1].seconds, taps[-1].count, len(result))
+    return result
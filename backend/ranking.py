@@ -0,0 +1,160 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Incremental ranking
+© 2026 CyberDudeBivash Pvt Ltd
+
+The feed is ranked by severity score, then by recency. Rather than scoring
+and re-sorting the whole rolling window on every run, RankedWindow keeps one
+sorted index per severity score (at most four), each ordered oldest-first by
+(epoch, id), plus the same per category. An incident's place is found with
+an O(log n) binary search in one bucket. Newly published incidents sort to
+the tail, so inserting one is an append; only late arrivals and removals
+from the middle shift the list. Expiry cuts each bucket's head in one slice.
+The top-K, overall or for one category, is read backwards off the tails of
+the buckets in score order without touching the rest of the window.
+
+Freshness is not part of the key: ordering by epoch is the same ordering,
+and hours_ago / freshness_score are derived from the epoch when read.
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from models import Incident, SEVERITY_SCORES
+
+_Key = Tuple[int, str]
+
+
+def rank_score(incident: Incident) -> int:
+    """Severity score an incident is ranked under"""
+    if incident.score is not None:
+        return incident.score
+    return SEVERITY_SCORES.get(incident.severity, 2)
+
+
+class RankedWindow:
+    """Incidents ordered by (score, epoch) descending, maintained incrementally"""
+
+    def __init__(self, incidents=()):
+        self._incidents: Dict[str, Incident] = {}
+        # id -> (score, category key, sort key) as indexed, for removal
+        self._positions: Dict[str, Tuple[int, str, _Key]] = {}
+        # score -> [(epoch, id)], sorted oldest first
+        self._buckets: Dict[int, List[_Key]] = {}
+        # category (lower-cased) -> score -> [(epoch, id)], sorted oldest first
+        self._by_category: Dict[str, Dict[int, List[_Key]]] = {}
+
+        # Bulk load: append unsorted, then sort each bucket once
+        for incident in {i.id: i for i in incidents}.values():
+            score, category, key = self._index_key(incident)
+            self._buckets.setdefault(score, []).append(key)
+            self._by_category.setdefault(category, {}).setdefault(score, []).append(key)
+            self._positions[incident.id] = (score, category, key)
+            self._incidents[incident.id] = incident
+        for bucket in self._buckets.values():
+            bucket.sort()
+        for buckets in self._by_category.values():
+            for bucket in buckets.values():
+                bucket.sort()
+
+    def __len__(self) -> int:
+        return len(self._incidents)
+
+    def __contains__(self, incident_id: str) -> bool:
+        return incident_id in self._incidents
+
+    def __iter__(self) -> Iterator[Incident]:
+        return iter(self.ranked())
+
+    def get(self, incident_id: str) -> Optional[Incident]:
+        return self._incidents.get(incident_id)
+
+    def add(self, incident: Incident):
+        """Insert an incident, or re-rank it if already present (O(log n); an append for the newest)"""
+        position = self._index_key(incident)
+        if self._positions.get(incident.id) == position:
+            # Same place in every bucket: only the object changes
+            self._incidents[incident.id] = incident
+            return
+        if incident.id in self._positions:
+            self.remove(incident.id)
+        score, category, key = position
+        insort(self._buckets.setdefault(score, []), key)
+        insort(self._by_category.setdefault(category, {}).setdefault(score, []), key)
+        self._positions[incident.id] = (score, category, key)
+        self._incidents[incident.id] = incident
+
+    update = add
+
+    def remove(self, incident_id: str) -> Optional[Incident]:
+        """Drop an incident; returns it, or None if it was not ranked"""
+        position = self._positions.pop(incident_id, None)
+        if position is None:
+            return None
+        score, category, key = position
+        self._discard(self._buckets, score, key)
+        self._discard(self._by_category[category], score, key)
+        if not self._by_category[category]:
+            del self._by_category[category]
+        return self._incidents.pop(incident_id)
+
+    def expire(self, cutoff_epoch: int) -> List[str]:
+        """Remove every incident older than cutoff_epoch; returns their ids"""
+        expired = [key[1] for key in self._cut(self._buckets, cutoff_epoch)]
+        for category, buckets in list(self._by_category.items()):
+            self._cut(buckets, cutoff_epoch)
+            if not buckets:
+                del self._by_category[category]
+        for incident_id in expired:
+            del self._positions[incident_id]
+            del self._incidents[incident_id]
+        return expired
+
+    def top(self, k: Optional[int] = None, category: Optional[str] = None) -> List[Incident]:
+        """The k highest-ranked incidents, optionally within one category"""
+        buckets = self._buckets if category is None else self._by_category.get(category.lower(), {})
+        k = len(self._incidents) if k is None else k
+        incidents = self._incidents
+        selected = []
+        for score in sorted(buckets, reverse=True):
+            # The newest k - len(selected) keys, read back from the tail
+            stop = len(buckets[score]) - (k - len(selected)) - 1
+            selected.extend([incidents[incident_id]
+                             for _, incident_id in buckets[score][:stop if stop >= 0 else None:-1]])
+            if len(selected) >= k:
+                break
+        return selected
+
+    def ranked(self) -> List[Incident]:
+        """The whole window in rank order"""
+        return self.top()
+
+    def categories(self) -> List[str]:
+        """Lower-cased categories present in the window"""
+        return list(self._by_category)
+
+    @staticmethod
+    def _index_key(incident: Incident) -> Tuple[int, str, _Key]:
+        return rank_score(incident), (incident.category or '').lower(), (incident.epoch, incident.id)
+
+    @staticmethod
+    def _discard(buckets: Dict[int, List[_Key]], score: int, key: _Key):
+        bucket = buckets[score]
+        index = bisect_left(bucket, key)
+        if index < len(bucket) and bucket[index] == key:
+            del bucket[index]
+        if not bucket:
+            del buckets[score]
+
+    @staticmethod
+    def _cut(buckets: Dict[int, List[_Key]], cutoff_epoch: int) -> List[_Key]:
+        """Drop the keys older than cutoff_epoch from the head of every bucket; returns them"""
+        cut = []
+        for score, bucket in list(buckets.items()):
+            head = bisect_left(bucket, (cutoff_epoch,))
+            if head:
+                cut.extend(bucket[:head])
+                del bucket[:head]
+                if not bucket:
+                    del buckets[score]
+        return cut
+
@@ -0,0 +1,208 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Full-text search
+© 2026 CyberDudeBivash Pvt Ltd
+
+Keyword search over the rolling window: an in-memory inverted index of
+title, description and sources, ranked with BM25. The engine keeps it next
+to the ranking and the IOC index, adding incidents as they are ingested,
+re-indexing merged ones and dropping expired ones, so it is never rebuilt
+from scratch while the engine stays up.
+
+Terms are lowercase alphanumeric runs. Title terms count twice (a headline
+match outweighs one buried in the description). A query matches incidents
+containing every term; a term ending in '*', and the last term of the
+query, also match any indexed term they prefix ("lock" finds "lockbit"),
+so the dashboard can search as the analyst types. Prefixes are expanded
+against a sorted vocabulary with a binary search.
+
+The index is shared with the HTTP API threads, so every public method
+takes the index lock.
+"""
+
+import heapq
+import math
+import re
+import threading
+from bisect import bisect_left, insort
+from typing import Collection, Dict, Iterable, List, Optional, Set, Tuple
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+TITLE_WEIGHT = 2
+
+# Prefix terms expand to at most this many vocabulary terms
+MAX_EXPANSIONS = 64
+
+# Alphanumeric runs of two or more characters, or a single digit
+_TERM_RE = re.compile(r'[a-z0-9]{2,}|[0-9]')
+
+
+def terms(text: str) -> List[str]:
+    """Index terms of a text"""
+    return _TERM_RE.findall(text.lower())
+
+
+def _matching(group: List[Dict[str, int]]) -> Set[str]:
+    """IDs in any of a group's postings (a prefix expands to several terms)"""
+    if len(group) == 1:
+        return set(group[0])
+    return set().union(*group)
+
+
+class SearchIndex:
+    """Incremental BM25 index over incidents, keyed by incident ID"""
+
+    def __init__(self, incidents: Iterable = ()):
+        # term -> {incident id: weighted term frequency}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._vocabulary: List[str] = []
+        # id -> (distinct terms, weighted length), for removal and scoring
+        self._docs: Dict[str, Tuple[Tuple[str, ...], int]] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+        added = [self._index(incident) for incident in incidents]
+        if any(added):
+            self._vocabulary = sorted(self._postings)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, incident_id: str) -> bool:
+        return incident_id in self._docs
+
+    # -- maintenance -----------------------------------------------------
+
+    def add(self, incident):
+        with self._lock:
+            for term in self._index(incident):
+                insort(self._vocabulary, term)
+
+    def remove(self, incident_id: str):
+        with self._lock:
+            self._unindex(incident_id)
+
+    def update(self, incident):
+        """Re-index an incident whose text or sources changed"""
+        with self._lock:
+            self._unindex(incident['id'])
+            for term in self._index(incident):
+                insort(self._vocabulary, term)
+
+    def _index(self, incident) -> List[str]:
+        """Index one incident; returns the terms new to the vocabulary"""
+        incident_id = incident['id']
+        if incident_id in self._docs:
+            return []
+        sources = incident.get('sources') or [incident.get('source', '')]
+        frequencies: Dict[str, int] = {}
+        for term in terms(incident.get('title', '')):
+            frequencies[term] = frequencies.get(term, 0) + TITLE_WEIGHT
+        for term in terms(incident.get('description', '') + ' ' + ' '.join(sources)):
+            frequencies[term] = frequencies.get(term, 0) + 1
+
+        new_terms = []
+        postings = self._postings
+        for term, tf in frequencies.items():
+            posting = postings.get(term)
+            if posting is None:
+                posting = postings[term] = {}
+                new_terms.append(term)
+            posting[incident_id] = tf
+        length = sum(frequencies.values())
+        self._docs[incident_id] = (tuple(frequencies), length)
+        self._total_length += length
+        return new_terms
+
+    def _unindex(self, incident_id: str):
+        doc = self._docs.pop(incident_id, None)
+        if doc is None:
+            return
+        doc_terms, length = doc
+        self._total_length -= length
+        for term in doc_terms:
+            posting = self._postings[term]
+            del posting[incident_id]
+            if not posting:
+                del self._postings[term]
+                pos = bisect_left(self._vocabulary, term)
+                del self._vocabulary[pos]
+
+    # -- queries ---------------------------------------------------------
+
+    def expand(self, prefix: str) -> List[str]:
+        """Vocabulary terms starting with prefix (at most MAX_EXPANSIONS)"""
+        with self._lock:
+            return self._expand(prefix)
+
+    def _expand(self, prefix: str) -> List[str]:
+        vocabulary = self._vocabulary
+        pos = bisect_left(vocabulary, prefix)
+        expanded = []
+        while pos < len(vocabulary) and vocabulary[pos].startswith(prefix) and len(expanded) < MAX_EXPANSIONS:
+            expanded.append(vocabulary[pos])
+            pos += 1
+        return expanded
+
+    def search(self, query: str, limit: Optional[int] = 20,
+               ids: Optional[Collection[str]] = None) -> List[Tuple[str, float]]:
+        """(incident id, BM25 score) of incidents matching every query term, best first.
+
+        ids, when given, restricts the results (e.g. to one published snapshot).
+        """
+        words = query.lower().split()
+        if not words:
+            return []
+        with self._lock:
+            groups = []
+            for n, word in enumerate(words):
+                prefix = word.endswith('*') or n == len(words) - 1
+                word_terms = terms(word)
+                for pos, term in enumerate(word_terms):
+                    if prefix and pos == len(word_terms) - 1:
+                        groups.append(self._expand(term))
+                    else:
+                        groups.append([term] if term in self._postings else [])
+            if not groups or not all(groups):
+                return []
+
+            # Incidents matching every group, starting from the rarest
+            postings = [[self._postings[t] for t in group] for group in groups]
+            postings.sort(key=lambda group: sum(len(p) for p in group))
+            candidates = _matching(postings[0])
+            for group in postings[1:]:
+                if len(group) == 1:
+                    candidates = group[0].keys() & candidates
+                else:
+                    candidates = {c for c in candidates if any(c in posting for posting in group)}
+                if not candidates:
+                    return []
+            if ids is not None:
+                candidates = [c for c in candidates if c in ids]
+
+            # Length normalisation once per candidate, then one pass per term
+            count = len(self._docs)
+            docs = self._docs
+            base, scale = K1 * (1 - B), K1 * B * count / self._total_length
+            norms = {c: base + scale * docs[c][1] for c in candidates}
+            scores = dict.fromkeys(candidates, 0.0)
+            for group in postings:
+                for posting in group:
+                    weight = (K1 + 1) * math.log(1 + (count - len(posting) + 0.5) / (len(posting) + 0.5))
+                    if len(posting) < len(scores):
+                        for incident_id, tf in posting.items():
+                            if incident_id in scores:
+                                scores[incident_id] += weight * tf / (tf + norms[incident_id])
+                    else:
+                        get = posting.get
+                        for incident_id in scores:
+                            tf = get(incident_id)
+                            if tf:
+                                scores[incident_id] += weight * tf / (tf + norms[incident_id])
+
+        order = lambda item: (-item[1], item[0])  # noqa: E731
+        if limit is not None and limit < len(scores):
+            return heapq.nsmallest(limit, scores.items(), key=order)
+        return sorted(scores.items(), key=order)
@@ -0,0 +1,153 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Pluggable intelligence sources
+© 2026 CyberDudeBivash Pvt Ltd
+
+Sources are declared in sources.json and instantiated through a registry
+of source types. Each entry carries its own URL, parser type, item limit,
+category hints, poll interval and timeout; the scheduler polls every source
+on its own interval and remembers its last result in between.
+
+    {"name": "...", "type": "rss", "url": "...", "interval": 900,
+     "timeout": 15, "item_limit": 8, "category_hints": {...}}
+
+New source types register with @register_source_type("kind").
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Type
+
+DEFAULT_CONFIG = Path(__file__).resolve().parent / 'sources.json'
+
+SOURCE_TYPES: Dict[str, Type['Source']] = {}
+
+
+def register_source_type(kind: str) -> Callable:
+    """Class decorator adding a Source subclass to the registry"""
+    def decorator(cls):
+        cls.kind = kind
+        SOURCE_TYPES[kind] = cls
+        return cls
+    return decorator
+
+
+class Source:
+    """Base source plugin"""
+
+    kind = None
+
+    def __init__(self, name: str, label: Optional[str] = None, interval: int = 3600,
+                 timeout: float = 15, item_limit: int = 8,
+                 category_hints: Optional[Dict[str, str]] = None, enabled: bool = True, **options):
+        self.name = name
+        self.label = label or name
+        self.interval = interval
+        self.timeout = timeout
+        self.item_limit = item_limit
+        self.category_hints = category_hints or {}
+        self.enabled = enabled
+        self.options = options
+
+    def fetch(self, engine) -> List[Dict]:
+        """Return raw incidents; runs on a worker thread"""
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+@register_source_type('rss')
+class FeedSource(Source):
+    """RSS 2.0 / Atom feed, parsed while streaming"""
+
+    def __init__(self, name: str, url: str, **kwargs):
+        super().__init__(name, **kwargs)
+        self.url = url
+
+    def fetch(self, engine) -> List[Dict]:
+        return engine._fetch_feed({
+            'url': self.url,
+            'name': self.name,
+            'category_hints': self.category_hints,
+            'timeout': self.timeout,
+            'item_limit': self.item_limit
+        })
+
+
+SOURCE_TYPES['atom'] = FeedSource
+
+
+@register_source_type('fixture')
+class FixtureSource(Source):
+    """Built-in simulated source, for offline runs and testing"""
+
+    FIXTURES = {
+        'breach': '_fetch_breach_data',
+        'cve': '_fetch_cve_data',
+        'malware': '_fetch_malware_intel',
+        'cert': '_fetch_cert_advisories'
+    }
+
+    def __init__(self, name: str, fixture: str, **kwargs):
+        super().__init__(name, **kwargs)
+        if fixture not in self.FIXTURES:
+            raise ValueError(f"unknown fixture '{fixture}' for source {name}")
+        self.fixture = fixture
+
+    def fetch(self, engine) -> List[Dict]:
+        return getattr(engine, self.FIXTURES[self.fixture])()
+
+
+def build_source(entry: Dict) -> Source:
+    """Instantiate one config entry through the registry"""
+    entry = dict(entry)
+    kind = entry.pop('type', 'rss')
+    if kind not in SOURCE_TYPES:
+        raise ValueError(f"unknown source type '{kind}' for source {entry.get('name')}")
+    return SOURCE_TYPES[kind](**entry)
+
+
+def load_sources(path: Optional[Path] = None) -> List[Source]:
+    """Load enabled sources from a JSON config file"""
+    with open(path or DEFAULT_CONFIG, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    sources = [build_source(entry) for entry in config.get('sources', [])]
+    return [s for s in sources if s.enabled]
+
+
+class SourceScheduler:
+    """Tracks when each source is next due and keeps its latest items"""
+
+    def __init__(self, sources: List[Source]):
+        self.sources = list(sources)
+        self._next_due: Dict[str, float] = {}
+        self._latest: Dict[str, List[Dict]] = {}
+
+    def due(self, now: Optional[float] = None) -> List[Source]:
+        """Sources whose poll interval has elapsed"""
+        now = time.monotonic() if now is None else now
+        return [s for s in self.sources if self._next_due.get(s.name, 0) <= now]
+
+    def record(self, source: Source, items: List[Dict], ok: bool = True, now: Optional[float] = None):
+        """Store a poll result; failed polls keep the previous items and retry next cycle"""
+        now = time.monotonic() if now is None else now
+        if ok:
+            self._latest[source.name] = items
+            self._next_due[source.name] = now + source.interval
+
+    def latest(self) -> Iterator[Dict]:
+        """Most recent items from every source, fresh copies in config order"""
+        for s in self.sources:
+            for item in self._latest.get(s.name, []):
+                yield dict(item)
+
+    def latest_count(self) -> int:
+        return sum(len(self._latest.get(s.name, [])) for s in self.sources)
+
+    def seconds_until_due(self, now: Optional[float] = None) -> float:
+        now = time.monotonic() if now is None else now
+        if not self.sources:
+            return 0.0
+        return max(0.0, min(self._next_due.get(s.name, 0) for s in self.sources) - now)
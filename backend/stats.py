@@ -0,0 +1,292 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Window statistics
+© 2026 CyberDudeBivash Pvt Ltd
+
+A columnar copy of the rolling window, kept for aggregate questions: how
+many incidents per hour, per category, per severity and per source, and
+which categories are rising faster than usual. Each incident is one row
+across four typed arrays:
+
+    epochs      array('q')   published time
+    categories  array('H')   category code  } codes index into the
+    severities  array('B')   severity code  } per-column name tables
+    sources     array('H')   source code    } (the outlet that reported it first)
+
+Rollups are maintained as rows come and go. These are counts per (hour,
+category), per (hour, severity) and per source. Summaries, hourly
+histograms, trends and spike detection then cost the number of hour
+buckets, not the size of the window. Ad-hoc filtered counts scan the
+integer columns instead of the incident objects.
+
+The engine maintains one WindowStats next to the ranking and the search
+index, and writes summary() as threat-stats.json every run.
+"""
+
+import math
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from feed_writer import hour_key
+from timestamps import epoch_to_iso
+
+HOUR = 3600
+
+# Spike detection: the hour must hold at least SPIKE_MIN_COUNT incidents and
+# sit SPIKE_THRESHOLD standard deviations above the category's other hours
+SPIKE_MIN_COUNT = 5
+SPIKE_THRESHOLD = 3.0
+
+# Hours on each side of the trend comparison
+TREND_HOURS = 6
+
+FIELDS = ('category', 'severity', 'source')
+
+
+class _Codes:
+    """Name <-> small integer code table for one column"""
+
+    __slots__ = ('names', 'codes')
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def code(self, name: str) -> int:
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+
+class WindowStats:
+    """Columnar incident window with incrementally maintained rollups"""
+
+    def __init__(self, incidents: Iterable = ()):
+        self.epochs = array('q')
+        self.categories = array('H')
+        self.severities = array('B')
+        self.sources = array('H')
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._codes = {field: _Codes() for field in FIELDS}
+
+        # (hour, code) -> count, and code -> count
+        self._hourly: Dict[str, Dict[Tuple[int, int], int]] = {'category': {}, 'severity': {}}
+        self._totals: Dict[str, Dict[int, int]] = {field: {} for field in FIELDS}
+        self._lock = threading.Lock()
+
+        for incident in incidents:
+            self._add(incident)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, incident_id: str) -> bool:
+        return incident_id in self._rows
+
+    # -- maintenance -----------------------------------------------------
+
+    def add(self, incident):
+        with self._lock:
+            self._add(incident)
+
+    def remove(self, incident_id: str):
+        with self._lock:
+            self._remove(incident_id)
+
+    def update(self, incident):
+        """Re-count an incident whose time, category, severity or source changed (e.g. a merge)"""
+        with self._lock:
+            row = self._rows.get(incident['id'])
+            if row is None:
+                return self._add(incident)
+            epoch, new_epoch = self.epochs[row], incident['epoch']
+            codes = self._row_codes(row)
+            new = {field: self._codes[field].code(incident[field]) for field in FIELDS}
+            if new == codes and new_epoch == epoch:
+                return
+            self._count(epoch, codes, -1)
+            self.epochs[row] = new_epoch
+            self.categories[row], self.severities[row], self.sources[row] = (
+                new['category'], new['severity'], new['source'])
+            self._count(new_epoch, new, 1)
+
+    def _add(self, incident):
+        incident_id = incident['id']
+        if incident_id in self._rows:
+            return
+        codes = {field: self._codes[field].code(incident[field]) for field in FIELDS}
+        self._rows[incident_id] = len(self._ids)
+        self._ids.append(incident_id)
+        self.epochs.append(incident['epoch'])
+        self.categories.append(codes['category'])
+        self.severities.append(codes['severity'])
+        self.sources.append(codes['source'])
+        self._count(incident['epoch'], codes, 1)
+
+    def _remove(self, incident_id: str):
+        row = self._rows.pop(incident_id, None)
+        if row is None:
+            return
+        self._count(self.epochs[row], self._row_codes(row), -1)
+
+        # Move the last row into the hole so the columns stay dense
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+            for column in (self.epochs, self.categories, self.severities, self.sources):
+                column[row] = column[last]
+        self._ids.pop()
+        for column in (self.epochs, self.categories, self.severities, self.sources):
+            column.pop()
+
+    def _row_codes(self, row: int) -> Dict[str, int]:
+        return {'category': self.categories[row], 'severity': self.severities[row], 'source': self.sources[row]}
+
+    def _count(self, epoch: int, codes: Dict[str, int], delta: int):
+        hour = epoch // HOUR
+        for field, code in codes.items():
+            _bump(self._totals[field], code, delta)
+            if field in self._hourly:
+                _bump(self._hourly[field], (hour, code), delta)
+
+    # -- rollups (cost independent of the window size) -------------------
+
+    def totals(self, field: str) -> Dict[str, int]:
+        """Incidents per category / severity / source, largest first"""
+        names = self._codes[field].names
+        with self._lock:
+            counts = [(names[code], count) for code, count in self._totals[field].items()]
+        return dict(sorted(counts, key=lambda item: (-item[1], item[0])))
+
+    def hours(self, now: float, hours: int = 24) -> List[int]:
+        """The last `hours` hour buckets up to and including now's, oldest first"""
+        current = int(now) // HOUR
+        return list(range(current - hours + 1, current + 1))
+
+    def hourly(self, field: str, now: float, hours: int = 24) -> Dict[str, List[int]]:
+        """Per category (or severity) counts for each of the last `hours` hours, oldest first"""
+        buckets = self.hours(now, hours)
+        first = buckets[0]
+        names = self._codes[field].names
+        series: Dict[str, List[int]] = {}
+        with self._lock:
+            for (hour, code), count in self._hourly[field].items():
+                if first <= hour <= buckets[-1]:
+                    series.setdefault(names[code], [0] * hours)[hour - first] = count
+        return dict(sorted(series.items()))
+
+    def trend(self, now: float, hours: int = TREND_HOURS) -> Dict[str, Dict]:
+        """Per category: incidents in the last `hours` hours against the `hours` before"""
+        trends = {}
+        for name, series in self.hourly('category', now, 2 * hours).items():
+            last, previous = sum(series[hours:]), sum(series[:hours])
+            change = (last - previous) / previous if previous else None
+            trends[name] = {'last': last, 'previous': previous,
+                            'change': round(change, 3) if change is not None else None}
+        return trends
+
+    def spikes(self, now: float, hours: int = 24, threshold: float = SPIKE_THRESHOLD,
+               min_count: int = SPIKE_MIN_COUNT) -> List[Dict]:
+        """Categories whose current or previous hour stands out from their other hours.
+
+        The baseline is the mean and standard deviation of the category's
+        other hours in the window. The deviation is floored at the square
+        root of the mean (counts are roughly Poisson) and at 1, so a
+        category that is usually silent needs more than one burst to spike.
+        """
+        buckets = self.hours(now, hours)
+        found = []
+        for name, series in self.hourly('category', now, hours).items():
+            for pos in (hours - 1, hours - 2):
+                count = series[pos]
+                if count < min_count:
+                    continue
+                others = series[:pos] + series[pos + 1:]
+                mean = sum(others) / len(others)
+                deviation = math.sqrt(sum((c - mean) ** 2 for c in others) / len(others))
+                deviation = max(deviation, math.sqrt(mean), 1.0)
+                score = (count - mean) / deviation
+                if score >= threshold:
+                    found.append({'category': name, 'hour': hour_key(buckets[pos] * HOUR), 'count': count,
+                                  'baseline': round(mean, 2), 'score': round(score, 2)})
+                    break
+        return sorted(found, key=lambda spike: -spike['score'])
+
+    def summary(self, now: float, hours: int = 24) -> Dict:
+        """Everything behind threat-stats.json"""
+        return {
+            'generated': epoch_to_iso(int(now)),
+            'total_incidents': len(self),
+            'severities': self.totals('severity'),
+            'categories': self.totals('category'),
+            'sources': self.totals('source'),
+            'hourly': {
+                'hours': [hour_key(hour * HOUR) for hour in self.hours(now, hours)],
+                'categories': self.hourly('category', now, hours),
+                'severities': self.hourly('severity', now, hours)
+            },
+            'trend': {'hours': TREND_HOURS, 'categories': self.trend(now)},
+            'spikes': self.spikes(now, hours)
+        }
+
+    # -- ad-hoc queries (one pass over the integer columns) --------------
+
+    def count(self, since: Optional[float] = None, until: Optional[float] = None, category: Optional[str] = None,
+              severity: Optional[str] = None, source: Optional[str] = None) -> int:
+        """Incidents in [since, until) matching every given category / severity / source"""
+        return sum(1 for _ in self._select(since, until, category, severity, source))
+
+    def histogram(self, field: str, bucket: int = HOUR, since: Optional[float] = None,
+                  until: Optional[float] = None, **filters) -> Dict[str, Dict[int, int]]:
+        """{name: {bucket start epoch: count}} for any field and bucket width, e.g.
+        histogram('source', bucket=900, category='Ransomware')"""
+        column = {'category': self.categories, 'severity': self.severities, 'source': self.sources}[field]
+        names = self._codes[field].names
+        counts: Dict[Tuple[int, int], int] = {}
+        with self._lock:
+            for row in self._select(since, until, locked=True, **filters):
+                key = (column[row], self.epochs[row] // bucket * bucket)
+                counts[key] = counts.get(key, 0) + 1
+        histogram: Dict[str, Dict[int, int]] = {}
+        for (code, start), count in sorted(counts.items(), key=lambda item: item[0][1]):
+            histogram.setdefault(names[code], {})[start] = count
+        return histogram
+
+    def _select(self, since: Optional[float] = None, until: Optional[float] = None,
+                category: Optional[str] = None, severity: Optional[str] = None,
+                source: Optional[str] = None, locked: bool = False):
+        """Rows matching the filters (a name never seen matches nothing)"""
+        wanted = []
+        for field, column, name in (('category', self.categories, category), ('severity', self.severities, severity),
+                                    ('source', self.sources, source)):
+            if name is not None:
+                code = self._codes[field].codes.get(name)
+                if code is None:
+                    return
+                wanted.append((column, code))
+        if not locked:
+            with self._lock:
+                rows = list(self._rows_in(since, until, wanted))
+            yield from rows
+        else:
+            yield from self._rows_in(since, until, wanted)
+
+    def _rows_in(self, since, until, wanted):
+        low = -math.inf if since is None else since
+        high = math.inf if until is None else until
+        for row, epoch in enumerate(self.epochs):
+            if low <= epoch < high and all(column[row] == code for column, code in wanted):
+                yield row
+
+
+def _bump(counts: Dict, key, delta: int):
+    count = counts.get(key, 0) + delta
+    if count:
+        counts[key] = count
+    else:
+        counts.pop(key, None)
@@ -14,15 +14,38 @@
 """
 
 import json
+import gzip
+import random
+import signal
+import threading
 import urllib.request
 import urllib.error
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional
 import hashlib
 from pathlib import Path
 import time
-import xml.etree.ElementTree as ET
-import re
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from feed_cache import FeedCache
+from feed_parser import iter_feed_items
+from classifier import KeywordClassifier, DEFAULT_RULES
+from incident_store import IncidentStore
+from near_dedup import NearDuplicateIndex, cluster, merge_into, signature
+from sources import Source, SourceScheduler, load_sources
+from changelog import ChangeLog
+from timestamps import TimestampParser, epoch_to_iso, now_epoch
+from models import Incident, SEVERITY_SCORES
+from ranking import RankedWindow
+from ioc import MALWARE_FAMILIES, IOCExtractor, IOCIndex
+from search import SearchIndex
+from stats import WindowStats
+from archive import IncidentArchive
+from feed_writer import (SHARD_DIR, atomic_open, encode_incidents, sync_compressed, write_feed, write_ndjson,
+                         write_shards)
+from fragments import FRAGMENT_DIR, write_fragments
+from metrics import PROFILE_MODES, CountingReader, PipelineMetrics
+from pipeline import ParsePool, build_incident, read_feed, stream_stages
 
 class CyberDudeBivashThreatIntel:
     """
@@ -33,19 +56,113 @@ class CyberDudeBivashThreatIntel:
     VERSION = "2.0.0"
     BRAND = "CYBERDUDEBIVASH® THREAT-INTEL LIVE"
     
-    def __init__(self, output_dir: str = "data"):
+    # Fetch stage budgets (seconds): whole run, and the default per RSS feed
+    # (sources.json overrides per source)
+    RUN_DEADLINE = 45
+    FEED_TIMEOUT = 15
+    MAX_WORKERS = 16
+    
+    # Items examined per RSS feed unless the source sets item_limit
+    FEED_ITEM_LIMIT = 8
+    
+    # Keyword rule table for relevance / category / severity (see classifier.py)
+    CLASSIFIER_RULES = DEFAULT_RULES
+    
+    SEVERITY_SCORES = SEVERITY_SCORES
+    
+    # Malware family -> aliases recognised as IOCs (see ioc.py)
+    MALWARE_FAMILIES = MALWARE_FAMILIES
+    
+    def __init__(self, output_dir: str = "data", use_cache: bool = True, incremental: bool = True,
+                 sources_config: Optional[str] = None, metrics_dir: Optional[str] = None,
+                 profile: Optional[str] = None, banner: bool = True, archive: bool = True,
+                 archive_days: Optional[int] = None):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True, parents=True)
         
-        # 24-hour rolling window
+        # Per-stage / per-source instrumentation (threat-intel.prom, runs.ndjson)
+        self.metrics = PipelineMetrics(Path(metrics_dir) if metrics_dir else self.output_dir / '.metrics',
+                                       profile=profile)
+        
+        # Source plugins from sources.json, each polled on its own interval
+        self.scheduler = SourceScheduler(load_sources(sources_config))
+        
+        # Conditional-GET response cache (ETag / Last-Modified)
+        self.http_cache = FeedCache(self.output_dir / '.cache' / 'http') if use_cache else None
+        
+        # Rolling window persisted across runs; only unseen items get processed
+        self.store = IncidentStore(self.output_dir / '.state' / 'incidents.db') if incremental else None
+        self._known_ids = frozenset()
+        
+        # Versioned added/updated/expired log behind threat-feed-delta.json
+        self.changelog = ChangeLog(self.output_dir / '.state' / 'changelog.json')
+        
+        # Every incident the changelog sees added is appended to a daily
+        # gzip NDJSON segment, so history outlives the 24-hour window
+        self.archive = IncidentArchive(self.output_dir / 'archive', max_days=archive_days) if archive else None
+        
+        # MinHash/LSH index and ranked view of the window, built on first use
+        # and maintained incrementally afterwards
+        self.near_dups: Optional[NearDuplicateIndex] = None
+        self.ranking: Optional[RankedWindow] = None
+        
+        self.classifier = KeywordClassifier(self.CLASSIFIER_RULES)
+        
+        # IOCs are extracted once per new incident; the inverted index
+        # (IOC -> incident IDs) follows the window like the ranking does
+        self.ioc_extractor = IOCExtractor(self.MALWARE_FAMILIES)
+        self.iocs: Optional[IOCIndex] = None
+        
+        # BM25 keyword index of the window (title, description, sources),
+        # maintained the same way and shared with the HTTP API
+        self.search: Optional[SearchIndex] = None
+        
+        # Columnar counts of the window (per hour, category, severity and
+        # source), maintained the same way and written as threat-stats.json
+        self.stats: Optional[WindowStats] = None
+        
+        # 24-hour rolling window (moved forward at the start of every run)
         self.cutoff_time = datetime.utcnow() - timedelta(hours=24)
+        self.cutoff_epoch = now_epoch() - 24 * 3600
+        
+        # Parses each incident's date once, remembering each source's format
+        self.timestamps = TimestampParser()
+        
+        # Worker processes that parse and classify fetched feeds (see
+        # pipeline.py); None parses on the fetch threads
+        self.parse_pool: Optional[ParsePool] = None
+        
+        # Advertised as metadata.next_update; the daemon sets its poll interval
+        self.update_interval = 3600
+        
+        # Built-in HTTP API (api_server.ThreatIntelAPI), attached by --serve
+        self.api = None
+        
+        # Extra feed artifacts (see feed_writer.py): per-category / severity /
+        # hour shards with a manifest, and an NDJSON copy of the full feed
+        self.shard_feeds = True
+        self.ndjson_feed = False
+        
+        # Pre-rendered, paginated dashboard / widget HTML (see fragments.py),
+        # and .gz / .br siblings of every published file for static hosting
+        self.html_fragments = True
+        self.precompress = False
+        
+        # Opens every feed request; benchmarks inject an in-memory fetcher
+        self.urlopen = urllib.request.urlopen
         
         # User agent for requests
         self.headers = {
-            'User-Agent': 'CYBERDUDEBIVASH-ThreatIntel/2.0 (+https://www.cyberdudebivash.com)'
+            'User-Agent': 'CYBERDUDEBIVASH-ThreatIntel/2.0 (+https://www.cyberdudebivash.com)',
+            'Accept-Encoding': 'gzip'
         }
         
-        self._print_banner()
+        # Per-source outcome of the last fetch stage (ok / timeout / error)
+        self.source_status: Dict[str, Dict] = {}
+        self._run_deadline: Optional[float] = None
+        
+        if banner:
+            self._print_banner()
     
     def _print_banner(self):
         """Print startup banner"""
@@ -60,146 +177,188 @@ class CyberDudeBivashThreatIntel:
         print(f"📅 Fetching incidents from last 24 hours (since {self.cutoff_time.strftime('%Y-%m-%d %H:%M UTC')})")
         print()
     
-    def fetch_all_intelligence(self) -> List[Dict]:
+    @property
+    def sources(self) -> List[Source]:
+        return self.scheduler.sources
+    
+    @sources.setter
+    def sources(self, sources: List[Source]):
+        self.scheduler = SourceScheduler(sources)
+    
+    def fetch_all_intelligence(self) -> List[Incident]:
         """Fetch from all intelligence sources"""
         
-        all_incidents = []
+        self.cutoff_time = datetime.utcnow() - timedelta(hours=24)
+        self.cutoff_epoch = now_epoch() - 24 * 3600
         
         print("🔍 FETCHING FROM INTELLIGENCE SOURCES...\n")
         
-        # Source 1: Security RSS Feeds
-        print("  → Security News Feeds (BleepingComputer, HackerNews, DarkReading)...")
-        all_incidents.extend(self._fetch_security_feeds())
-        
-        # Source 2: Public Breach Databases
-        print("  → Breach Database Feeds...")
-        all_incidents.extend(self._fetch_breach_data())
-        
-        # Source 3: CVE Feeds
-        print("  → CVE/Vulnerability Feeds...")
-        all_incidents.extend(self._fetch_cve_data())
-        
-        # Source 4: Malware Intelligence
-        print("  → Malware Intelligence Feeds...")
-        all_incidents.extend(self._fetch_malware_intel())
+        # Only sources whose poll interval elapsed are fetched; the others
+        # contribute the items from their last successful poll
+        due = self.scheduler.due()
+        for source in due:
+            print(f"  → {source.label}...")
+        
+        self.source_status = {}
+        self._known_ids = frozenset(self.store.ids()) if self.store is not None else frozenset()
+        self._run_deadline = time.monotonic() + self.RUN_DEADLINE
+        self.metrics.gauge('sources_due', len(due))
+        with self.metrics.stage('fetch') as stage:
+            try:
+                results = self._run_concurrently(
+                    [(source.name, lambda s=source: s.fetch(self), source.timeout) for source in due]
+                )
+            finally:
+                self._run_deadline = None
+            
+            for source, items in zip(due, results):
+                self.scheduler.record(source, items, ok=self.source_status[source.name]['status'] == 'ok')
+            stage.items_out = self.scheduler.latest_count()
         
-        # Source 5: Government/CERT Advisories  
-        print("  → Government CERT Advisories...")
-        all_incidents.extend(self._fetch_cert_advisories())
+        partial = self.partial_sources()
+        if partial:
+            print(f"\n  ⏱️  Partial results - missed budget: {', '.join(partial)}")
         
-        # Process and filter
+        # Process and filter in one streaming pass, one incident at a time
         print("\n📊 PROCESSING INTELLIGENCE...")
-        incidents = self._deduplicate(all_incidents)
-        incidents = self._filter_by_time(incidents)
-        incidents = self._enrich_and_score(incidents)
+        if self.store is not None:
+            sink = ('merge', self._merge_into_store)
+        else:
+            sink = ('score', lambda stream: self._enrich_and_score(cluster(stream)))
+        incidents = stream_stages(self.metrics, self.scheduler.latest(), [
+            ('normalize', self._normalize),
+            ('deduplicate', self._deduplicate),
+            ('filter', self._filter_by_time),
+            ('extract_iocs', self._extract_iocs)
+        ], sink)
+        self.metrics.gauge('window_incidents', len(incidents))
+        self.metrics.gauge('ioc_values', len(self.iocs))
         
         print(f"✅ PROCESSED {len(incidents)} UNIQUE INCIDENTS\n")
         
         return incidents
     
-    def _fetch_url(self, url: str, timeout: int = 15) -> Optional[str]:
-        """Fetch URL content with error handling"""
-        try:
-            req = urllib.request.Request(url, headers=self.headers)
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                return response.read().decode('utf-8')
-        except Exception as e:
-            print(f"    ⚠️  Fetch error: {e}")
-            return None
+    def _run_concurrently(self, tasks: List[tuple]) -> List[List[Dict]]:
+        """Run (name, fetcher, budget) tasks in a thread pool.
+        
+        Results come back in task order. Each budget counts from the moment
+        the task starts on a worker, so queued sources are not penalised. A
+        task that misses its budget or the run deadline contributes no items
+        and is recorded in source_status; its thread is abandoned rather
+        than awaited, and an exception only fails its own task.
+        """
+        if not tasks:
+            return []
+        
+        deadline = self._run_deadline or time.monotonic() + self.RUN_DEADLINE
+        pool = ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(tasks)),
+                                  thread_name_prefix='cdb-fetch')
+        started = time.monotonic()
+        begun: Dict[int, float] = {}
+        
+        def run(index, fn):
+            begun[index] = time.monotonic()
+            return fn()
+        
+        pending = {
+            pool.submit(run, index, fn): (index, name, budget)
+            for index, (name, fn, budget) in enumerate(tasks)
+        }
+        results: List[List[Dict]] = [[] for _ in tasks]
+        
+        def finish(index, name, status, items):
+            if status == 'timeout':
+                print(f"    ⏱️  {name} missed its {tasks[index][2]}s budget")
+            self.source_status[name] = {
+                'status': status,
+                'items': len(items),
+                'elapsed': round(time.monotonic() - begun.get(index, started), 3)
+            }
+            self.metrics.source(name, **self.source_status[name])
+            results[index] = items
+        
+        while pending:
+            done, _ = wait(pending, timeout=0.25, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, name, _ = pending.pop(future)
+                try:
+                    finish(index, name, 'ok', future.result())
+                except Exception as e:
+                    print(f"    ⚠️  {name} error: {e}")
+                    finish(index, name, 'error', [])
+            
+            now = time.monotonic()
+            for future, (index, name, budget) in list(pending.items()):
+                if now >= deadline or (index in begun and now >= begun[index] + budget):
+                    del pending[future]
+                    finish(index, name, 'timeout', [])
+        
+        pool.shutdown(wait=False, cancel_futures=True)
+        return results
     
-    def _fetch_security_feeds(self) -> List[Dict]:
-        """Fetch from security news RSS feeds"""
-        incidents = []
+    def partial_sources(self) -> List[str]:
+        """Sources that timed out or failed during the last fetch stage"""
+        return [name for name, st in self.source_status.items() if st['status'] != 'ok']
+    
+    def _fetch_feed(self, feed_info: Dict) -> List[Dict]:
+        """Stream and parse a single RSS/Atom feed (raises on fetch errors)"""
+        url = feed_info['url']
+        feed_info = dict(feed_info, item_limit=feed_info.get('item_limit', self.FEED_ITEM_LIMIT))
         
-        feeds = [
-            {
-                'url': 'https://www.bleepingcomputer.com/feed/',
-                'name': 'BleepingComputer',
-                'category_hints': {
-                    'ransomware': 'Ransomware',
-                    'malware': 'Malware',
-                    'breach': 'Data Breach',
-                    'zero-day': 'Zero-Day',
-                    'vulnerability': 'CVE'
-                }
-            },
-            {
-                'url': 'https://feeds.feedburner.com/TheHackersNews',
-                'name': 'The Hacker News',
-                'category_hints': {
-                    'breach': 'Data Breach',
-                    'hacking': 'Incident',
-                    'malware': 'Malware',
-                    'apt': 'APT'
-                }
-            }
-        ]
+        # Revalidate against the response cache (ETag / Last-Modified)
+        headers = dict(self.headers)
+        if self.http_cache:
+            headers.update(self.http_cache.conditional_headers(url))
         
-        for feed_info in feeds:
-            try:
-                content = self._fetch_url(feed_info['url'])
-                if not content:
-                    continue
-                
-                # Parse RSS/Atom feed
-                root = ET.fromstring(content)
+        try:
+            req = urllib.request.Request(url, headers=headers)
+            with self.urlopen(req, timeout=feed_info.get('timeout', self.FEED_TIMEOUT)) as response:
+                wire = CountingReader(response)
+                gzipped = response.headers.get('Content-Encoding', '').lower() == 'gzip'
                 
-                # Try RSS format first
-                items = root.findall('.//item')
-                if not items:
-                    # Try Atom format
-                    items = root.findall('.//{http://www.w3.org/2005/Atom}entry')
+                if self.parse_pool is not None:
+                    # Parsed in a worker process; items it already knows are
+                    # dropped here, since the stored window stays in this process
+                    with self.parse_pool.slot():
+                        incidents, read = self.parse_pool.parse(wire.read(), gzipped, feed_info,
+                                                                self.cutoff_epoch)
+                    incidents = [i for i in incidents if self._incident_id(i['title']) not in self._known_ids]
+                else:
+                    # Items arrive as the socket delivers them; stop reading at the
+                    # item limit or at the first item older than the 24h window
+                    stream = gzip.GzipFile(fileobj=wire) if gzipped else wire
+                    incidents, read = read_feed(iter_feed_items(stream), feed_info, self.cutoff_epoch,
+                                                self.timestamps,
+                                                lambda item, epoch: self._incident_from_item(item, feed_info, epoch))
+                self.metrics.source(feed_info['name'], bytes=wire.count, dropped=read - len(incidents))
                 
-                for item in items[:8]:  # Top 8 from each feed
-                    title_elem = item.find('title') or item.find('{http://www.w3.org/2005/Atom}title')
-                    link_elem = item.find('link') or item.find('{http://www.w3.org/2005/Atom}link')
-                    desc_elem = item.find('description') or item.find('{http://www.w3.org/2005/Atom}summary')
-                    date_elem = item.find('pubDate') or item.find('{http://www.w3.org/2005/Atom}published')
-                    
-                    if title_elem is None:
-                        continue
-                    
-                    title = title_elem.text or ""
-                    
-                    # Filter for cyber security relevance
-                    keywords = ['breach', 'ransomware', 'malware', 'hack', 'exploit',
-                               'vulnerability', 'attack', 'zero-day', 'apt', 'threat',
-                               'phishing', 'trojan', 'backdoor', 'botnet']
-                    
-                    if not any(kw in title.lower() for kw in keywords):
-                        continue
-                    
-                    url = ""
-                    if link_elem is not None:
-                        url = link_elem.get('href', '') or link_elem.text or ""
-                    
-                    description = ""
-                    if desc_elem is not None:
-                        description = desc_elem.text or ""
-                        # Clean HTML tags
-                        description = re.sub('<[^<]+?>', '', description)[:250]
-                    
-                    pub_date = ""
-                    if date_elem is not None:
-                        pub_date = date_elem.text or ""
-                    
-                    incidents.append({
-                        'title': title.strip(),
-                        'description': description.strip(),
-                        'source': feed_info['name'],
-                        'category': self._categorize_from_text(title, feed_info['category_hints']),
-                        'severity': self._assess_severity(title),
-                        'url': url.strip(),
-                        'timestamp': self._parse_timestamp(pub_date),
-                        'region': 'Global',
-                        'tier': 'free'
-                    })
-            
-            except Exception as e:
-                print(f"    ⚠️  {feed_info['name']} error: {e}")
+                if self.http_cache:
+                    self.http_cache.store(url, incidents, response.headers.get('ETag'),
+                                          response.headers.get('Last-Modified'))
+        
+        except urllib.error.HTTPError as e:
+            # Unchanged since the last poll - reuse the incidents parsed then
+            if e.code == 304 and self.http_cache:
+                cached = self.http_cache.load_items(url)
+                if cached is not None:
+                    self.metrics.source(feed_info['name'], cache_hits=1)
+                    return cached
+            # Other failures propagate so the source is reported as errored
+            raise
         
         return incidents
     
+    def _incident_from_item(self, item: Dict, feed_info: Dict, epoch: Optional[int]) -> Optional[Dict]:
+        """Build an incident from a parsed feed item (None if irrelevant or known)"""
+        if item['title'] is None:
+            return None
+        
+        # Already in the stored window from an earlier run
+        if self._incident_id(item['title'].strip()) in self._known_ids:
+            return None
+        
+        return build_incident(item, feed_info, epoch, self.classifier)
+    
     def _fetch_breach_data(self) -> List[Dict]:
         """Fetch breach notification data"""
         incidents = []
@@ -342,189 +501,308 @@ class CyberDudeBivashThreatIntel:
     
     def _categorize_from_text(self, text: str, hints: Dict[str, str]) -> str:
         """Categorize incident from text with hints"""
-        text_lower = text.lower()
-        
-        # Check hints first
-        for keyword, category in hints.items():
-            if keyword in text_lower:
-                return category
-        
-        # Fallback categorization
-        if 'breach' in text_lower or 'leak' in text_lower:
-            return 'Data Breach'
-        elif 'ransomware' in text_lower:
-            return 'Ransomware'
-        elif 'malware' in text_lower:
-            return 'Malware'
-        elif 'zero-day' in text_lower or '0day' in text_lower:
-            return 'Zero-Day'
-        elif 'apt' in text_lower or 'nation' in text_lower:
-            return 'APT'
-        elif 'vulnerability' in text_lower or 'cve' in text_lower:
-            return 'CVE'
-        else:
-            return 'Incident'
+        return self.classifier.with_hints(hints).classify(text).category
     
     def _assess_severity(self, text: str) -> str:
         """Assess severity from text"""
-        text_lower = text.lower()
-        
-        critical_kw = ['critical', 'zero-day', 'actively exploited', 'urgent', 'emergency']
-        high_kw = ['major', 'massive', 'widespread', 'severe', 'serious']
-        
-        if any(kw in text_lower for kw in critical_kw):
-            return 'CRITICAL'
-        elif any(kw in text_lower for kw in high_kw):
-            return 'HIGH'
-        else:
-            return 'MEDIUM'
-    
-    def _parse_timestamp(self, timestamp_str: str) -> str:
-        """Parse timestamp to ISO format"""
-        if not timestamp_str:
-            return datetime.utcnow().isoformat() + 'Z'
-        
-        # Try various formats
-        formats = [
-            '%a, %d %b %Y %H:%M:%S %Z',
-            '%a, %d %b %Y %H:%M:%S %z',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%Y-%m-%d %H:%M:%S'
-        ]
-        
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(timestamp_str.strip(), fmt)
-                return dt.isoformat() + 'Z'
-            except:
-                continue
-        
-        return datetime.utcnow().isoformat() + 'Z'
+        return self.classifier.classify(text).severity
+    
+    def _normalize(self, items: Iterable[Dict]) -> Iterator[Incident]:
+        """Incidents with an integer epoch and a canonical UTC timestamp.
+        
+        Feed items arrive already stamped; this covers the other sources.
+        Unparseable dates count as "now", as before.
+        """
+        for item in items:
+            if 'epoch' not in item:
+                epoch = self.timestamps.parse(item.get('timestamp'), item.get('source'))
+                if epoch is None:
+                    epoch = now_epoch()
+                item['epoch'] = epoch
+                item['timestamp'] = epoch_to_iso(epoch)
+            yield Incident.from_json(item)
     
-    def _deduplicate(self, incidents: List[Dict]) -> List[Dict]:
+    def _incident_id(self, title: str) -> str:
+        """Stable incident ID: MD5 of the lowercased title"""
+        return hashlib.md5(title.lower().encode()).hexdigest()
+    
+    def _deduplicate(self, incidents: Iterable[Incident]) -> Iterator[Incident]:
         """Remove duplicate incidents"""
         seen = set()
-        unique = []
         
         for incident in incidents:
             # Create hash from title
-            hash_key = hashlib.md5(incident['title'].lower().encode()).hexdigest()
+            hash_key = self._incident_id(incident.title)
             
             if hash_key not in seen:
                 seen.add(hash_key)
-                unique.append(incident)
-        
-        return unique
+                incident.id = hash_key
+                yield incident
     
-    def _filter_by_time(self, incidents: List[Dict]) -> List[Dict]:
+    def _filter_by_time(self, incidents: Iterable[Incident]) -> Iterator[Incident]:
         """Filter to last 24 hours"""
-        filtered = []
-        
+        cutoff = self.cutoff_epoch
+        return (i for i in incidents if i.epoch >= cutoff)
+    
+    def _extract_iocs(self, incidents: Iterable[Incident]) -> Iterator[Incident]:
+        """Extract IOCs from incidents not yet in the window"""
+        extract = self.ioc_extractor.extract
+        # Without the store every run rebuilds the window from the feeds;
+        # incidents whose text the last run already saw keep its IOCs
+        previous = self.ranking.get if self.store is None and self.ranking is not None else lambda _: None
         for incident in incidents:
-            try:
-                ts = incident['timestamp'].replace('Z', '+00:00')
-                incident_time = datetime.fromisoformat(ts)
-                
-                if incident_time.replace(tzinfo=None) >= self.cutoff_time:
-                    filtered.append(incident)
-            except:
-                # Include if timestamp parsing fails
-                filtered.append(incident)
-        
-        return filtered
-    
-    def _enrich_and_score(self, incidents: List[Dict]) -> List[Dict]:
-        """Enrich incidents with scoring"""
-        
-        severity_scores = {
-            'CRITICAL': 4,
-            'HIGH': 3,
-            'MEDIUM': 2,
-            'LOW': 1
-        }
+            if incident.id not in self._known_ids:
+                seen = previous(incident.id)
+                if (seen is not None and seen.iocs is not None
+                        and (seen.title, seen.description) == (incident.title, incident.description)):
+                    iocs = seen.iocs
+                else:
+                    iocs = extract(f"{incident.title}\n{incident.description}")
+                incident.iocs = iocs
+                if iocs and incident.cve_id is None and 'cve' in iocs:
+                    incident.cve_id = iocs['cve'][0]
+            yield incident
+    
+    def _enrich_and_score(self, incidents: List[Incident]) -> List[Incident]:
+        """Score the window and bring the window indexes up to date with it.
+        
+        Without the store each run hands over the whole window afresh. The
+        indexes built on the first run are kept, and later runs only index
+        incidents that appeared, disappeared or changed since the last one.
+        """
         
         for incident in incidents:
             # Add score
-            incident['score'] = severity_scores.get(incident['severity'], 2)
-            
-            # Calculate time-based freshness
-            try:
-                ts = incident['timestamp'].replace('Z', '+00:00')
-                incident_time = datetime.fromisoformat(ts)
-                hours_old = (datetime.utcnow() - incident_time.replace(tzinfo=None)).total_seconds() / 3600
-                incident['hours_ago'] = max(0, int(hours_old))
-                incident['freshness_score'] = max(0, 24 - hours_old)
-            except:
-                incident['hours_ago'] = 0
-                incident['freshness_score'] = 24
-        
-        # Sort by severity then freshness
-        incidents.sort(key=lambda x: (x['score'], x['freshness_score']), reverse=True)
+            incident.score = self.SEVERITY_SCORES.get(incident.severity, 2)
+        
+        if self.ranking is None or self.iocs is None or self.search is None or self.stats is None:
+            # Rank by severity then recency
+            self.ranking = RankedWindow(incidents)
+            self.iocs = IOCIndex(self.ioc_extractor, incidents)
+            self.search = SearchIndex(incidents)
+            self.stats = WindowStats(incidents)
+            return self.ranking.ranked()
+        
+        current = {incident.id for incident in incidents}
+        for gone in [i.id for i in self.ranking if i.id not in current]:
+            self.ranking.remove(gone)
+            self.iocs.remove(gone)
+            self.search.remove(gone)
+            self.stats.remove(gone)
         
-        return incidents
+        for incident in incidents:
+            previous = self.ranking.get(incident.id)
+            if previous is None:
+                self.ranking.add(incident)
+                self.iocs.add(incident)
+                self.search.add(incident)
+                self.stats.add(incident)
+                continue
+            if previous is incident:
+                continue
+            same_text = (previous.title, previous.description) == (incident.title, incident.description)
+            if same_text and incident.iocs is None:
+                incident.iocs = previous.iocs
+            # Swaps the object in place unless its rank moved
+            self.ranking.add(incident)
+            if incident.iocs != previous.iocs:
+                self.iocs.update(incident)
+            if not same_text or (previous.sources, previous.source) != (incident.sources, incident.source):
+                self.search.update(incident)
+            self.stats.update(incident)
+        
+        return self.ranking.ranked()
     
-    def generate_feeds(self, incidents: List[Dict]):
+    def _merge_into_store(self, incidents: Iterable[Incident]) -> List[Incident]:
+        """Score unseen incidents into the persistent window and return the window.
+        
+        New items that near-duplicate an incident already in the window are
+        folded into it (extending its sources) instead of being stored.
+        """
+        expired = self.store.evict_before(self.cutoff_epoch)
+        
+        if (self.ranking is None or self.near_dups is None or self.iocs is None or self.search is None
+                or self.stats is None):
+            window = self.store.window()
+            self.ranking = RankedWindow(window)
+            self.iocs = IOCIndex(self.ioc_extractor, window)
+            self.search = SearchIndex(window)
+            self.stats = WindowStats(window)
+            self.near_dups = NearDuplicateIndex()
+            for incident in window:
+                self.near_dups.add(incident['id'], signature(incident))
+        ranking = self.ranking
+        for incident_id in expired:
+            ranking.remove(incident_id)
+            self.near_dups.remove(incident_id)
+            self.iocs.remove(incident_id)
+            self.search.remove(incident_id)
+            self.stats.remove(incident_id)
+        
+        fresh, changed, aliases = [], {}, {}
+        for incident in incidents:
+            if incident['id'] in self._known_ids:
+                continue
+            
+            incident.setdefault('sources', [incident['source']])
+            sig = signature(incident)
+            match = self.near_dups.query(sig)
+            if match is not None:
+                target = ranking.get(match)
+                if merge_into(target, incident):
+                    target['score'] = self.SEVERITY_SCORES.get(target['severity'], 2)
+                    ranking.update(target)
+                    self.iocs.update(target)
+                    self.search.update(target)
+                    self.stats.update(target)
+                    changed[match] = target
+                aliases[incident['id']] = match
+                continue
+            
+            incident['score'] = self.SEVERITY_SCORES.get(incident['severity'], 2)
+            self.near_dups.add(incident['id'], sig)
+            ranking.add(incident)
+            self.iocs.add(incident)
+            self.search.add(incident)
+            self.stats.add(incident)
+            fresh.append(incident)
+        
+        added = self.store.add(fresh)
+        self.store.update(list(changed.values()))
+        self.store.alias(aliases)
+        print(f"  → {added} new, {len(aliases)} merged, {len(expired)} expired, {len(ranking)} in rolling window")
+        
+        return ranking.ranked()
+    
+    def generate_feeds(self, incidents: List[Incident]):
         """Generate JSON feeds for dashboard and widget"""
         
+        with self.metrics.stage('generate_feeds', items_in=len(incidents)) as stage:
+            generation = self._generate_feeds(incidents)
+            stage.items_out = len(incidents)
+        
+        if self.archive is not None and generation and generation['added']:
+            added = set(generation['added'])
+            with self.metrics.stage('archive', items_in=len(added)) as stage:
+                stage.items_out = self.archive.append(i for i in incidents if i.id in added)
+            print(f"🗄️  ARCHIVED {stage.items_out} new incidents → {self.archive.root}/")
+    
+    def _generate_feeds(self, incidents: List[Incident]) -> Optional[Dict]:
+        generation = self.changelog.record(incidents)
+        now = time.time()
+        
         # Full feed
-        full_feed = {
-            'metadata': {
-                'product': self.BRAND,
-                'version': self.VERSION,
-                'copyright': '© 2026 CyberDudeBivash Pvt Ltd',
-                'contact': 'iambivash@cyberdudebivash.com',
-                'website': 'https://www.cyberdudebivash.com',
-                'generated': datetime.utcnow().isoformat() + 'Z',
-                'total_incidents': len(incidents),
-                'window': '24 hours',
-                'next_update': (datetime.utcnow() + timedelta(hours=1)).isoformat() + 'Z'
-            },
-            'incidents': incidents
+        metadata = {
+            'product': self.BRAND,
+            'version': self.VERSION,
+            'copyright': '© 2026 CyberDudeBivash Pvt Ltd',
+            'contact': 'iambivash@cyberdudebivash.com',
+            'website': 'https://www.cyberdudebivash.com',
+            'generated': datetime.utcnow().isoformat() + 'Z',
+            'total_incidents': len(incidents),
+            'window': '24 hours',
+            'next_update': (datetime.utcnow() + timedelta(seconds=self.update_interval)).isoformat() + 'Z',
+            'partial_sources': self.partial_sources(),
+            'feed_version': self.changelog.version
         }
         
+        # Each incident is encoded once; shards and NDJSON reuse the text
+        encoded = encode_incidents(incidents, now)
+        if self.shard_feeds or self.ndjson_feed:
+            encoded = list(encoded)
+        
         full_path = self.output_dir / 'threat-feed.json'
-        with open(full_path, 'w', encoding='utf-8') as f:
-            json.dump(full_feed, f, indent=2, ensure_ascii=False)
+        size = write_feed(full_path, metadata, encoded, self.precompress)
         
-        print(f"💾 SAVED FULL FEED: {full_path} ({len(incidents)} incidents)")
+        print(f"💾 SAVED FULL FEED: {full_path} ({len(incidents)} incidents, {size / 1024:.1f} KB)")
         
-        # Widget feed (top 10, compact)
+        if self.ndjson_feed:
+            ndjson_path = self.output_dir / 'threat-feed.ndjson'
+            write_ndjson(ndjson_path, encoded, self.precompress)
+            print(f"💾 SAVED NDJSON FEED: {ndjson_path}")
+        
+        if self.shard_feeds:
+            manifest = write_shards(self.output_dir / SHARD_DIR, metadata, incidents, encoded, self.precompress)
+            print(f"💾 SAVED FEED SHARDS: {self.output_dir / SHARD_DIR}/ ({len(manifest['categories'])} categories, "
+                  f"{len(manifest['severities'])} severities, {len(manifest['hours'])} hours)")
+        
+        # Delta feed for clients that already hold an earlier version
+        delta_path = self.output_dir / 'threat-feed-delta.json'
+        self._write_json_atomic(delta_path, self.changelog.static_document(incidents),
+                                separators=(',', ':'), ensure_ascii=False)
+        
+        if generation:
+            print(f"💾 SAVED DELTA FEED: {delta_path} (v{generation['version']}: "
+                  f"+{len(generation['added'])} ~{len(generation['updated'])} -{len(generation['expired'])})")
+        else:
+            print(f"💾 SAVED DELTA FEED: {delta_path} (v{self.changelog.version}: no changes)")
+        
+        widget_feed = self.build_widget_feed(incidents)
+        widget_path = self.output_dir / 'threat-feed-widget.json'
+        self._write_json_atomic(widget_path, widget_feed, indent=2)
+        
+        print(f"💾 SAVED WIDGET FEED: {widget_path} (top 10 for sidebar)")
+        
+        # Hourly / per-source rollups, trends and spikes of the window
+        stats_path = self.output_dir / 'threat-stats.json'
+        summary = self.window_stats(incidents).summary(now)
+        self._write_json_atomic(stats_path, summary, separators=(',', ':'), ensure_ascii=False)
+        spikes = ', '.join(f"{s['category']} ×{s['count']}" for s in summary['spikes']) or 'no spikes'
+        print(f"💾 SAVED STATS: {stats_path} ({spikes})")
+        
+        if self.html_fragments:
+            index = write_fragments(self.output_dir / FRAGMENT_DIR, metadata, incidents, now, self.precompress)
+            pages = len(index['all']['pages']) + len(index['widget']['pages']) + sum(
+                len(entry['pages']) for kind in ('categories', 'severities') for entry in index[kind].values())
+            print(f"💾 SAVED HTML FRAGMENTS: {self.output_dir / FRAGMENT_DIR}/ ({pages} pages, "
+                  f"{index['rewritten']} changed)")
+        
+        return generation
+    
+    def build_widget_feed(self, incidents: List[Incident]) -> Dict:
+        """Widget feed (top 10, compact)"""
+        if self.ranking is not None:
+            incidents = self.ranking.top(10)
         widget_incidents = [
             {
-                'title': i['title'][:80],
-                'category': i['category'],
-                'severity': i['severity'],
-                'hours_ago': i['hours_ago'],
-                'url': i['url']
+                'title': i.title[:80],
+                'category': i.category,
+                'severity': i.severity,
+                'hours_ago': i.hours_ago,
+                'url': i.url
             }
             for i in incidents[:10]
         ]
         
-        widget_feed = {
+        return {
             'brand': self.BRAND,
             'generated': datetime.utcnow().isoformat() + 'Z',
             'incidents': widget_incidents
         }
-        
-        widget_path = self.output_dir / 'threat-feed-widget.json'
-        with open(widget_path, 'w', encoding='utf-8') as f:
-            json.dump(widget_feed, f, indent=2)
-        
-        print(f"💾 SAVED WIDGET FEED: {widget_path} (top 10 for sidebar)")
     
-    def print_summary(self, incidents: List[Dict]):
+    def window_stats(self, incidents: List[Incident]) -> WindowStats:
+        """The maintained WindowStats, or one built from incidents before the first run"""
+        if self.stats is None:
+            self.stats = WindowStats(incidents)
+        return self.stats
+    
+    def _write_json_atomic(self, path: Path, data, **dump_kwargs):
+        """Write JSON to a temp file and rename it over path (see feed_writer.atomic_open)"""
+        with atomic_open(path) as f:
+            json.dump(data, f, **dump_kwargs)
+        sync_compressed(path, self.precompress)
+    
+    def print_summary(self, incidents: List[Incident]):
         """Print intelligence summary"""
         
         print("\n" + "="*70)
         print("📊 INTELLIGENCE SUMMARY\n")
         
+        stats = self.window_stats(incidents)
+        
         # By severity
         print("BY SEVERITY:")
-        severity_counts = {}
-        for i in incidents:
-            sev = i['severity']
-            severity_counts[sev] = severity_counts.get(sev, 0) + 1
+        severity_counts = stats.totals('severity')
         
         for sev in ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']:
             count = severity_counts.get(sev, 0)
@@ -534,14 +812,16 @@ class CyberDudeBivashThreatIntel:
         
         # By category
         print("\nBY CATEGORY:")
-        cat_counts = {}
-        for i in incidents:
-            cat = i['category']
-            cat_counts[cat] = cat_counts.get(cat, 0) + 1
-        
-        for cat, count in sorted(cat_counts.items(), key=lambda x: x[1], reverse=True)[:6]:
+        for cat, count in list(stats.totals('category').items())[:6]:
             print(f"  • {cat}: {count}")
         
+        spikes = stats.spikes(time.time())
+        if spikes:
+            print("\nSPIKING CATEGORIES:")
+            for spike in spikes:
+                print(f"  ⚠️  {spike['category']}: {spike['count']} in {spike['hour']}:00 "
+                      f"(usually {spike['baseline']:g}/hour)")
+        
         # Top 3 incidents
         print("\nTOP 3 CRITICAL THREATS:")
         for i, incident in enumerate(incidents[:3], 1):
@@ -552,15 +832,122 @@ class CyberDudeBivashThreatIntel:
         print(f"🌐 Feeds ready for CYBERDUDEBIVASH dashboard & widgets")
         print("\n© 2026 CyberDudeBivash Pvt Ltd | iambivash@cyberdudebivash.com\n")
 
+    def run_cycle(self) -> List[Incident]:
+        """One fetch → process → publish cycle, recorded as one metrics run"""
+        self.metrics.start_run()
+        ok = False
+        try:
+            with self.metrics.profiled():
+                incidents = self.fetch_all_intelligence()
+                self.generate_feeds(incidents)
+                if self.api is not None:
+                    with self.metrics.stage('publish', items_in=len(incidents)):
+                        self.api.publish(incidents, self.build_widget_feed(incidents), changelog=self.changelog,
+                                         search=self.search, stats=self.stats.summary(time.time()))
+            ok = True
+            return incidents
+        finally:
+            run = self.metrics.finish_run(ok)
+            print(f"⏱️  {self.metrics.summary(run)}")
+            profile = run.get('profile')
+            if profile and profile['mode'] == 'cprofile':
+                print(profile['top'])
+            elif profile:
+                print(f"🧠 Peak traced memory: {profile['peak_bytes'] / 2 ** 20:.1f} MB")
+    
+    def run_forever(self, interval: float = 300, jitter: float = 30,
+                    stop_event: Optional[threading.Event] = None):
+        """Poll on a schedule until stop_event is set.
+        
+        The engine (caches, store, near-duplicate index) stays warm between
+        cycles. Each sleep is interval plus up to `jitter` random seconds so
+        several instances don't hit the sources in lockstep.
+        """
+        stop_event = stop_event or threading.Event()
+        self.update_interval = interval + jitter
+        cycle = 0
+        
+        while not stop_event.is_set():
+            cycle += 1
+            started = time.monotonic()
+            print(f"🔄 CYCLE {cycle} - {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}")
+            try:
+                self.run_cycle()
+            except Exception as e:
+                # Keep serving the last published feed; retry next cycle
+                print(f"⚠️  Cycle {cycle} failed: {e}")
+            
+            delay = max(0.0, interval + random.uniform(0, jitter) - (time.monotonic() - started))
+            print(f"💤 Next cycle in {delay:.0f}s\n")
+            stop_event.wait(delay)
+        
+        print("🛑 THREAT-INTEL DAEMON STOPPED")
+
+
 def main():
     """Main execution"""
-    engine = CyberDudeBivashThreatIntel(output_dir='data')
+    import argparse
     
-    # Fetch all intelligence
-    incidents = engine.fetch_all_intelligence()
+    parser = argparse.ArgumentParser(description='CYBERDUDEBIVASH® Threat-Intel engine')
+    parser.add_argument('--output-dir', default='data', help='feed output directory')
+    parser.add_argument('--daemon', action='store_true', help='keep running and poll on a schedule')
+    parser.add_argument('--interval', type=float, default=300, help='daemon poll interval (seconds)')
+    parser.add_argument('--jitter', type=float, default=30, help='random extra delay per cycle (seconds)')
+    parser.add_argument('--serve', action='store_true', help='run the daemon with the built-in HTTP API')
+    parser.add_argument('--host', default='127.0.0.1', help='HTTP API bind address')
+    parser.add_argument('--port', type=int, default=8080, help='HTTP API port')
+    parser.add_argument('--ndjson', action='store_true', help='also write threat-feed.ndjson')
+    parser.add_argument('--no-shards', action='store_true', help='skip the per-category / hour shards')
+    parser.add_argument('--no-fragments', action='store_true', help='skip the pre-rendered HTML fragments')
+    parser.add_argument('--precompress', action='store_true',
+                        help='write .gz (and .br, with the brotli package) beside every published file')
+    parser.add_argument('--metrics-dir', help='where threat-intel.prom / runs.ndjson go (default <output-dir>/.metrics)')
+    parser.add_argument('--profile', choices=PROFILE_MODES, help='profile every run with cProfile or tracemalloc')
+    parser.add_argument('--no-banner', action='store_true', help='skip the startup banner')
+    parser.add_argument('--no-archive', action='store_true', help='do not append incidents to data/archive/')
+    parser.add_argument('--archive-days', type=int, help='delete archive segments older than this many days')
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help='parse and classify feeds in this many worker processes (0: on the fetch threads)')
+    args = parser.parse_args()
+    
+    engine = CyberDudeBivashThreatIntel(output_dir=args.output_dir, metrics_dir=args.metrics_dir,
+                                        profile=args.profile, banner=not args.no_banner,
+                                        archive=not args.no_archive, archive_days=args.archive_days)
+    engine.ndjson_feed = args.ndjson
+    engine.shard_feeds = not args.no_shards
+    engine.html_fragments = not args.no_fragments
+    engine.precompress = args.precompress
+    if args.parse_workers > 0:
+        engine.parse_pool = ParsePool(args.parse_workers, engine.CLASSIFIER_RULES)
+    
+    if args.daemon or args.serve:
+        if args.serve:
+            from api_server import ThreatIntelAPI
+            engine.api = ThreatIntelAPI(args.host, args.port)
+            engine.api.metrics = engine.metrics
+            engine.api.archive = engine.archive
+            engine.api.start()
+            print(f"🌐 HTTP API listening on http://{args.host}:{engine.api.address[1]}/incidents\n")
+        
+        # SIGTERM / SIGINT finish the current cycle, then exit
+        stop_event = threading.Event()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, lambda *_: stop_event.set())
+        try:
+            engine.run_forever(args.interval, args.jitter, stop_event)
+        finally:
+            if engine.api is not None:
+                engine.api.stop()
+            if engine.parse_pool is not None:
+                engine.parse_pool.shutdown()
+        return
     
-    # Generate feeds
-    engine.generate_feeds(incidents)
+    # Fetch all intelligence and generate feeds
+    try:
+        incidents = engine.run_cycle()
+    finally:
+        if engine.parse_pool is not None:
+            engine.parse_pool.shutdown()
     
     # Print summary
     engine.print_summary(incidents)
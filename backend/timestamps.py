@@ -0,0 +1,141 @@
+"""
+CYBERDUDEBIVASH® THREAT-INTEL - Timestamp normalisation
+© 2026 CyberDudeBivash Pvt Ltd
+
+Each incident's publication date is parsed exactly once into integer epoch
+seconds (UTC). Filtering, scoring and sorting then compare integers instead
+of re-parsing ISO strings.
+
+Feeds are consistent about their date format, so the parser remembers which
+format last succeeded for each source and tries that one first. RFC 822
+(RSS pubDate) and ISO 8601 (Atom) have hand-written fast paths; the
+strptime formats are the fallback.
+"""
+
+import calendar
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+MONTHS = {m: i for i, m in enumerate(
+    ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)}
+
+# RFC 822 zone names (seconds east of UTC)
+ZONES = {
+    'gmt': 0, 'ut': 0, 'utc': 0, 'z': 0,
+    'est': -5 * 3600, 'edt': -4 * 3600, 'cst': -6 * 3600, 'cdt': -5 * 3600,
+    'mst': -7 * 3600, 'mdt': -6 * 3600, 'pst': -8 * 3600, 'pdt': -7 * 3600
+}
+
+STRPTIME_FORMATS = [
+    '%a, %d %b %Y %H:%M:%S %Z',
+    '%a, %d %b %Y %H:%M:%S %z',
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%dT%H:%M:%S%z',
+    '%Y-%m-%d %H:%M:%S'
+]
+
+
+def _zone_offset(zone: str) -> int:
+    """Seconds east of UTC for '+0530' / '-07:00' / 'GMT'"""
+    if zone[0] in '+-':
+        digits = zone[1:].replace(':', '')
+        offset = int(digits[:2]) * 3600 + int(digits[2:4] or 0) * 60
+        return -offset if zone[0] == '-' else offset
+    return ZONES[zone.lower()]
+
+
+def parse_rfc822(text: str) -> int:
+    """'Sat, 18 Oct 2026 11:24:16 GMT' -> epoch seconds"""
+    parts = text.split()
+    if parts[0][-1] == ',' or parts[0].isalpha():
+        parts = parts[1:]
+    day, month, year, clock = parts[0], parts[1], parts[2], parts[3]
+    zone = parts[4] if len(parts) > 4 else 'GMT'
+
+    hms = clock.split(':')
+    year = int(year)
+    if year < 100:
+        year += 2000 if year < 50 else 1900
+    epoch = calendar.timegm((year, MONTHS[month[:3].lower()], int(day),
+                             int(hms[0]), int(hms[1]), int(hms[2]) if len(hms) > 2 else 0))
+    return epoch - _zone_offset(zone)
+
+
+def parse_iso8601(text: str) -> int:
+    """'2026-10-18T11:24:16Z' / '...+05:30' / naive (UTC) -> epoch seconds"""
+    if text.endswith(('Z', 'z')):
+        text = text[:-1] + '+00:00'
+    dt = datetime.fromisoformat(text)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _strptime_parser(fmt: str) -> Callable[[str], int]:
+    def parse(text: str) -> int:
+        dt = datetime.strptime(text, fmt)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return int(dt.timestamp())
+    return parse
+
+
+PARSERS: List[Tuple[str, Callable[[str], int]]] = (
+    [('iso8601', parse_iso8601), ('rfc822', parse_rfc822)]
+    + [(fmt, _strptime_parser(fmt)) for fmt in STRPTIME_FORMATS]
+)
+
+
+def epoch_to_iso(epoch: int) -> str:
+    """Epoch seconds -> '2026-10-18T11:24:16Z'"""
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(epoch))
+
+
+def now_epoch() -> int:
+    return int(time.time())
+
+
+class TimestampParser:
+    """Parses dates to epoch seconds, learning each source's format"""
+
+    def __init__(self):
+        self._learned: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, text: Optional[str], source: Optional[str] = None) -> Optional[int]:
+        """Epoch seconds, or None if no known format matches"""
+        if not text:
+            return None
+        text = text.strip()
+
+        learned = self._learned.get(source) if source is not None else None
+        if learned is not None:
+            try:
+                epoch = PARSERS[learned][1](text)
+                self.hits += 1
+                return epoch
+            except (ValueError, KeyError, IndexError):
+                pass
+
+        for index, (_, parser) in enumerate(PARSERS):
+            if index == learned:
+                continue
+            try:
+                epoch = parser(text)
+            except (ValueError, KeyError, IndexError):
+                continue
+            if source is not None:
+                with self._lock:
+                    self._learned[source] = index
+            self.misses += 1
+            return epoch
+
+        return None
+
+    def learned_formats(self) -> Dict[str, str]:
+        """Source -> name of the format it was last parsed with"""
+        return {source: PARSERS[index][0] for source, index in self._learned.items()}
@@ -4,22 +4,180 @@
 class ThreatIntelDashboard {
     constructor() {
         this.feedUrl = '../../backend/data/threat-feed.json';
+        this.deltaUrl = '../../backend/data/threat-feed-delta.json';
+        this.shardBase = '../../backend/data/threat-feed/';
+        this.fragmentBase = '../../backend/data/fragments/';
         this.incidents = [];
-        this.currentFilter = 'all';
+        this.version = null;
+        this.metadata = null;
+        this.shardIndex = null;
+        this.shard = null;  // filter whose shard is loaded; null when the full feed is
+        // Pre-rendered card pages (backend/fragments.py) shown for a filter, and how many
+        this.fragmentIndex = null;
+        this.fragment = null;
+        this.fragmentPages = 0;
+        this.currentFilter = decodeURIComponent(location.hash.slice(1)) || 'all';
+        // Ranked search through the HTTP API when <body data-api="..."> names one
+        this.apiBase = document.body.dataset.api || null;
+        this.query = '';
+        this.searchResults = null;
         this.init();
     }
 
     async init() {
-        await this.loadFeed();
+        await this.loadFragmentIndex();
+        await this.loadView();
         this.setupFilters();
+        this.setupSearch();
+        this.setupLoadMore();
         this.startAutoRefresh();
     }
 
+    async loadIndex() {
+        try {
+            const response = await fetch(this.shardBase + 'index.json', { cache: 'no-cache' });
+            this.shardIndex = response.ok ? await response.json() : null;
+        } catch (error) {
+            this.shardIndex = null;
+        }
+    }
+
+    async loadFragmentIndex() {
+        try {
+            const response = await fetch(this.fragmentBase + 'index.json', { cache: 'no-cache' });
+            this.fragmentIndex = response.ok ? await response.json() : null;
+        } catch (error) {
+            this.fragmentIndex = null;
+        }
+    }
+
+    // Ready-made HTML when the engine rendered it; JSON when searching in the browser
+    async loadView() {
+        if (this.fragmentIndex && !this.query) return this.loadFragments(this.currentFilter);
+        return this.loadJson();
+    }
+
+    // The full feed for "All"; otherwise only the shard behind the active filter
+    async loadJson() {
+        if (this.currentFilter !== 'all' && !this.shardIndex) await this.loadIndex();
+        if (this.currentFilter === 'all' || !this.shardIndex) return this.loadFeed();
+
+        const entry = this.shardIndex.severities[this.currentFilter] || this.shardIndex.categories[this.currentFilter];
+        if (!entry) {
+            this.incidents = [];
+            this.shard = this.currentFilter;
+            this.updateStats(this.metadata);
+            this.renderIncidents();
+            return;
+        }
+        return this.loadShard(this.currentFilter, entry.path);
+    }
+
+    fragmentEntry(filter) {
+        const index = this.fragmentIndex;
+        if (filter === 'all') return index.all;
+        return index.severities[filter] || index.categories[filter] || { pages: [], count: 0 };
+    }
+
+    async fetchFragment(path) {
+        const response = await fetch(this.fragmentBase + path);
+        if (!response.ok) throw new Error(`${path}: HTTP ${response.status}`);
+        return response.text();
+    }
+
+    // The first `pages` pages of a filter's cards, inserted as rendered
+    async loadFragments(filter, pages = 1) {
+        const entry = this.fragmentEntry(filter);
+        try {
+            const html = await Promise.all(entry.pages.slice(0, Math.max(1, pages)).map(path => this.fetchFragment(path)));
+            this.incidents = [];
+            this.version = null;
+            this.shard = null;
+            this.fragment = filter;
+            this.fragmentPages = html.length;
+            this.metadata = { generated: this.fragmentIndex.generated };
+            this.updateStats(this.metadata);
+
+            const grid = document.getElementById('threats-grid');
+            if (entry.count === 0) {
+                grid.innerHTML = `
+                    <div class="loading">
+                        <p>No incidents found for this filter.</p>
+                    </div>
+                `;
+            } else {
+                grid.innerHTML = html.join('');
+                this.refreshTimes(grid);
+            }
+            this.updateLoadMore();
+        } catch (error) {
+            console.error('Error loading feed fragments:', error);
+            return this.loadJson();
+        }
+    }
+
+    setupLoadMore() {
+        const button = document.getElementById('load-more');
+        if (button) button.addEventListener('click', () => this.loadMore());
+    }
+
+    async loadMore() {
+        const entry = this.fragmentEntry(this.fragment);
+        // Past the last pre-rendered page, the rest comes from the JSON shard
+        if (this.fragmentPages >= entry.pages.length) return this.loadJson();
+        try {
+            const html = await this.fetchFragment(entry.pages[this.fragmentPages]);
+            const grid = document.getElementById('threats-grid');
+            grid.insertAdjacentHTML('beforeend', html);
+            this.fragmentPages++;
+            this.refreshTimes(grid);
+            this.updateLoadMore();
+        } catch (error) {
+            console.error('Error loading feed fragment:', error);
+            return this.loadJson();
+        }
+    }
+
+    updateLoadMore() {
+        const button = document.getElementById('load-more');
+        if (!button) return;
+        const entry = this.fragment !== null ? this.fragmentEntry(this.fragment) : null;
+        button.hidden = !entry || this.fragmentPages * this.fragmentIndex.page_size >= entry.count;
+    }
+
+    // Fragments carry the time they were rendered for; re-derive it from data-epoch
+    refreshTimes(root) {
+        const now = Date.now() / 1000;
+        root.querySelectorAll('[data-epoch]').forEach(el => {
+            el.textContent = `🕐 ${this.formatTime(Math.max(0, Math.floor((now - el.dataset.epoch) / 3600)))}`;
+        });
+    }
+
+    async loadShard(filter, path) {
+        try {
+            const response = await fetch(this.shardBase + path);
+            const data = await response.json();
+            this.incidents = data.incidents || [];
+            this.metadata = data.metadata;
+            this.shard = filter;
+            this.fragment = null;
+            this.updateStats(data.metadata);
+            this.renderIncidents();
+        } catch (error) {
+            console.error('Error loading feed shard:', error);
+            return this.loadFeed();
+        }
+    }
+
     async loadFeed() {
         try {
             const response = await fetch(this.feedUrl);
             const data = await response.json();
             this.incidents = data.incidents || [];
+            this.metadata = data.metadata;
+            this.shard = null;
+            this.fragment = null;
+            this.version = data.metadata && data.metadata.feed_version !== undefined ? data.metadata.feed_version : null;
             this.updateStats(data.metadata);
             this.renderIncidents();
         } catch (error) {
@@ -28,6 +186,75 @@ class ThreatIntelDashboard {
         }
     }
 
+    async refresh() {
+        // Fragments: re-fetch the pages on screen when the index moved to a new version
+        if (this.fragment !== null) {
+            const loaded = this.fragmentIndex.feed_version;
+            await this.loadFragmentIndex();
+            if (!this.fragmentIndex) return this.loadJson();
+            if (this.fragmentIndex.feed_version === loaded) {
+                this.refreshTimes(document.getElementById('threats-grid'));
+                return this.updateStats({ generated: this.fragmentIndex.generated });
+            }
+            return this.loadFragments(this.fragment, this.fragmentPages);
+        }
+
+        // A shard is small: re-fetch it when the manifest moved to a new version
+        if (this.shard !== null) {
+            const loaded = this.shardIndex && this.shardIndex.feed_version;
+            await this.loadIndex();
+            if (this.shardIndex && this.shardIndex.feed_version === loaded) return this.updateStats(this.metadata);
+            return this.loadView();
+        }
+
+        // Without a known version there is nothing to apply a delta to
+        if (this.version === null) return this.loadFeed();
+
+        try {
+            const response = await fetch(this.deltaUrl, { cache: 'no-cache' });
+            const delta = await response.json();
+            this.metadata = { ...this.metadata, generated: delta.generated };
+
+            if (delta.version === this.version) {
+                this.updateStats(this.metadata);
+                return;
+            }
+            if (this.version < delta.oldest_version || this.version > delta.version) {
+                return this.loadFeed();
+            }
+
+            this.applyDelta(delta);
+            this.updateStats(this.metadata);
+            this.renderIncidents();
+        } catch (error) {
+            console.error('Error loading delta feed:', error);
+            return this.loadFeed();
+        }
+    }
+
+    applyDelta(delta) {
+        const byId = new Map(this.incidents.map(inc => [inc.id, inc]));
+
+        delta.generations
+            .filter(gen => gen.version > this.version)
+            .forEach(gen => {
+                [...gen.added, ...gen.updated].forEach(id => {
+                    if (delta.incidents[id]) byId.set(id, delta.incidents[id]);
+                });
+                gen.expired.forEach(id => byId.delete(id));
+            });
+
+        // Same ordering as the engine: severity score, then newest first
+        const now = Date.now();
+        this.incidents = [...byId.values()];
+        this.incidents.forEach(inc => {
+            inc.hours_ago = Math.max(0, Math.floor((now - Date.parse(inc.timestamp)) / 3600000));
+        });
+        this.incidents.sort((a, b) => (b.score - a.score) || (Date.parse(b.timestamp) - Date.parse(a.timestamp)));
+
+        this.version = delta.version;
+    }
+
     updateStats(metadata) {
         const stats = {
             critical: 0,
@@ -36,15 +263,27 @@ class ThreatIntelDashboard {
             low: 0
         };
 
-        this.incidents.forEach(incident => {
-            const sev = incident.severity.toLowerCase();
-            if (stats[sev] !== undefined) stats[sev]++;
-        });
+        let total = this.incidents.length;
+
+        // Only one shard (or no JSON at all) is loaded; the manifest has the whole-feed counts
+        const index = this.fragment !== null ? this.fragmentIndex : this.shard !== null ? this.shardIndex : null;
+        if (index) {
+            Object.entries(index.severities).forEach(([sev, entry]) => {
+                const key = sev.toLowerCase();
+                if (stats[key] !== undefined) stats[key] = entry.count;
+            });
+            total = index.total_incidents;
+        } else {
+            this.incidents.forEach(incident => {
+                const sev = incident.severity.toLowerCase();
+                if (stats[sev] !== undefined) stats[sev]++;
+            });
+        }
 
         document.getElementById('stat-critical').textContent = stats.critical;
         document.getElementById('stat-high').textContent = stats.high;
         document.getElementById('stat-medium').textContent = stats.medium;
-        document.getElementById('stat-total').textContent = this.incidents.length;
+        document.getElementById('stat-total').textContent = total;
         
         if (metadata && metadata.generated) {
             const date = new Date(metadata.generated);
@@ -55,13 +294,19 @@ class ThreatIntelDashboard {
 
     renderIncidents() {
         const grid = document.getElementById('threats-grid');
+        const button = document.getElementById('load-more');
+        if (button) button.hidden = true;
         
-        let filtered = this.incidents;
+        let filtered = this.searchResults || this.incidents;
         if (this.currentFilter !== 'all') {
-            filtered = this.incidents.filter(inc => 
+            filtered = filtered.filter(inc => 
                 inc.severity === this.currentFilter || inc.category === this.currentFilter
             );
         }
+        if (this.query && !this.searchResults) {
+            const terms = this.query.toLowerCase().match(/[a-z0-9]+/g) || [];
+            filtered = filtered.filter(inc => this.matchesTerms(inc, terms));
+        }
 
         if (filtered.length === 0) {
             grid.innerHTML = `
@@ -92,15 +337,56 @@ class ThreatIntelDashboard {
     setupFilters() {
         const buttons = document.querySelectorAll('.filter-btn');
         buttons.forEach(btn => {
-            btn.addEventListener('click', () => {
+            btn.classList.toggle('active', btn.dataset.filter === this.currentFilter);
+            btn.addEventListener('click', async () => {
                 buttons.forEach(b => b.classList.remove('active'));
                 btn.classList.add('active');
                 this.currentFilter = btn.dataset.filter;
-                this.renderIncidents();
+                history.replaceState(null, '', this.currentFilter === 'all'
+                    ? location.pathname + location.search
+                    : '#' + encodeURIComponent(this.currentFilter));
+
+                // With the full feed loaded every filter is applied in memory
+                if (this.shard === null && this.version !== null) return this.renderIncidents();
+                this.loadView();
             });
         });
     }
 
+    setupSearch() {
+        const box = document.getElementById('search');
+        if (!box) return;
+        let timer = null;
+        box.addEventListener('input', () => {
+            clearTimeout(timer);
+            timer = setTimeout(() => this.search(box.value.trim()), 250);
+        });
+    }
+
+    async search(query) {
+        this.query = query;
+        this.searchResults = null;
+        if (query && this.apiBase) {
+            try {
+                const response = await fetch(`${this.apiBase}/search?${new URLSearchParams({ q: query, limit: 100 })}`);
+                if (response.ok) this.searchResults = (await response.json()).incidents;
+            } catch (error) {
+                console.error('Error searching:', error);
+            }
+        }
+        // Searching in the browser needs the whole window, not one shard or rendered page
+        if (query && !this.searchResults && (this.shard !== null || this.fragment !== null)) return this.loadFeed();
+        if (!query && this.fragment !== null) return this.loadFragments(this.fragment, this.fragmentPages);
+        this.renderIncidents();
+    }
+
+    // Every query term prefixes a word of the title, description or sources
+    matchesTerms(incident, terms) {
+        const text = `${incident.title} ${incident.description || ''} ${(incident.sources || [incident.source]).join(' ')}`;
+        const words = text.toLowerCase().match(/[a-z0-9]+/g) || [];
+        return terms.every(term => words.some(word => word.startsWith(term)));
+    }
+
     formatTime(hours) {
         if (hours < 1) return 'Just now';
         if (hours === 1) return '1 hour ago';
@@ -125,7 +411,10 @@ class ThreatIntelDashboard {
 
     startAutoRefresh() {
         // Refresh every 5 minutes
-        setInterval(() => this.loadFeed(), 5 * 60 * 1000);
+        setInterval(async () => {
+            await this.refresh();
+            if (this.searchResults) this.search(this.query);
+        }, 5 * 60 * 1000);
     }
 }
 
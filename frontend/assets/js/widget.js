@@ -3,12 +3,17 @@
 
 (function() {
     const WIDGET_FEED_URL = '../../backend/data/threat-feed-widget.json';
+    // Pre-rendered sidebar pages (backend/fragments.py); the JSON feed is the fallback
+    const FRAGMENT_BASE = '../../backend/data/fragments/';
     const DASHBOARD_URL = '../dashboard/index.html';
 
     class ThreatWidget {
         constructor(containerId) {
             this.container = document.getElementById(containerId);
             if (!this.container) return;
+            this.pages = [];
+            this.shown = 0;
+            this.container.addEventListener('click', event => this.onClick(event));
             this.init();
         }
 
@@ -19,9 +24,24 @@
         }
 
         async loadAndRender() {
+            try {
+                // Index and first page in parallel: one round trip to first paint
+                const [index, html] = await Promise.all([
+                    fetch(FRAGMENT_BASE + 'index.json', { cache: 'no-cache' }).then(r => r.ok ? r.json() : null),
+                    this.fetchPage('widget-1.html')
+                ]);
+                if (!index || html === null) throw new Error('no widget fragments');
+                this.pages = index.widget.pages;
+                this.shown = 1;
+                this.renderShell(html);
+                return;
+            } catch (error) {
+                // Fall back to templating the JSON widget feed
+            }
             try {
                 const response = await fetch(WIDGET_FEED_URL);
                 const data = await response.json();
+                this.pages = [];
                 this.render(data.incidents || []);
             } catch (error) {
                 console.error('Widget load error:', error);
@@ -29,7 +49,52 @@
             }
         }
 
+        async fetchPage(path) {
+            const response = await fetch(FRAGMENT_BASE + path);
+            return response.ok ? response.text() : null;
+        }
+
+        async loadMore() {
+            if (this.shown >= this.pages.length) return;
+            const html = await this.fetchPage(this.pages[this.shown]).catch(() => null);
+            if (html === null) return;
+            this.shown++;
+            const list = this.container.querySelector('.cdb-widget-threats');
+            list.insertAdjacentHTML('beforeend', html);
+            this.refreshTimes(list);
+            this.container.querySelector('.cdb-more-btn').hidden = this.shown >= this.pages.length;
+        }
+
+        onClick(event) {
+            if (event.target.closest('.cdb-more-btn')) return this.loadMore();
+            const item = event.target.closest('.cdb-threat-item');
+            if (item && item.dataset.url) window.open(item.dataset.url, '_blank');
+        }
+
+        // Fragments carry the time they were rendered for; re-derive it from data-epoch
+        refreshTimes(root) {
+            const now = Date.now() / 1000;
+            root.querySelectorAll('[data-epoch]').forEach(el => {
+                el.textContent = `🕐 ${this.formatTime(Math.max(0, Math.floor((now - el.dataset.epoch) / 3600)))}`;
+            });
+        }
+
         render(incidents) {
+            this.renderShell(incidents.map(inc => `
+                <div class="cdb-threat-item" data-url="${this.escapeHtml(inc.url)}">
+                    <div class="cdb-threat-header-row">
+                        <span>
+                            <span class="cdb-severity-dot ${inc.severity.toLowerCase()}"></span>
+                        </span>
+                        <span class="cdb-category-mini">${inc.category}</span>
+                    </div>
+                    <div class="cdb-threat-title-mini">${this.escapeHtml(inc.title)}</div>
+                    <div class="cdb-threat-time-mini">🕐 ${this.formatTime(inc.hours_ago)}</div>
+                </div>
+            `).join(''));
+        }
+
+        renderShell(items) {
             const html = `
                 <div class="cdb-widget-header">
                     <div class="cdb-widget-brand">CYBERDUDEBIVASH®</div>
@@ -39,20 +104,8 @@
                         <span class="cdb-live-text">LIVE</span>
                     </div>
                 </div>
-                <div class="cdb-widget-threats">
-                    ${incidents.map(inc => `
-                        <div class="cdb-threat-item" onclick="window.open('${inc.url}', '_blank')">
-                            <div class="cdb-threat-header-row">
-                                <span>
-                                    <span class="cdb-severity-dot ${inc.severity.toLowerCase()}"></span>
-                                </span>
-                                <span class="cdb-category-mini">${inc.category}</span>
-                            </div>
-                            <div class="cdb-threat-title-mini">${this.escapeHtml(inc.title)}</div>
-                            <div class="cdb-threat-time-mini">🕐 ${this.formatTime(inc.hours_ago)}</div>
-                        </div>
-                    `).join('')}
-                </div>
+                <div class="cdb-widget-threats">${items}</div>
+                <button type="button" class="cdb-more-btn" ${this.shown < this.pages.length ? '' : 'hidden'}>MORE THREATS</button>
                 <div class="cdb-widget-footer">
                     <a href="${DASHBOARD_URL}" class="cdb-view-all-btn" target="_blank">
                         VIEW FULL DASHBOARD →
@@ -61,6 +114,7 @@
                 </div>
             `;
             this.container.innerHTML = html;
+            this.refreshTimes(this.container);
         }
 
         renderError() {